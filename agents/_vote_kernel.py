@@ -0,0 +1,61 @@
+"""
+War Room 가중 투표 집계 커널
+
+action 문자열을 정수 코드 (BUY=0, SELL=1, HOLD=2)로 한 번 변환한 뒤
+weight × confidence 합산을 숫자 배열 루프로 처리한다.
+numba가 있으면 njit(cache=True)로 컴파일하고, 없으면 같은 루프를 Python으로 실행한다.
+
+Usage:
+    codes = [ACTION_CODES[vote["action"]] for vote in votes]
+    buy, sell, hold = tally(weights, confidences, codes)
+"""
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; tally then works on plain lists
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the tally loop then runs as plain Python
+    njit = None
+
+
+# tally 결과 순서 = action 코드 (base_schema.SignalActionCode의 BUY/SELL/HOLD와 같은 값)
+ACTIONS = ("BUY", "SELL", "HOLD")
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+
+
+def _tally_loop(weights, confidences, actions, out):
+    """out[actions[i]] += weights[i] * confidences[i] (입력 순서대로 누적)"""
+    for i in range(len(weights)):
+        out[actions[i]] += weights[i] * confidences[i]
+    return out
+
+
+# numba 설치 시 컴파일된 집계 루프 (float64/int8 ndarray 입력)
+_tally_kernel = njit(cache=True)(_tally_loop) if njit is not None else None
+
+
+def tally(weights, confidences, actions):
+    """
+    가중 투표 집계
+
+    Args:
+        weights: 에이전트별 투표 가중치 (0~1)
+        confidences: 에이전트별 신뢰도 (0~1)
+        actions: 에이전트별 action 코드 (ACTION_CODES)
+
+    Returns:
+        [buy, sell, hold] 점수 (numpy 있으면 float64 ndarray, 없으면 list)
+    """
+    if np is None:
+        return _tally_loop(weights, confidences, actions, [0.0] * len(ACTIONS))
+
+    weights = np.asarray(weights, dtype=np.float64)
+    confidences = np.asarray(confidences, dtype=np.float64)
+    actions = np.asarray(actions, dtype=np.int8)
+    if _tally_kernel is None:
+        # numba 없음: bincount가 입력 순서대로 누적 (Python 루프와 같은 합산 순서)
+        return np.bincount(actions, weights=weights * confidences, minlength=len(ACTIONS))
+    return _tally_kernel(weights, confidences, actions, np.zeros(len(ACTIONS)))
@@ -23,9 +23,23 @@ import json
 from backend.database.models import NewsArticle, GroundingSearchLog
 from backend.database.repository import get_sync_session
 from backend.ai.gemini_client import call_gemini_api
+from backend.schemas.base_schema import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
+# 소송 관련 키워드
+_LITIGATION_MATCHER = KeywordMatcher([
+    'lawsuit', 'litigation', 'sued', 'settlement', 'class action',
+    '소송', '집단소송', '합의금', '법적 분쟁', '소송 패소'
+])
+
+# 규제 관련 키워드
+_REGULATORY_MATCHER = KeywordMatcher([
+    'sec', 'ftc', 'doj', 'antitrust', 'investigation', 'probe',
+    'fine', 'penalty', 'violation', 'compliance',
+    '규제', '조사', '제재', '위반', '벌금', '당국', '감사'
+])
+
 
 class NewsAgent:
     """뉴스 기반 투표 Agent (War Room 7th member)"""
@@ -284,19 +298,6 @@ class NewsAgent:
                 "keywords_found": List[str]
             }
         """
-        # 소송 관련 키워드
-        litigation_keywords = [
-            'lawsuit', 'litigation', 'sued', 'settlement', 'class action',
-            '소송', '집단소송', '합의금', '법적 분쟁', '소송 패소'
-        ]
-
-        # 규제 관련 키워드
-        regulatory_keywords = [
-            'sec', 'ftc', 'doj', 'antitrust', 'investigation', 'probe',
-            'fine', 'penalty', 'violation', 'compliance',
-            '규제', '조사', '제재', '위반', '벌금', '당국', '감사'
-        ]
-
         litigation_count = 0
         regulatory_count = 0
         keywords_found = []
@@ -308,21 +309,19 @@ class NewsAgent:
             else:
                 content = news.get('title', '').lower()
 
-            # 소송 키워드 검사
-            for keyword in litigation_keywords:
-                if keyword.lower() in content:
-                    litigation_count += 1
-                    if keyword not in keywords_found:
-                        keywords_found.append(keyword)
-                    break  # 한 뉴스당 한 번만 카운트
+            # 소송 키워드 검사 (목록 순서상 첫 매칭 키워드만, 한 뉴스당 한 번만 카운트)
+            matched = _LITIGATION_MATCHER.find(content)
+            if matched:
+                litigation_count += 1
+                if matched[0] not in keywords_found:
+                    keywords_found.append(matched[0])
 
             # 규제 키워드 검사
-            for keyword in regulatory_keywords:
-                if keyword.lower() in content:
-                    regulatory_count += 1
-                    if keyword not in keywords_found:
-                        keywords_found.append(keyword)
-                    break
+            matched = _REGULATORY_MATCHER.find(content)
+            if matched:
+                regulatory_count += 1
+                if matched[0] not in keywords_found:
+                    keywords_found.append(matched[0])
 
         # 심각도 판정
         total_issues = litigation_count + regulatory_count
@@ -10,11 +10,204 @@ Updated: 2025-12-27 - Added Sharpe Ratio, Kelly Criterion, CDS Premium analysis
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+import math
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, NamedTuple, Tuple
 import random
 
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only the batch CDS helper needs it
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Reasoning templates (formatted only for the branch that is taken)
+_REASON_CDS_CRITICAL = "{cds_reasoning} - 즉시 청산 권장"
+_REASON_LOW_SHARPE = "낮은 샤프 비율 ({sharpe:.2f} < 0.5) - 리스크 대비 수익 부족"
+_REASON_HIGH_VAR = "높은 VaR ({var_pct:.2f}%) - 헌법 제4조 위반 가능성, CVaR {cvar_pct:.2f}%"
+_REASON_HIGH_RISK = "고위험 상태 (변동성 {vol_pct:.0f}%, 최대낙폭 {mdd_pct:.1f}%) - 헌법 제4조 위반 가능성"
+_REASON_HIGH_BETA = "높은 변동성 ({vol_pct:.0f}%) + 고베타 ({beta:.2f}) - 관망 추천"
+_REASON_LOW_RISK = "낮은 리스크 (변동성 {vol_pct:.0f}%, 낙폭 {mdd_pct:.1f}%) - 안전한 진입 가능"
+_REASON_LOW_RISK_SHARPE = "낮은 리스크 (변동성 {vol_pct:.0f}%, 낙폭 {mdd_pct:.1f}%) + 우수한 샤프 비율 ({sharpe:.2f}) - 안전한 진입 가능"
+_REASON_LOW_CREDIT = " + 낮은 신용 리스크 (CDS {cds_bps}bps)"
+_REASON_MEDIUM_RISK = "{risk_level} 리스크 (변동성 {vol_pct:.0f}%, 베타 {beta:.2f}) - 포지션 크기 조절 필요"
+_REASON_GOOD_SHARPE = " | 샤프 비율 양호 ({sharpe:.2f})"
+_REASON_MODERATE_CREDIT = " | 보통 신용도 (CDS {cds_bps}bps)"
+
+# Annualization factor (252 trading days)
+_SQRT_252 = math.sqrt(252)
+
+# CDS spread bins (bps): < 100 LOW, < 200 MODERATE, < 500 HIGH, else CRITICAL
+_CDS_BINS = (100, 200, 500)
+_CDS_LEVELS = ("LOW", "MODERATE", "HIGH", "CRITICAL")
+_CDS_ACTION_IMPACTS = ("POSITIVE", "NEUTRAL", "NEGATIVE", "NEGATIVE")
+_CDS_CONFIDENCE_MODIFIERS = (0.1, 0.0, -0.15, -0.25)  # BUY 신뢰도 증가 … 강한 SELL 신호
+
+# risk_score = clip(intercept + slope * spread, lo, hi) per bin: 0-3 / 3-6 / 6-9 / 9-10점
+_CDS_SCORE_COEFFS = (
+    (0.0, 0.03, 0, 3),
+    (0.0, 0.03, 3, 6),
+    (4.0, 0.01, 6, 9),
+    (8.0, 0.002, 9, 10),
+)
+_CDS_REASONS = (
+    "낮은 신용 리스크 (CDS {spread:.0f}bps) - 투자 등급 기업",
+    "보통 신용 리스크 (CDS {spread:.0f}bps) - 안정적이나 주의 필요",
+    "높은 신용 리스크 (CDS {spread:.0f}bps) - 투기 등급, 부도 위험 상승",
+    "매우 높은 신용 리스크 (CDS {spread:.0f}bps) - 부도 임박 가능성",
+)
+
+# Max tickers with cached rolling stats per RiskAgent (least recently used evicted)
+_STATS_CACHE_MAX = 256
+
+# Mock scenarios, built once and shared read-only across calls
+_MOCK_SCENARIOS = tuple(
+    MappingProxyType({
+        "agent": "risk",
+        **scenario,
+        "risk_factors": MappingProxyType(scenario["risk_factors"])
+    })
+    for scenario in (
+        {
+            "action": "BUY",
+            "confidence": 0.87,
+            "reasoning": "낮은 변동성 (18%), 최대낙폭 -3.2%, 안전한 진입 가능",
+            "risk_factors": {
+                "volatility": "18%",
+                "max_drawdown": "-3.2%",
+                "risk_level": "LOW"
+            }
+        },
+        {
+            "action": "SELL",
+            "confidence": 0.85,
+            "reasoning": "고변동성 경고 (45%), 헌법 제4조 (-5% 한도) 임박, 손절 필요",
+            "risk_factors": {
+                "volatility": "45%",
+                "max_drawdown": "-8.5%",
+                "risk_level": "CRITICAL"
+            }
+        },
+        {
+            "action": "HOLD",
+            "confidence": 0.75,
+            "reasoning": "중간 변동성 (28%), 베타 1.5 - 포지션 크기 50% 축소 권장",
+            "risk_factors": {
+                "volatility": "28%",
+                "beta": 1.5,
+                "risk_level": "MEDIUM"
+            }
+        }
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
+class RiskInput:
+    """Pre-validated risk_data (defaults match the documented risk_data format)"""
+    volatility: float = 0.20
+    beta: float = 1.0
+    max_drawdown: float = 0.0
+    correlation_spy: float = 0.80
+    position_size: float = 0.05
+    returns: Optional[List[float]] = None
+    cds_spread: Optional[float] = None
+
+
+@dataclass
+class RollingStats:
+    """
+    Incremental return statistics for one ticker's rolling window.
+
+    Mean/variance are kept with Welford's update (add and remove), and the
+    window is kept sorted so VaR/CVaR can be read without re-sorting.
+    When the window slides by one day, push/pop cost O(log n) search plus
+    one list insert instead of a full recompute.
+    """
+    n: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    sorted_returns: List[float] = field(default_factory=list)
+
+    @classmethod
+    def from_returns(cls, returns: List[float]) -> "RollingStats":
+        """Seed from a full window: one sort shared by Sharpe and VaR/CVaR"""
+        n = len(returns)
+        if n == 0:
+            return cls()
+        mean = math.fsum(returns) / n
+        m2 = math.fsum((x - mean) * (x - mean) for x in returns)
+        return cls(n=n, mean=mean, m2=m2, sorted_returns=sorted(returns))
+
+    def push(self, x: float) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+        insort(self.sorted_returns, x)
+
+    def pop(self, x: float) -> None:
+        """Remove a value that is currently in the window (the oldest return)"""
+        if self.n <= 1:
+            self.n, self.mean, self.m2 = 0, 0.0, 0.0
+            self.sorted_returns.clear()
+            return
+        self.n -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.n
+        self.m2 -= delta * (x - self.mean)
+        del self.sorted_returns[bisect_left(self.sorted_returns, x)]
+
+    @property
+    def variance(self) -> float:
+        """Population variance (ddof=0, same as np.std)"""
+        return max(self.m2, 0.0) / self.n if self.n else 0.0
+
+    def sharpe_ratio(self, risk_free_rate: float = 0.04) -> float:
+        """Annualized Sharpe ratio (252 trading days)"""
+        annual_volatility = math.sqrt(self.variance) * _SQRT_252
+        if annual_volatility == 0:
+            return 0.0
+        return (self.mean * 252 - risk_free_rate) / annual_volatility
+
+    def value_at_risk(self, confidence_level: float = 0.95) -> Tuple[float, float]:
+        """Historical (VaR, CVaR) of the current window"""
+        return _historical_var(self.sorted_returns, confidence_level)
+
+
+class KellyResult(NamedTuple):
+    """Kelly Criterion position sizing result"""
+    kelly_fraction: float
+    half_kelly: float
+    recommended_pct: float
+    reasoning: str
+
+
+def _var_index(n: int, confidence_level: float) -> Tuple[int, int, float]:
+    """Order statistics (lo, hi) and weight t for the VaR percentile of n returns"""
+    # percentile → quantile 변환을 np.percentile과 동일하게 유지
+    pos = (1 - confidence_level) * 100 / 100 * (n - 1)
+    lo = int(pos)
+    return lo, min(lo + 1, n - 1), pos - lo
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    """Linear interpolation, same rounding as np.percentile's 'linear' method"""
+    return b - (b - a) * (1 - t) if t >= 0.5 else a + (b - a) * t
+
+
+def _historical_var(sorted_returns: List[float], confidence_level: float) -> Tuple[float, float]:
+    """Historical (VaR, CVaR) from sorted returns, linear interpolation like np.percentile"""
+    values = sorted_returns
+    lo, hi, t = _var_index(len(values), confidence_level)
+    var_1day = _lerp(values[lo], values[hi], t)
+    k = bisect_right(values, var_1day)
+    cvar = math.fsum(values[:k]) / k if k else var_1day
+    return var_1day, cvar
+
 
 class RiskAgent:
     """
@@ -30,6 +223,8 @@ class RiskAgent:
     def __init__(self):
         self.agent_name = "risk"
         self.vote_weight = 0.20  # 20% voting weight (highest authority)
+        # ticker -> (last returns window, its RollingStats), LRU order
+        self._stats_cache: Dict[str, Tuple[List[float], RollingStats]] = {}
     
     async def analyze(self, ticker: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -64,6 +259,8 @@ class RiskAgent:
         """
         Analyze using real risk metrics.
 
+        risk_data may also be a pre-built RiskInput (batch callers).
+
         Expected risk_data format:
         {
             "volatility": 0.25,  # 25% annualized
@@ -75,18 +272,24 @@ class RiskAgent:
             "cds_spread": 150  # Optional: CDS spread in bps
         }
         """
-        volatility = risk_data.get("volatility", 0.20)
-        beta = risk_data.get("beta", 1.0)
-        max_drawdown = risk_data.get("max_drawdown", 0)
-        correlation_spy = risk_data.get("correlation_spy", 0.80)
-        position_size = risk_data.get("position_size", 0.05)
-        returns = risk_data.get("returns", [])
-        cds_spread = risk_data.get("cds_spread", None)
+        ri = self._validate(risk_data)
+        if ri is None:
+            logger.warning(f"[Risk Agent] Invalid risk_data for {ticker} - fallback")
+            return self._fallback_response(ticker)
+
+        volatility = ri.volatility
+        beta = ri.beta
+        max_drawdown = ri.max_drawdown
+        correlation_spy = ri.correlation_spy
+        position_size = ri.position_size
+        returns = ri.returns
+        cds_spread = ri.cds_spread
 
         action = "HOLD"
         confidence = 0.5
         confidence_boost = 0.0
         risk_factors = {}
+        ctx = {"vol_pct": volatility * 100, "mdd_pct": max_drawdown * 100, "beta": beta}
 
         # CDS Premium Analysis (if available)
         cds_analysis = None
@@ -103,7 +306,8 @@ class RiskAgent:
                 # 부도 위험 매우 높음 - 강한 SELL
                 action = "SELL"
                 confidence = 0.90
-                reasoning = f"{cds_analysis['reasoning']} - 즉시 청산 권장"
+                ctx["cds_reasoning"] = cds_analysis["reasoning"]
+                reasoning = _REASON_CDS_CRITICAL.format_map(ctx)
             elif cds_analysis["credit_risk_level"] == "HIGH":
                 # 신용 리스크 높음 - SELL 또는 HOLD
                 if action != "SELL":
@@ -113,62 +317,67 @@ class RiskAgent:
             else:
                 # LOW 또는 MODERATE - confidence modifier 적용
                 confidence_boost += cds_analysis["confidence_modifier"]
+                ctx["cds_bps"] = cds_analysis["cds_spread_bps"]
+
+        # CDS가 CRITICAL/HIGH면 판단이 이미 확정됨 - Sharpe/VaR 계산 생략
+        credit_override = cds_analysis is not None and cds_analysis["credit_risk_level"] in ("CRITICAL", "HIGH")
+
+        stats = None
+        if returns is not None and len(returns) >= 20 and not credit_override:
+            stats = self._rolling_stats(ticker, returns)
 
         # Sharpe Ratio Analysis (if returns data available)
         sharpe_ratio = None
-        if returns and len(returns) >= 20:
-            sharpe_ratio = self._calculate_sharpe_ratio(returns)
+        if stats is not None:
+            sharpe_ratio = stats.sharpe_ratio()
             risk_factors["sharpe_ratio"] = f"{sharpe_ratio:.2f}"
+            ctx["sharpe"] = sharpe_ratio
 
-            # Sharpe Ratio에 따른 판단 (CDS CRITICAL이 아닌 경우만)
-            if cds_analysis is None or cds_analysis["credit_risk_level"] not in ["CRITICAL", "HIGH"]:
-                if sharpe_ratio < 0.5:
-                    # 샤프 비율 낮음 - 리스크 대비 수익 부족
-                    if action != "SELL":
-                        action = "SELL"
-                        confidence = 0.85
-                        reasoning = f"낮은 샤프 비율 ({sharpe_ratio:.2f} < 0.5) - 리스크 대비 수익 부족"
-                elif sharpe_ratio > 1.5:
-                    # 샤프 비율 우수 - 안정적 수익
-                    confidence_boost += 0.15
+            # Sharpe Ratio에 따른 판단
+            if sharpe_ratio < 0.5:
+                # 샤프 비율 낮음 - 리스크 대비 수익 부족
+                if action != "SELL":
+                    action = "SELL"
+                    confidence = 0.85
+                    reasoning = _REASON_LOW_SHARPE.format_map(ctx)
+            elif sharpe_ratio > 1.5:
+                # 샤프 비율 우수 - 안정적 수익
+                confidence_boost += 0.15
 
         # VaR Analysis (if returns data available)
-        var_analysis = None
-        if returns and len(returns) >= 30:
-            var_analysis = self._calculate_var(returns)
-            risk_factors["var_1day"] = f"{var_analysis['var_1day']*100:.2f}%"
-            risk_factors["cvar"] = f"{var_analysis['cvar']*100:.2f}%"
-
-            # VaR에 따른 위험도 판단 (CDS CRITICAL이 아닌 경우만)
-            if cds_analysis is None or cds_analysis["credit_risk_level"] not in ["CRITICAL", "HIGH"]:
-                var_1day = var_analysis['var_1day']
-                cvar = var_analysis['cvar']
-
-                # VaR가 -5% 이하 (헌법 제4조 위반 가능성)
-                if var_1day < -0.05:
-                    if action != "SELL":
-                        action = "SELL"
-                        confidence = 0.88
-                        reasoning = f"높은 VaR ({var_1day*100:.2f}%) - 헌법 제4조 위반 가능성, CVaR {cvar*100:.2f}%"
-                # CVaR가 -10% 이하 (극단적 손실 위험)
-                elif cvar < -0.10:
-                    confidence_boost -= 0.1
-                # VaR가 -2% 이상 (낮은 리스크)
-                elif var_1day > -0.02:
-                    confidence_boost += 0.05
+        if stats is not None and stats.n >= 30:
+            var_1day, cvar = stats.value_at_risk()
+            risk_factors["var_1day"] = f"{var_1day*100:.2f}%"
+            risk_factors["cvar"] = f"{cvar*100:.2f}%"
+
+            # VaR에 따른 위험도 판단
+            # VaR가 -5% 이하 (헌법 제4조 위반 가능성)
+            if var_1day < -0.05:
+                if action != "SELL":
+                    action = "SELL"
+                    confidence = 0.88
+                    ctx["var_pct"] = var_1day * 100
+                    ctx["cvar_pct"] = cvar * 100
+                    reasoning = _REASON_HIGH_VAR.format_map(ctx)
+            # CVaR가 -10% 이하 (극단적 손실 위험)
+            elif cvar < -0.10:
+                confidence_boost -= 0.1
+            # VaR가 -2% 이상 (낮은 리스크)
+            elif var_1day > -0.02:
+                confidence_boost += 0.05
 
         # Risk-based decision logic (CDS가 CRITICAL/HIGH가 아닌 경우만)
-        if cds_analysis is None or cds_analysis["credit_risk_level"] not in ["CRITICAL", "HIGH"]:
+        if not credit_override:
             # HIGH RISK - Recommend SELL or HOLD
             if volatility > 0.40 or max_drawdown < -0.10:
                 action = "SELL"
                 confidence = 0.85
-                reasoning = f"고위험 상태 (변동성 {volatility*100:.0f}%, 최대낙폭 {max_drawdown*100:.1f}%) - 헌법 제4조 위반 가능성"
+                reasoning = _REASON_HIGH_RISK.format_map(ctx)
 
             elif volatility > 0.30 and beta > 1.5:
                 action = "HOLD"
                 confidence = 0.75
-                reasoning = f"높은 변동성 ({volatility*100:.0f}%) + 고베타 ({beta:.2f}) - 관망 추천"
+                reasoning = _REASON_HIGH_BETA.format_map(ctx)
 
             # LOW RISK - Approve BUY
             elif volatility < 0.20 and max_drawdown > -0.05:
@@ -178,29 +387,29 @@ class RiskAgent:
                 # Sharpe Ratio가 우수하면 신뢰도 증가
                 if sharpe_ratio and sharpe_ratio > 1.5:
                     confidence = min(0.95, base_confidence + 0.1)
-                    reasoning = f"낮은 리스크 (변동성 {volatility*100:.0f}%, 낙폭 {max_drawdown*100:.1f}%) + 우수한 샤프 비율 ({sharpe_ratio:.2f}) - 안전한 진입 가능"
+                    reasoning = _REASON_LOW_RISK_SHARPE.format_map(ctx)
                 else:
                     confidence = base_confidence
-                    reasoning = f"낮은 리스크 (변동성 {volatility*100:.0f}%, 낙폭 {max_drawdown*100:.1f}%) - 안전한 진입 가능"
+                    reasoning = _REASON_LOW_RISK.format_map(ctx)
 
                 # CDS Premium이 LOW면 추가 신뢰도 증가
                 if cds_analysis and cds_analysis["credit_risk_level"] == "LOW":
-                    reasoning += f" + 낮은 신용 리스크 (CDS {cds_analysis['cds_spread_bps']}bps)"
+                    reasoning += _REASON_LOW_CREDIT.format_map(ctx)
 
             # MEDIUM RISK
             else:
-                risk_level = "중간" if volatility < 0.30 else "높음"
-                reasoning = f"{risk_level} 리스크 (변동성 {volatility*100:.0f}%, 베타 {beta:.2f}) - 포지션 크기 조절 필요"
+                ctx["risk_level"] = "중간" if volatility < 0.30 else "높음"
+                reasoning = _REASON_MEDIUM_RISK.format_map(ctx)
                 confidence = 0.65
 
                 # Sharpe Ratio 추가 정보
                 if sharpe_ratio and sharpe_ratio > 1.0:
-                    reasoning += f" | 샤프 비율 양호 ({sharpe_ratio:.2f})"
+                    reasoning += _REASON_GOOD_SHARPE.format_map(ctx)
                     confidence_boost += 0.1
 
                 # CDS Premium 추가 정보
                 if cds_analysis and cds_analysis["credit_risk_level"] == "MODERATE":
-                    reasoning += f" | 보통 신용도 (CDS {cds_analysis['cds_spread_bps']}bps)"
+                    reasoning += _REASON_MODERATE_CREDIT.format_map(ctx)
 
         # Final confidence adjustment
         confidence = min(0.95, confidence + confidence_boost)
@@ -224,44 +433,81 @@ class RiskAgent:
     
     async def _analyze_mock(self, ticker: str) -> Dict:
         """Mock risk analysis"""
-        scenarios = [
-            {
-                "action": "BUY",
-                "confidence": 0.87,
-                "reasoning": "낮은 변동성 (18%), 최대낙폭 -3.2%, 안전한 진입 가능",
-                "risk_factors": {
-                    "volatility": "18%",
-                    "max_drawdown": "-3.2%",
-                    "risk_level": "LOW"
-                }
-            },
-            {
-                "action": "SELL",
-                "confidence": 0.85,
-                "reasoning": "고변동성 경고 (45%), 헌법 제4조 (-5% 한도) 임박, 손절 필요",
-                "risk_factors": {
-                    "volatility": "45%",
-                    "max_drawdown": "-8.5%",
-                    "risk_level": "CRITICAL"
-                }
-            },
-            {
-                "action": "HOLD",
-                "confidence": 0.75,
-                "reasoning": "중간 변동성 (28%), 베타 1.5 - 포지션 크기 50% 축소 권장",
-                "risk_factors": {
-                    "volatility": "28%",
-                    "beta": 1.5,
-                    "risk_level": "MEDIUM"
-                }
-            }
-        ]
-        
-        return {
-            "agent": "risk",
-            **random.choice(scenarios)
-        }
+        scenario = random.choice(_MOCK_SCENARIOS)
+        return {**scenario, "risk_factors": dict(scenario["risk_factors"])}
     
+    @staticmethod
+    def _coerce(risk_data: Dict) -> RiskInput:
+        """Apply risk_data defaults once and return a RiskInput"""
+        return RiskInput(
+            volatility=risk_data.get("volatility", 0.20),
+            beta=risk_data.get("beta", 1.0),
+            max_drawdown=risk_data.get("max_drawdown", 0),
+            correlation_spy=risk_data.get("correlation_spy", 0.80),
+            position_size=risk_data.get("position_size", 0.05),
+            returns=risk_data.get("returns"),
+            cds_spread=risk_data.get("cds_spread")
+        )
+
+    def _validate(self, risk_data: Dict) -> Optional[RiskInput]:
+        """
+        Coerce risk_data into a RiskInput and check it once up front, so the
+        numeric helpers can run without their own try/except.
+
+        Returns None for unusable data (non-numeric or non-finite values,
+        negative CDS spread). Very wide spreads are valid and score CRITICAL.
+        """
+        ri = risk_data if isinstance(risk_data, RiskInput) else self._coerce(risk_data)
+        try:
+            scalars = (ri.volatility, ri.beta, ri.max_drawdown, ri.correlation_spy, ri.position_size)
+            if not all(map(math.isfinite, scalars)):
+                return None
+            if ri.cds_spread is not None and not (math.isfinite(ri.cds_spread) and ri.cds_spread >= 0):
+                return None
+            if ri.returns is not None and not all(map(math.isfinite, ri.returns)):
+                return None
+        except TypeError:
+            return None
+        return ri
+
+    def _rolling_stats(self, ticker: str, returns: List[float]) -> RollingStats:
+        """
+        Return statistics for ticker's returns, updating the cached window
+        incrementally when it grew or slid by exactly one day.
+
+        The whole overlapping window is compared with the cached one before
+        its state is reused (O(n) compare instead of an O(n log n) re-sort),
+        so any revision of earlier returns recomputes from scratch.
+        """
+        window = list(returns)
+        n = len(window)
+        cached = self._stats_cache.pop(ticker, None)
+        stats = None
+
+        if cached is not None:
+            prev_window, prev_stats = cached
+            m = len(prev_window)
+            if n == m and window == prev_window:
+                stats = prev_stats
+            elif n == m + 1 and window[:-1] == prev_window:
+                # 하루치 추가
+                prev_stats.push(window[-1])
+                stats = prev_stats
+            elif n == m and window[:-1] == prev_window[1:]:
+                # 하루 슬라이드 (가장 오래된 수익률 제거)
+                prev_stats.pop(prev_window[0])
+                prev_stats.push(window[-1])
+                stats = prev_stats
+
+        if stats is None:
+            stats = RollingStats.from_returns(window)
+
+        # LRU: 방금 쓴 티커를 맨 뒤로, 가득 차면 가장 오래 안 쓴 티커 제거
+        if len(self._stats_cache) >= _STATS_CACHE_MAX:
+            del self._stats_cache[next(iter(self._stats_cache))]
+        self._stats_cache[ticker] = (window, stats)
+        return stats
+
     def _fallback_response(self, ticker: str) -> Dict:
         """Conservative fallback on error"""
         return {
@@ -275,52 +521,8 @@ class RiskAgent:
             }
         }
 
-    def _calculate_sharpe_ratio(self, returns: List[float], risk_free_rate: float = 0.04) -> float:
-        """
-        샤프 비율 계산
-
-        공식: (평균 수익률 - 무위험 수익률) / 수익률 표준편차
-
-        Args:
-            returns: 일별 수익률 리스트 (예: [0.01, -0.02, 0.015, ...])
-            risk_free_rate: 연간 무위험 수익률 (기본값: 4% = 0.04)
-
-        Returns:
-            Sharpe Ratio
-            - < 0: 무위험 수익률보다 낮음 (나쁨)
-            - 0-1: 양호
-            - 1-2: 우수
-            - > 2: 매우 우수
-
-        해석:
-        - 1.0 이상이면 리스크 대비 수익이 양호
-        - 2.0 이상이면 우수한 투자
-        """
-        try:
-            import numpy as np
-
-            if len(returns) < 20:
-                logger.warning(f"Sharpe Ratio 계산 실패: 데이터 부족 ({len(returns)}개)")
-                return 0.0
-
-            returns_array = np.array(returns)
-
-            # 연간화 (252 거래일 가정)
-            annual_return = np.mean(returns_array) * 252
-            annual_volatility = np.std(returns_array) * np.sqrt(252)
-
-            if annual_volatility == 0:
-                return 0.0
-
-            sharpe_ratio = (annual_return - risk_free_rate) / annual_volatility
-
-            return sharpe_ratio
-
-        except Exception as e:
-            logger.error(f"Sharpe Ratio 계산 오류: {e}")
-            return 0.0
-
-    def _calculate_kelly_position(self, win_rate: float, avg_win: float, avg_loss: float) -> Dict:
+    @staticmethod
+    def _calculate_kelly_position(win_rate: float, avg_win: float, avg_loss: float) -> "KellyResult":
         """
         켈리 기준 (Kelly Criterion) 포지션 크기 계산
 
@@ -337,152 +539,44 @@ class RiskAgent:
             avg_loss: 평균 손실률 (예: 0.04 = 4%)
 
         Returns:
-            {
-                "kelly_fraction": float,  # 켈리 비율
-                "half_kelly": float,  # 안전 마진 (켈리의 50%)
-                "recommended_pct": float,  # 권장 포지션 비율
-                "reasoning": str
-            }
+            KellyResult(kelly_fraction, half_kelly, recommended_pct, reasoning)
+            - dict가 필요하면 ._asdict() 사용
 
         해석:
         - Half-Kelly 사용 (켈리의 50%)으로 안전성 확보
         - 최대 25% 포지션 제한
         """
-        try:
-            if win_rate <= 0 or win_rate >= 1:
-                return {
-                    "kelly_fraction": 0.0,
-                    "half_kelly": 0.0,
-                    "recommended_pct": 0.0,
-                    "reasoning": "승률 데이터 부적절"
-                }
-
-            if avg_loss == 0:
-                return {
-                    "kelly_fraction": 0.0,
-                    "half_kelly": 0.0,
-                    "recommended_pct": 0.0,
-                    "reasoning": "손실 데이터 없음"
-                }
-
-            p = win_rate  # 승률
-            q = 1 - win_rate  # 패율
-            b = avg_win / abs(avg_loss)  # 이익/손실 비율
-
-            # 켈리 공식
-            kelly_fraction = (p * b - q) / b
-
-            # 안전 마진: Half-Kelly (켈리의 50%)
-            # 최대 25% 포지션 제한
-            half_kelly = max(0, min(kelly_fraction * 0.5, 0.25))
-
-            if kelly_fraction < 0:
-                reasoning = "기대수익 음수 - 거래 부적합"
-                recommended_pct = 0.0
-            elif half_kelly == 0.25:
-                reasoning = f"최대 포지션 제한 (25%) 적용 (Full Kelly: {kelly_fraction:.1%})"
-                recommended_pct = 0.25
-            else:
-                reasoning = f"켈리 기준 권장: {half_kelly:.1%} (승률 {win_rate:.1%}, 이익/손실비 {b:.2f})"
-                recommended_pct = half_kelly
-
-            return {
-                "kelly_fraction": kelly_fraction,
-                "half_kelly": half_kelly,
-                "recommended_pct": recommended_pct,
-                "reasoning": reasoning
-            }
-
-        except Exception as e:
-            logger.error(f"Kelly Criterion 계산 오류: {e}")
-            return {
-                "kelly_fraction": 0.0,
-                "half_kelly": 0.0,
-                "recommended_pct": 0.0,
-                "reasoning": f"계산 오류: {str(e)}"
-            }
-
-    def _calculate_var(self, returns: List[float], confidence_level: float = 0.95, time_horizon: int = 1) -> Dict:
-        """
-        VaR (Value at Risk) 계산 (Historical Method)
-
-        VaR는 특정 신뢰수준에서 주어진 기간 동안 발생할 수 있는 최대 손실을 예측
-
-        Args:
-            returns: 일별 수익률 리스트 (예: [0.01, -0.02, 0.015, ...])
-            confidence_level: 신뢰수준 (기본값: 0.95 = 95%)
-            time_horizon: 예측 기간 (일 수, 기본값: 1일)
-
-        Returns:
-            {
-                "var_1day": float,  # 1일 VaR (%)
-                "var_10day": float,  # 10일 VaR (%)
-                "cvar": float,  # Conditional VaR (Expected Shortfall)
-                "confidence_level": float,  # 신뢰수준
-                "interpretation": str  # 해석
-            }
-
-        해석:
-        - VaR 95%: "95% 확률로 손실이 VaR보다 작을 것"
-        - CVaR: VaR 초과 시 평균 손실 (꼬리 위험)
-
-        예시:
-        - VaR 95% 1일 = -3% → "95% 확률로 내일 손실이 -3% 이하일 것"
-        - CVaR = -5% → "최악의 5% 시나리오에서 평균 손실은 -5%"
-        """
-        try:
-            import numpy as np
-
-            if len(returns) < 30:
-                logger.warning(f"VaR 계산 실패: 데이터 부족 ({len(returns)}개, 최소 30개 필요)")
-                return {
-                    "var_1day": 0.0,
-                    "var_10day": 0.0,
-                    "cvar": 0.0,
-                    "confidence_level": confidence_level,
-                    "interpretation": "데이터 부족 - VaR 계산 불가"
-                }
-
-            returns_array = np.array(returns)
-
-            # Historical VaR: 하위 percentile 사용
-            var_percentile = (1 - confidence_level) * 100
-            var_1day = np.percentile(returns_array, var_percentile)
-
-            # 10일 VaR (Square Root of Time Rule)
-            var_10day = var_1day * np.sqrt(10)
-
-            # CVaR (Conditional VaR / Expected Shortfall)
-            # VaR 초과 손실의 평균
-            tail_losses = returns_array[returns_array <= var_1day]
-            cvar = np.mean(tail_losses) if len(tail_losses) > 0 else var_1day
-
-            # 해석 생성
-            interpretation = (
-                f"95% 신뢰수준 1일 VaR: {var_1day*100:.2f}% "
-                f"(95% 확률로 손실이 {abs(var_1day)*100:.2f}% 이하) | "
-                f"최악 5% 시나리오 평균 손실(CVaR): {cvar*100:.2f}%"
+        if win_rate <= 0 or win_rate >= 1:
+            return KellyResult(0.0, 0.0, 0.0, "승률 데이터 부적절")
+
+        loss = abs(avg_loss)
+        if loss == 0:
+            return KellyResult(0.0, 0.0, 0.0, "손실 데이터 없음")
+        if avg_win == 0:
+            return KellyResult(0.0, 0.0, 0.0, "이익 데이터 없음")
+
+        p = win_rate  # 승률
+        q = 1 - win_rate  # 패율
+        b = avg_win / loss  # 이익/손실 비율
+
+        # 켈리 공식
+        kelly_fraction = (p * b - q) / b
+
+        # 안전 마진: Half-Kelly (켈리의 50%)
+        # 최대 25% 포지션 제한
+        half_kelly = max(0, min(kelly_fraction * 0.5, 0.25))
+
+        if kelly_fraction < 0:
+            return KellyResult(kelly_fraction, half_kelly, 0.0, "기대수익 음수 - 거래 부적합")
+        if half_kelly == 0.25:
+            return KellyResult(
+                kelly_fraction, half_kelly, 0.25,
+                f"최대 포지션 제한 (25%) 적용 (Full Kelly: {kelly_fraction:.1%})"
             )
-
-            logger.info(f"[Risk Agent] VaR 계산 완료: 1일 VaR={var_1day*100:.2f}%, CVaR={cvar*100:.2f}%")
-
-            return {
-                "var_1day": var_1day,
-                "var_10day": var_10day,
-                "cvar": cvar,
-                "confidence_level": confidence_level,
-                "interpretation": interpretation
-            }
-
-        except Exception as e:
-            logger.error(f"VaR 계산 오류: {e}")
-            return {
-                "var_1day": 0.0,
-                "var_10day": 0.0,
-                "cvar": 0.0,
-                "confidence_level": confidence_level,
-                "interpretation": f"VaR 계산 실패: {str(e)}"
-            }
+        return KellyResult(
+            kelly_fraction, half_kelly, half_kelly,
+            f"켈리 기준 권장: {half_kelly:.1%} (승률 {win_rate:.1%}, 이익/손실비 {b:.2f})"
+        )
 
     def _analyze_cds_premium(self, cds_spread: float, ticker: str = "") -> Dict:
         """
@@ -510,54 +604,56 @@ class RiskAgent:
         - 200-500 bps: 높은 신용 리스크 (투기 등급)
         - > 500 bps (5%): 매우 높은 신용 리스크 (부도 임박 가능성)
         """
-        try:
-            # CDS Spread에 따른 신용 리스크 등급 결정
-            if cds_spread < 100:
-                credit_risk_level = "LOW"
-                risk_score = min(10, cds_spread / 100 * 3)  # 0-3점
-                reasoning = f"낮은 신용 리스크 (CDS {cds_spread:.0f}bps) - 투자 등급 기업"
-                action_impact = "POSITIVE"
-                confidence_modifier = 0.1  # BUY 신뢰도 증가
-
-            elif cds_spread < 200:
-                credit_risk_level = "MODERATE"
-                risk_score = 3 + (cds_spread - 100) / 100 * 3  # 3-6점
-                reasoning = f"보통 신용 리스크 (CDS {cds_spread:.0f}bps) - 안정적이나 주의 필요"
-                action_impact = "NEUTRAL"
-                confidence_modifier = 0.0
-
-            elif cds_spread < 500:
-                credit_risk_level = "HIGH"
-                risk_score = 6 + (cds_spread - 200) / 300 * 3  # 6-9점
-                reasoning = f"높은 신용 리스크 (CDS {cds_spread:.0f}bps) - 투기 등급, 부도 위험 상승"
-                action_impact = "NEGATIVE"
-                confidence_modifier = -0.15  # SELL 신호 강화
-
-            else:  # >= 500 bps
-                credit_risk_level = "CRITICAL"
-                risk_score = min(10, 9 + (cds_spread - 500) / 500)  # 9-10점
-                reasoning = f"매우 높은 신용 리스크 (CDS {cds_spread:.0f}bps) - 부도 임박 가능성"
-                action_impact = "NEGATIVE"
-                confidence_modifier = -0.25  # 강한 SELL 신호
-
-            logger.info(f"[Risk Agent] CDS Premium 분석 ({ticker}): {cds_spread}bps → {credit_risk_level}")
-
-            return {
-                "credit_risk_level": credit_risk_level,
-                "risk_score": risk_score,
-                "cds_spread_bps": cds_spread,
-                "reasoning": reasoning,
-                "action_impact": action_impact,
-                "confidence_modifier": confidence_modifier
-            }
+        # CDS Spread에 따른 신용 리스크 등급 결정
+        idx = bisect_right(_CDS_BINS, cds_spread)
+        credit_risk_level = _CDS_LEVELS[idx]
+        reasoning = _CDS_REASONS[idx].format(spread=cds_spread)
+        action_impact = _CDS_ACTION_IMPACTS[idx]
+        confidence_modifier = _CDS_CONFIDENCE_MODIFIERS[idx]
 
-        except Exception as e:
-            logger.error(f"CDS Premium 분석 오류 ({ticker}): {e}")
-            return {
-                "credit_risk_level": "UNKNOWN",
-                "risk_score": 5.0,
-                "cds_spread_bps": 0,
-                "reasoning": f"CDS 데이터 분석 실패: {str(e)}",
-                "action_impact": "NEUTRAL",
-                "confidence_modifier": 0.0
+        intercept, slope, lo, hi = _CDS_SCORE_COEFFS[idx]
+        risk_score = min(hi, max(lo, intercept + slope * cds_spread))
+
+        logger.info(f"[Risk Agent] CDS Premium 분석 ({ticker}): {cds_spread}bps → {credit_risk_level}")
+
+        return {
+            "credit_risk_level": credit_risk_level,
+            "risk_score": risk_score,
+            "cds_spread_bps": cds_spread,
+            "reasoning": reasoning,
+            "action_impact": action_impact,
+            "confidence_modifier": confidence_modifier
+        }
+
+    def _analyze_cds_premium_batch(self, spreads) -> Dict[str, Any]:
+        """
+        여러 종목의 CDS Premium 일괄 분석 (포트폴리오 리스크 점검용, numpy 필요)
+
+        _analyze_cds_premium과 같은 구간/점수 규칙을 np.searchsorted로
+        한 번에 적용 (종목별 reasoning 문자열은 생성하지 않음)
+
+        Args:
+            spreads: CDS 스프레드 배열 (bps)
+
+        Returns:
+            {
+                "credit_risk_level": ndarray[str],
+                "risk_score": ndarray[float],
+                "cds_spread_bps": ndarray[float],
+                "action_impact": ndarray[str],
+                "confidence_modifier": ndarray[float]
             }
+        """
+        spreads = np.asarray(spreads, dtype=np.float64)
+        idx = np.searchsorted(_CDS_BINS, spreads, side="right")
+
+        intercept, slope, lo, hi = np.asarray(_CDS_SCORE_COEFFS, dtype=np.float64)[idx].T
+        risk_score = np.minimum(hi, np.maximum(lo, intercept + slope * spreads))
+
+        return {
+            "credit_risk_level": np.asarray(_CDS_LEVELS)[idx],
+            "risk_score": risk_score,
+            "cds_spread_bps": spreads,
+            "action_impact": np.asarray(_CDS_ACTION_IMPACTS)[idx],
+            "confidence_modifier": np.asarray(_CDS_CONFIDENCE_MODIFIERS)[idx]
+        }
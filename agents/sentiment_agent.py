@@ -9,12 +9,353 @@ Date: 2025-12-27
 """
 
 import logging
-from typing import Dict, Any, Optional, List
+from bisect import bisect_right
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, Any, Final, Optional, List
 from datetime import datetime, timedelta
 import random
+import threading
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only analyze_batch needs it
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; analyze_batch falls back to numpy ops
+    njit = None
+    prange = range
 
 logger = logging.getLogger(__name__)
 
+# social_data 기본값 (필드 순서 = _get_social_fields 반환 순서)
+_SOCIAL_DEFAULTS = {
+    "twitter_sentiment": 0,
+    "twitter_volume": 0,
+    "reddit_sentiment": 0,
+    "reddit_mentions": 0,
+    "fear_greed_index": 50,
+    "trending_rank": 100,
+    "sentiment_change_24h": 0,
+    "bullish_ratio": 0.5
+}
+_get_social_fields = itemgetter(*_SOCIAL_DEFAULTS)
+# 이 중 하나도 없으면 분석 대상 데이터가 없는 것으로 간주 (fallback)
+_CORE_SOCIAL_FIELDS = ("twitter_sentiment", "reddit_sentiment", "fear_greed_index")
+
+# 감성 가중치 / 결정 임계값 (scalar, batch, numba kernel 공용)
+_TWITTER_WEIGHT: Final = 0.6          # 종합 감성 = Twitter 60% + Reddit 40%
+_REDDIT_WEIGHT: Final = 0.4
+_HIGH_VOLUME_TWEETS: Final = 10000    # 높은 언급량: Tweet > 10000 또는 Reddit > 500
+_HIGH_VOLUME_MENTIONS: Final = 500
+_TRENDING_RANK: Final = 20            # Top 20 = trending
+_STRONG_POSITIVE: Final = 0.6
+_STRONG_NEGATIVE: Final = -0.5
+_MOMENTUM_UP: Final = 0.3             # 24h 감성 변화 (급상승 / 급락)
+_MOMENTUM_DOWN: Final = -0.4
+_EXTREME_FEAR: Final = 25             # F&G < 25 → 역투자 매수
+_EXTREME_GREED: Final = 76            # F&G >= 76 → 과열 매도
+_FG_OVERHEAT: Final = 85              # F&G > 85 + 강세 비율 > 90% → SELL case
+_BULLISH_OVERHEAT: Final = 0.90
+_CONFIDENCE_MIN: Final = 0.40
+_CONFIDENCE_MAX: Final = 0.90
+
+# Fear & Greed Index 구간 (0-24 / 25-44 / 45-55 / 56-75 / 76-100)
+_FG_THRESHOLDS = (_EXTREME_FEAR, 45, 56, _EXTREME_GREED)
+_FG_TABLE = tuple(
+    MappingProxyType({"level": level, "signal": signal})
+    for level, signal in (
+        ("EXTREME_FEAR", "CONTRARIAN_BUY"),
+        ("FEAR", "NEUTRAL"),
+        ("NEUTRAL", "NEUTRAL"),
+        ("GREED", "NEUTRAL"),
+        ("EXTREME_GREED", "CONTRARIAN_SELL"),
+    )
+)
+_FG_REASONS = (
+    "극도의 공포 ({index}) - 역투자 매수 기회",
+    "공포 ({index}) - 주의 필요",
+    "중립 ({index}) - 정상 범위",
+    "탐욕 ({index}) - 과열 주의",
+    "극도의 탐욕 ({index}) - 과열 조정 경고",
+)
+
+# 매매 신호 결정 테이블: case 번호 → (action, confidence, reasoning 템플릿)
+# case 0-5는 우선순위 순서의 BUY/SELL 조건, case 6은 HOLD (해당 없음)
+# case 0의 confidence는 감성 강도에 비례 (None → _strong_positive_confidence)
+_DECISION_TABLE = (
+    ("BUY", None, "강한 긍정 소셜 감성 ({overall_sentiment:.2f}) + 높은 언급량 (Twitter {twitter_volume}, Reddit {reddit_mentions})"),
+    ("BUY", 0.78, "Extreme Fear ({fear_greed_index}) + 긍정 감성 ({overall_sentiment:.2f}) - 역투자 기회"),
+    ("BUY", 0.75, "급상승 트렌드 (순위 {trending_rank}, 24h 감성 변화 +{sentiment_change_24h:.2f})"),
+    ("SELL", 0.80, "강한 부정 소셜 감성 ({overall_sentiment:.2f}) - 투자 심리 악화"),
+    ("SELL", 0.82, "Extreme Greed ({fear_greed_index}) + 과도한 낙관 (강세 {bullish_ratio:.1%}) - 과열 조정 위험"),
+    ("SELL", 0.75, "급락 트렌드 (24h 감성 변화 {sentiment_change_24h:.2f}) - 투자 심리 급락"),
+    ("HOLD", 0.60, "소셜 감성 {sentiment_level} ({overall_sentiment:.2f}), Fear & Greed {fear_greed_index} - 관망 추천"),
+)
+_HOLD_CASE = len(_DECISION_TABLE) - 1
+
+# Fear & Greed 역투자 override (HOLD → BUY/SELL) 시 reasoning 템플릿
+_CONTRARIAN_BUY_REASON = "Extreme Fear ({fear_greed_index}) - 역투자 매수 기회"
+_CONTRARIAN_SELL_REASON = "Extreme Greed ({fear_greed_index}) - 과열 조정 경고"
+# 보조 신호 reasoning 항목 (" | "로 연결)
+_REASON_SEPARATOR = " | "
+_FG_BUY_SUFFIX = "Fear & Greed 역투자 ({fear_greed_index})"
+_FG_SELL_SUFFIX = "Fear & Greed 과열 ({fear_greed_index})"
+_TRENDING_SUFFIX = "Trending #{trending_rank}"
+_LOW_VOLUME_SUFFIX = "낮은 소셜 언급량 (주의)"
+
+
+# Mock 시나리오 (모듈 로드 시 1회 생성, 읽기 전용 - _analyze_mock은 복사본 반환)
+_MOCK_SCENARIOS = tuple(
+    MappingProxyType({
+        "agent": "sentiment",
+        **scenario,
+        "sentiment_factors": MappingProxyType(scenario["sentiment_factors"])
+    })
+    for scenario in (
+        {
+            "action": "BUY",
+            "confidence": 0.75,
+            "reasoning": "긍정 소셜 감성 (0.68) + Extreme Fear (22) - 역투자 기회",
+            "sentiment_factors": {
+                "overall_sentiment": 0.68,
+                "fg_index": 22,
+                "fg_level": "EXTREME_FEAR",
+                "fg_signal": "CONTRARIAN_BUY",
+                "trend_rank": 12,
+                "is_trending": True
+            }
+        },
+        {
+            "action": "SELL",
+            "confidence": 0.80,
+            "reasoning": "부정 소셜 감성 (-0.52) + Extreme Greed (88) - 과열 조정 위험",
+            "sentiment_factors": {
+                "overall_sentiment": -0.52,
+                "fg_index": 88,
+                "fg_level": "EXTREME_GREED",
+                "fg_signal": "CONTRARIAN_SELL",
+                "trend_rank": 5,
+                "is_trending": True
+            }
+        },
+        {
+            "action": "HOLD",
+            "confidence": 0.60,
+            "reasoning": "중립 소셜 감성 (0.12), Fear & Greed 중립 (52) - 관망",
+            "sentiment_factors": {
+                "overall_sentiment": 0.12,
+                "fg_index": 52,
+                "fg_level": "NEUTRAL",
+                "fg_signal": "NEUTRAL",
+                "trend_rank": 45,
+                "is_trending": False
+            }
+        }
+    )
+)
+
+# 오류 시 fallback 응답 공통 부분 (ticker별 reasoning / sentiment_factors만 새로 생성)
+_FALLBACK_SKELETON = MappingProxyType({
+    "agent": "sentiment",
+    "action": "HOLD",
+    "confidence": 0.50
+})
+
+# sentiment_factors 표시용 포맷 (UI/로그 출력 시에만 사용)
+_FACTOR_FORMATS = {
+    "overall_sentiment": "{:.2f}",
+    "twitter_sentiment": "{:.2f}",
+    "reddit_sentiment": "{:.2f}",
+    "sentiment_change_24h": "{:+.2f}",
+    "bullish_ratio": "{:.1%}"
+}
+
+
+def format_sentiment_factors(sentiment_factors: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    sentiment_factors의 감성 수치를 표시용 문자열로 변환한 복사본 반환
+
+    예: {"overall_sentiment": 0.684, "bullish_ratio": 0.62}
+        → {"overall_sentiment": "0.68", "bullish_ratio": "62.0%"}
+    """
+    return {
+        key: _FACTOR_FORMATS[key].format(value) if key in _FACTOR_FORMATS else value
+        for key, value in sentiment_factors.items()
+    }
+
+# _analyze_with_real_data 작업용 sentiment_factors 버퍼 (스레드별 1개, 호출마다 clear 후 재사용)
+# 분석 본문은 동기 코드라 같은 스레드의 다른 호출과 겹치지 않으며, 반환 시 복사본을 넘긴다.
+_TLS = threading.local()
+
+
+def _get_sentiment_factors() -> Dict[str, Any]:
+    """현재 스레드의 sentiment_factors 버퍼 (비워서 반환)"""
+    factors = getattr(_TLS, "sentiment_factors", None)
+    if factors is None:
+        factors = _TLS.sentiment_factors = {}
+    else:
+        factors.clear()
+    return factors
+
+
+def _strong_positive_confidence(overall_sentiment):
+    """case 0 (강한 긍정 + 높은 거래량) confidence - scalar/ndarray 공용"""
+    if np is not None and isinstance(overall_sentiment, np.ndarray):
+        return np.minimum(0.85, 0.70 + (overall_sentiment - _STRONG_POSITIVE) * 0.5)
+    return min(0.85, 0.70 + (overall_sentiment - _STRONG_POSITIVE) * 0.5)
+
+
+def _clamp(x: float, lo: float = _CONFIDENCE_MIN, hi: float = _CONFIDENCE_MAX) -> float:
+    """최종 confidence 범위 제한 (batch 경로는 np.clip 사용)"""
+    return lo if x < lo else hi if x > hi else x
+
+
+# F&G 구간별 결정 함수 (signal이 정해지면 해당 구간에서 불가능한 case/보정 분기는 제외)
+# 반환: (action, confidence, reason_templates, confidence_boost)
+# case 위치는 _DECISION_TABLE 순서와 동일 (해당 구간에서 불가능한 case는 False)
+
+def _decide_contrarian_buy(overall_sentiment, high_volume, is_trending, fear_greed_index,
+                           sentiment_change_24h, bullish_ratio):
+    """Extreme Fear (F&G < 25): HOLD → 역투자 BUY, BUY → 신뢰도 +0.1"""
+    case = (
+        overall_sentiment > _STRONG_POSITIVE and high_volume,   # BUY: 강한 긍정 감성 + 높은 거래량
+        overall_sentiment > 0,                                  # BUY: Extreme Fear (역투자 기회)
+        is_trending and sentiment_change_24h > _MOMENTUM_UP,    # BUY: Trending + 상승 모멘텀
+        overall_sentiment < _STRONG_NEGATIVE,                   # SELL: 강한 부정 감성
+        False,                                                  # SELL: Extreme Greed (해당 없음)
+        sentiment_change_24h < _MOMENTUM_DOWN,                  # SELL: 급락 트렌드
+        True                                                    # HOLD
+    ).index(True)
+    if case == _HOLD_CASE:
+        return "BUY", 0.72, [_CONTRARIAN_BUY_REASON], 0.0
+    action, confidence, template = _DECISION_TABLE[case]
+    if confidence is None:
+        confidence = _strong_positive_confidence(overall_sentiment)
+    if action == "BUY":
+        return action, confidence, [template, _FG_BUY_SUFFIX], 0.1
+    return action, confidence, [template], 0.0
+
+
+def _decide_contrarian_sell(overall_sentiment, high_volume, is_trending, fear_greed_index,
+                            sentiment_change_24h, bullish_ratio):
+    """Extreme Greed (F&G >= 76): HOLD → 과열 SELL, SELL → 신뢰도 +0.1"""
+    case = (
+        overall_sentiment > _STRONG_POSITIVE and high_volume,                     # BUY: 강한 긍정 감성 + 높은 거래량
+        False,                                                                    # BUY: Extreme Fear (해당 없음)
+        is_trending and sentiment_change_24h > _MOMENTUM_UP,                      # BUY: Trending + 상승 모멘텀
+        overall_sentiment < _STRONG_NEGATIVE,                                     # SELL: 강한 부정 감성
+        fear_greed_index > _FG_OVERHEAT and bullish_ratio > _BULLISH_OVERHEAT,    # SELL: Extreme Greed (과열 경고)
+        sentiment_change_24h < _MOMENTUM_DOWN,                                    # SELL: 급락 트렌드
+        True                                                                      # HOLD
+    ).index(True)
+    if case == _HOLD_CASE:
+        return "SELL", 0.70, [_CONTRARIAN_SELL_REASON], 0.0
+    action, confidence, template = _DECISION_TABLE[case]
+    if confidence is None:
+        confidence = _strong_positive_confidence(overall_sentiment)
+    if action == "SELL":
+        return action, confidence, [template, _FG_SELL_SUFFIX], 0.1
+    return action, confidence, [template], 0.0
+
+
+def _decide_neutral(overall_sentiment, high_volume, is_trending, fear_greed_index,
+                    sentiment_change_24h, bullish_ratio):
+    """F&G 25-75: 역투자 보정 없음, Extreme Fear/Greed case 제외"""
+    case = (
+        overall_sentiment > _STRONG_POSITIVE and high_volume,   # BUY: 강한 긍정 감성 + 높은 거래량
+        False,                                                  # BUY: Extreme Fear (해당 없음)
+        is_trending and sentiment_change_24h > _MOMENTUM_UP,    # BUY: Trending + 상승 모멘텀
+        overall_sentiment < _STRONG_NEGATIVE,                   # SELL: 강한 부정 감성
+        False,                                                  # SELL: Extreme Greed (해당 없음)
+        sentiment_change_24h < _MOMENTUM_DOWN,                  # SELL: 급락 트렌드
+        True                                                    # HOLD
+    ).index(True)
+    action, confidence, template = _DECISION_TABLE[case]
+    if confidence is None:
+        confidence = _strong_positive_confidence(overall_sentiment)
+    return action, confidence, [template], 0.0
+
+
+_DISPATCH = {
+    "CONTRARIAN_BUY": _decide_contrarian_buy,
+    "CONTRARIAN_SELL": _decide_contrarian_sell,
+    "NEUTRAL": _decide_neutral
+}
+
+
+def _fear_greed_reasoning(index: int) -> str:
+    """Fear & Greed 해석 문자열 (표시/로깅이 필요할 때만 생성)"""
+    return _FG_REASONS[bisect_right(_FG_THRESHOLDS, index)].format(index=index)
+
+
+# _decide_kernel 출력 action 코드 (0=HOLD, 1=BUY, 2=SELL)
+_ACTION_CODES = ("HOLD", "BUY", "SELL")
+
+
+def _decide_loop(tw, rd, tv, rm, fg, rk, dc, br, out_act, out_conf):
+    """
+    analyze_batch 결정 kernel (numba 컴파일 대상)
+
+    _analyze_with_real_data의 결정 테이블 + F&G/Trending/거래량 보정과 동일한 규칙을
+    ticker별로 실행한다. 결과는 out_act (int8 action 코드), out_conf에 기록.
+    """
+    for i in prange(tw.shape[0]):
+        overall = tw[i] * _TWITTER_WEIGHT + rd[i] * _REDDIT_WEIGHT
+        high_volume = tv[i] > _HIGH_VOLUME_TWEETS or rm[i] > _HIGH_VOLUME_MENTIONS
+        is_trending = rk[i] <= _TRENDING_RANK
+        boost = 0.0
+
+        if overall > _STRONG_POSITIVE and high_volume:
+            act = 1
+            conf = min(0.85, 0.70 + (overall - _STRONG_POSITIVE) * 0.5)
+        elif fg[i] < _EXTREME_FEAR and overall > 0:
+            act = 1
+            conf = 0.78
+        elif is_trending and dc[i] > _MOMENTUM_UP:
+            act = 1
+            conf = 0.75
+        elif overall < _STRONG_NEGATIVE:
+            act = 2
+            conf = 0.80
+        elif fg[i] > _FG_OVERHEAT and br[i] > _BULLISH_OVERHEAT:
+            act = 2
+            conf = 0.82
+        elif dc[i] < _MOMENTUM_DOWN:
+            act = 2
+            conf = 0.75
+        else:
+            act = 0
+            conf = 0.60
+
+        # Fear & Greed 역투자 (Extreme Fear < 25, Extreme Greed >= 76)
+        if fg[i] < _EXTREME_FEAR:
+            if act == 0:
+                act = 1
+                conf = 0.72
+            elif act == 1:
+                boost += 0.1
+        elif fg[i] >= _EXTREME_GREED:
+            if act == 0:
+                act = 2
+                conf = 0.70
+            elif act == 2:
+                boost += 0.1
+
+        if is_trending and act == 1:
+            boost += 0.05
+        if not high_volume and act != 0:
+            boost -= 0.1
+
+        conf += boost
+        out_act[i] = act
+        out_conf[i] = _CONFIDENCE_MIN if conf < _CONFIDENCE_MIN else _CONFIDENCE_MAX if conf > _CONFIDENCE_MAX else conf
+
+
+_decide_kernel = njit(parallel=True, cache=True)(_decide_loop) if njit is not None else None
+
 
 class SentimentAgent:
     """
@@ -47,20 +388,128 @@ class SentimentAgent:
                 "reasoning": str,
                 "sentiment_factors": {...}
             }
+
+            social_data가 비어 있거나 twitter_sentiment / reddit_sentiment /
+            fear_greed_index 중 어느 것도 없으면 기본값으로 분석하지 않고
+            fallback 응답 (HOLD, confidence 0.50, error=True)을 반환한다.
         """
         try:
-            logger.info(f"[Sentiment Agent] Analyzing {ticker}")
+            logger.info("[Sentiment Agent] Analyzing %s", ticker)
 
             if context and "social_data" in context:
-                return await self._analyze_with_real_data(ticker, context["social_data"])
+                social_data = context["social_data"]
+                if not social_data or not any(key in social_data for key in _CORE_SOCIAL_FIELDS):
+                    # 핵심 감성 지표가 하나도 없음 (API 장애 등) → 분석 생략
+                    return self._fallback_response(ticker)
+                return self._analyze_with_real_data(ticker, social_data)
             else:
-                return await self._analyze_mock(ticker)
+                return self._analyze_mock(ticker)
 
         except Exception as e:
-            logger.error(f"[Sentiment Agent] Error analyzing {ticker}: {e}")
+            logger.error("[Sentiment Agent] Error analyzing %s: %s", ticker, e)
             return self._fallback_response(ticker)
 
-    async def _analyze_with_real_data(self, ticker: str, social_data: Dict) -> Dict:
+    def analyze_batch(self, tickers: List[str], social_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze social sentiment for many tickers at once (screening, requires numpy).
+
+        Applies the same decision rules as _analyze_with_real_data to
+        column arrays (SoA) with vector ops instead of a per-ticker Python
+        cascade. When numba is installed the rules run as one compiled
+        parallel loop (_decide_kernel). Per-ticker reasoning text is not built.
+
+        Args:
+            tickers: Stock ticker symbols
+            social_data: Column arrays aligned with tickers, same keys as the
+                         single-ticker social_data (missing columns use defaults)
+                {
+                    "twitter_sentiment": ndarray,
+                    "twitter_volume": ndarray,
+                    ...
+                }
+
+        Returns:
+            {
+                "tickers": [...],
+                "action": ndarray[str],  # BUY|SELL|HOLD
+                "confidence": ndarray[float],
+                "overall_sentiment": ndarray[float],
+                "is_meme_stock": ndarray[bool]
+            }
+        """
+        n = len(tickers)
+
+        def column(key: str) -> "np.ndarray":
+            values = social_data.get(key)
+            if values is None:
+                return np.full(n, _SOCIAL_DEFAULTS[key], dtype=np.float64)
+            return np.asarray(values, dtype=np.float64)
+
+        (twitter_sentiment, twitter_volume, reddit_sentiment, reddit_mentions,
+         fear_greed_index, trending_rank, sentiment_change_24h, bullish_ratio) = map(column, _SOCIAL_DEFAULTS)
+
+        overall_sentiment = (twitter_sentiment * _TWITTER_WEIGHT) + (reddit_sentiment * _REDDIT_WEIGHT)
+        is_trending = trending_rank <= _TRENDING_RANK
+        high_volume = (twitter_volume > _HIGH_VOLUME_TWEETS) | (reddit_mentions > _HIGH_VOLUME_MENTIONS)
+        # Meme Stock 판정 (_detect_social_trends와 동일 기준)
+        is_meme_stock = (
+            ((twitter_volume > 50000) | (reddit_mentions > 2000)) &
+            (sentiment_change_24h > 0.5) &
+            (bullish_ratio > 0.85)
+        )
+
+        if _decide_kernel is not None:
+            # numba: 결정 cascade + 보정을 ticker별 단일 loop로 실행 (중간 배열 없음)
+            action_code = np.empty(n, dtype=np.int8)
+            confidence = np.empty(n, dtype=np.float64)
+            _decide_kernel(
+                twitter_sentiment, reddit_sentiment, twitter_volume, reddit_mentions,
+                fear_greed_index, trending_rank, sentiment_change_24h, bullish_ratio,
+                action_code, confidence
+            )
+            action = np.array(_ACTION_CODES)[action_code]
+        else:
+            # 매매 신호 결정: 조건 행렬에서 첫 번째로 참인 case (argmax) → 결정 테이블 조회
+            conditions = np.vstack([
+                (overall_sentiment > _STRONG_POSITIVE) & high_volume,                      # BUY 1: 강한 긍정 + 높은 거래량
+                (fear_greed_index < _EXTREME_FEAR) & (overall_sentiment > 0),              # BUY 2: Extreme Fear 역투자
+                is_trending & (sentiment_change_24h > _MOMENTUM_UP),                       # BUY 3: Trending + 상승 모멘텀
+                overall_sentiment < _STRONG_NEGATIVE,                                      # SELL 1: 강한 부정 감성
+                (fear_greed_index > _FG_OVERHEAT) & (bullish_ratio > _BULLISH_OVERHEAT),   # SELL 2: Extreme Greed
+                sentiment_change_24h < _MOMENTUM_DOWN,                                     # SELL 3: 급락 트렌드
+                np.ones(n, dtype=bool)                              # HOLD
+            ])
+            case = conditions.argmax(axis=0)
+            action = np.array([row[0] for row in _DECISION_TABLE])[case]
+            confidence = np.array([row[1] or 0.0 for row in _DECISION_TABLE])[case]
+            confidence = np.where(case == 0, _strong_positive_confidence(overall_sentiment), confidence)
+            confidence_boost = np.zeros(n)
+
+            # Fear & Greed 신호 통합 (Extreme Fear < 25, Extreme Greed >= 76)
+            contrarian_buy = fear_greed_index < _EXTREME_FEAR
+            contrarian_sell = fear_greed_index >= _EXTREME_GREED
+            is_hold = action == "HOLD"
+            to_buy = contrarian_buy & is_hold
+            to_sell = contrarian_sell & is_hold
+            confidence_boost += np.where(contrarian_buy & (action == "BUY"), 0.1, 0.0)
+            confidence_boost += np.where(contrarian_sell & (action == "SELL"), 0.1, 0.0)
+            action = np.where(to_buy, "BUY", np.where(to_sell, "SELL", action))
+            confidence = np.where(to_buy, 0.72, np.where(to_sell, 0.70, confidence))
+
+            # Trending Boost / 낮은 거래량 감점
+            confidence_boost += np.where(is_trending & (action == "BUY"), 0.05, 0.0)
+            confidence_boost -= np.where(~high_volume & (action != "HOLD"), 0.1, 0.0)
+            confidence = np.clip(confidence + confidence_boost, _CONFIDENCE_MIN, _CONFIDENCE_MAX)
+
+        return {
+            "tickers": list(tickers),
+            "action": action,
+            "confidence": confidence,
+            "overall_sentiment": overall_sentiment,
+            "is_meme_stock": is_meme_stock
+        }
+
+    def _analyze_with_real_data(self, ticker: str, social_data: Dict) -> Dict:
         """
         Analyze using real social media data.
 
@@ -76,189 +525,119 @@ class SentimentAgent:
             "bullish_ratio": 0.68       # % of bullish posts
         }
         """
-        twitter_sentiment = social_data.get("twitter_sentiment", 0)
-        twitter_volume = social_data.get("twitter_volume", 0)
-        reddit_sentiment = social_data.get("reddit_sentiment", 0)
-        reddit_mentions = social_data.get("reddit_mentions", 0)
-        fear_greed_index = social_data.get("fear_greed_index", 50)
-        trending_rank = social_data.get("trending_rank", 100)
-        sentiment_change_24h = social_data.get("sentiment_change_24h", 0)
-        bullish_ratio = social_data.get("bullish_ratio", 0.5)
-
-        action = "HOLD"
-        confidence = 0.5
-        confidence_boost = 0.0
-        sentiment_factors = {}
+        # 기본값 병합 한 번 + itemgetter로 8개 필드 일괄 추출
+        (twitter_sentiment, twitter_volume, reddit_sentiment, reddit_mentions,
+         fear_greed_index, trending_rank, sentiment_change_24h, bullish_ratio) = _get_social_fields(
+            {**_SOCIAL_DEFAULTS, **social_data}
+        )
+
+        sentiment_factors = _get_sentiment_factors()
 
         # 1. 종합 소셜 감성 점수 계산 (가중 평균)
         # Twitter 60% + Reddit 40%
-        overall_sentiment = (twitter_sentiment * 0.6) + (reddit_sentiment * 0.4)
+        overall_sentiment = (twitter_sentiment * _TWITTER_WEIGHT) + (reddit_sentiment * _REDDIT_WEIGHT)
 
         # 2. Fear & Greed Index 분석
         fear_greed_analysis = self._analyze_fear_greed(fear_greed_index)
-        sentiment_factors["fear_greed"] = {
-            "index": fear_greed_index,
-            "level": fear_greed_analysis["level"],
-            "signal": fear_greed_analysis["signal"]
-        }
+        sentiment_factors["fg_index"] = fear_greed_index
+        sentiment_factors["fg_level"] = fear_greed_analysis["level"]
+        sentiment_factors["fg_signal"] = fear_greed_analysis["signal"]
 
         # 3. 소셜 트렌딩 분석
-        is_trending = trending_rank <= 20  # Top 20 = trending
-        high_volume = (twitter_volume > 10000) or (reddit_mentions > 500)
-
-        sentiment_factors["trending"] = {
-            "rank": trending_rank,
-            "is_trending": is_trending,
+        is_trending = trending_rank <= _TRENDING_RANK
+        high_volume = (twitter_volume > _HIGH_VOLUME_TWEETS) or (reddit_mentions > _HIGH_VOLUME_MENTIONS)
+
+        sentiment_factors["trend_rank"] = trending_rank
+        sentiment_factors["is_trending"] = is_trending
+        sentiment_factors["twitter_volume"] = twitter_volume
+        sentiment_factors["reddit_mentions"] = reddit_mentions
+        sentiment_factors.update(self._detect_social_trends(
+            twitter_volume, reddit_mentions, sentiment_change_24h, bullish_ratio
+        ))
+
+        sentiment_level = "긍정" if overall_sentiment > 0.3 else "부정" if overall_sentiment < -0.3 else "중립"
+        values = {
+            "overall_sentiment": overall_sentiment,
+            "twitter_sentiment": twitter_sentiment,
+            "reddit_sentiment": reddit_sentiment,
             "twitter_volume": twitter_volume,
-            "reddit_mentions": reddit_mentions
+            "reddit_mentions": reddit_mentions,
+            "fear_greed_index": fear_greed_index,
+            "trending_rank": trending_rank,
+            "sentiment_change_24h": sentiment_change_24h,
+            "bullish_ratio": bullish_ratio,
+            "sentiment_level": sentiment_level
         }
 
-        # 4. 매매 신호 결정
-
-        # === BUY 신호 ===
-        # Case 1: 강한 긍정 감성 + 높은 거래량
-        if overall_sentiment > 0.6 and high_volume:
-            action = "BUY"
-            confidence = min(0.85, 0.70 + (overall_sentiment - 0.6) * 0.5)
-            reasoning = f"강한 긍정 소셜 감성 ({overall_sentiment:.2f}) + 높은 언급량 (Twitter {twitter_volume}, Reddit {reddit_mentions})"
-
-        # Case 2: Extreme Fear (역투자 기회)
-        elif fear_greed_index < 25 and overall_sentiment > 0:
-            action = "BUY"
-            confidence = 0.78
-            reasoning = f"Extreme Fear ({fear_greed_index}) + 긍정 감성 ({overall_sentiment:.2f}) - 역투자 기회"
-
-        # Case 3: Trending + 상승 모멘텀
-        elif is_trending and sentiment_change_24h > 0.3:
-            action = "BUY"
-            confidence = 0.75
-            reasoning = f"급상승 트렌드 (순위 {trending_rank}, 24h 감성 변화 +{sentiment_change_24h:.2f})"
-
-        # === SELL 신호 ===
-        # Case 1: 강한 부정 감성
-        elif overall_sentiment < -0.5:
-            action = "SELL"
-            confidence = 0.80
-            reasoning = f"강한 부정 소셜 감성 ({overall_sentiment:.2f}) - 투자 심리 악화"
-
-        # Case 2: Extreme Greed (과열 경고)
-        elif fear_greed_index > 85 and bullish_ratio > 0.90:
-            action = "SELL"
-            confidence = 0.82
-            reasoning = f"Extreme Greed ({fear_greed_index}) + 과도한 낙관 (강세 {bullish_ratio:.1%}) - 과열 조정 위험"
-
-        # Case 3: 급락 트렌드
-        elif sentiment_change_24h < -0.4:
-            action = "SELL"
-            confidence = 0.75
-            reasoning = f"급락 트렌드 (24h 감성 변화 {sentiment_change_24h:.2f}) - 투자 심리 급락"
-
-        # === HOLD (중립) ===
-        else:
-            sentiment_level = "긍정" if overall_sentiment > 0.3 else "부정" if overall_sentiment < -0.3 else "중립"
-            reasoning = f"소셜 감성 {sentiment_level} ({overall_sentiment:.2f}), Fear & Greed {fear_greed_index} - 관망 추천"
-            confidence = 0.60
-
-        # 5. Fear & Greed 신호 통합
-        if fear_greed_analysis["signal"] == "CONTRARIAN_BUY":
-            # Extreme Fear → 역투자 매수
-            if action == "HOLD":
-                action = "BUY"
-                confidence = 0.72
-                reasoning = f"Extreme Fear ({fear_greed_index}) - 역투자 매수 기회"
-            elif action == "BUY":
-                confidence_boost += 0.1
-                reasoning += f" | Fear & Greed 역투자 ({fear_greed_index})"
-
-        elif fear_greed_analysis["signal"] == "CONTRARIAN_SELL":
-            # Extreme Greed → 과열 매도
-            if action == "HOLD":
-                action = "SELL"
-                confidence = 0.70
-                reasoning = f"Extreme Greed ({fear_greed_index}) - 과열 조정 경고"
-            elif action == "SELL":
-                confidence_boost += 0.1
-                reasoning += f" | Fear & Greed 과열 ({fear_greed_index})"
+        # HOLD fast path: 어떤 BUY/SELL case에도, F&G 역투자 구간에도 해당하지 않는 경우
+        # (중립 시장에서 가장 흔한 결과 → 아래 cascade/보정 단계를 건너뜀)
+        if (_STRONG_NEGATIVE <= overall_sentiment <= _STRONG_POSITIVE
+                and _EXTREME_FEAR <= fear_greed_index < _EXTREME_GREED
+                and _MOMENTUM_DOWN <= sentiment_change_24h <= _MOMENTUM_UP):
+            return self._make_hold(sentiment_factors, values)
+
+        # 4-5. 매매 신호 결정 + Fear & Greed 신호 통합 (F&G 구간별 특화 함수)
+        decide = _DISPATCH[fear_greed_analysis["signal"]]
+        action, confidence, reason_templates, confidence_boost = decide(
+            overall_sentiment, high_volume, is_trending, fear_greed_index, sentiment_change_24h, bullish_ratio
+        )
 
         # 6. Trending Boost
         if is_trending and action == "BUY":
             confidence_boost += 0.05
-            reasoning += f" | Trending #{trending_rank}"
+            reason_templates.append(_TRENDING_SUFFIX)
 
         # 7. 거래량 확인 (Low Volume = 신뢰도 감소)
         if not high_volume and action in ["BUY", "SELL"]:
             confidence_boost -= 0.1
-            reasoning += f" | 낮은 소셜 언급량 (주의)"
+            reason_templates.append(_LOW_VOLUME_SUFFIX)
 
         # Final confidence adjustment
-        confidence = min(0.90, max(0.40, confidence + confidence_boost))
-
+        confidence = _clamp(confidence + confidence_boost)
+
+        return self._make_decision(action, confidence, reason_templates, sentiment_factors, values)
+
+    def _make_hold(self, sentiment_factors: Dict[str, Any], values: Dict[str, Any]) -> Dict:
+        """HOLD fast path 결정 (cascade의 HOLD case와 동일한 결과)"""
+        _, confidence, template = _DECISION_TABLE[_HOLD_CASE]
+        return self._make_decision("HOLD", confidence, [template], sentiment_factors, values)
+
+    @staticmethod
+    def _make_decision(
+        action: str,
+        confidence: float,
+        reason_templates: List[str],
+        sentiment_factors: Dict[str, Any],
+        values: Dict[str, Any]
+    ) -> Dict:
+        """감성 수치(float)를 sentiment_factors에 기록하고 투표 dict 생성 (reasoning은 템플릿 1회 렌더링)"""
         sentiment_factors.update({
-            "overall_sentiment": f"{overall_sentiment:.2f}",
-            "twitter_sentiment": f"{twitter_sentiment:.2f}",
-            "reddit_sentiment": f"{reddit_sentiment:.2f}",
-            "sentiment_change_24h": f"{sentiment_change_24h:+.2f}",
-            "bullish_ratio": f"{bullish_ratio:.1%}"
+            "overall_sentiment": values["overall_sentiment"],
+            "twitter_sentiment": values["twitter_sentiment"],
+            "reddit_sentiment": values["reddit_sentiment"],
+            "sentiment_change_24h": values["sentiment_change_24h"],
+            "bullish_ratio": values["bullish_ratio"]
         })
 
         return {
             "agent": "sentiment",
             "action": action,
             "confidence": confidence,
-            "reasoning": reasoning,
-            "sentiment_factors": sentiment_factors
+            "reasoning": _REASON_SEPARATOR.join(t.format_map(values) for t in reason_templates),
+            "sentiment_factors": dict(sentiment_factors)  # 재사용 버퍼 → 호출자 소유 복사본
         }
 
-    async def _analyze_mock(self, ticker: str) -> Dict:
+    def _analyze_mock(self, ticker: str) -> Dict:
         """Mock sentiment analysis when real data unavailable"""
-        scenarios = [
-            {
-                "action": "BUY",
-                "confidence": 0.75,
-                "reasoning": "긍정 소셜 감성 (0.68) + Extreme Fear (22) - 역투자 기회",
-                "sentiment_factors": {
-                    "overall_sentiment": "0.68",
-                    "fear_greed": {"index": 22, "level": "EXTREME_FEAR", "signal": "CONTRARIAN_BUY"},
-                    "trending": {"rank": 12, "is_trending": True}
-                }
-            },
-            {
-                "action": "SELL",
-                "confidence": 0.80,
-                "reasoning": "부정 소셜 감성 (-0.52) + Extreme Greed (88) - 과열 조정 위험",
-                "sentiment_factors": {
-                    "overall_sentiment": "-0.52",
-                    "fear_greed": {"index": 88, "level": "EXTREME_GREED", "signal": "CONTRARIAN_SELL"},
-                    "trending": {"rank": 5, "is_trending": True}
-                }
-            },
-            {
-                "action": "HOLD",
-                "confidence": 0.60,
-                "reasoning": "중립 소셜 감성 (0.12), Fear & Greed 중립 (52) - 관망",
-                "sentiment_factors": {
-                    "overall_sentiment": "0.12",
-                    "fear_greed": {"index": 52, "level": "NEUTRAL", "signal": "NEUTRAL"},
-                    "trending": {"rank": 45, "is_trending": False}
-                }
-            }
-        ]
-
-        return {
-            "agent": "sentiment",
-            **random.choice(scenarios)
-        }
+        scenario = _MOCK_SCENARIOS[random.randrange(len(_MOCK_SCENARIOS))]
+        return {**scenario, "sentiment_factors": dict(scenario["sentiment_factors"])}
 
     def _fallback_response(self, ticker: str) -> Dict:
         """Fallback response on error"""
         return {
-            "agent": "sentiment",
-            "action": "HOLD",
-            "confidence": 0.50,
+            **_FALLBACK_SKELETON,
             "reasoning": f"소셜 감성 데이터 수신 실패 - {ticker} 관망 추천",
-            "sentiment_factors": {
-                "error": True
-            }
+            "sentiment_factors": {"error": True}
         }
 
     def _analyze_fear_greed(self, index: int) -> Dict[str, Any]:
@@ -280,40 +659,22 @@ class SentimentAgent:
             index: Fear & Greed Index (0-100)
 
         Returns:
+            구간별로 공유되는 읽기 전용 레코드
             {
                 "level": str,
-                "signal": str,  # CONTRARIAN_BUY/CONTRARIAN_SELL/NEUTRAL
-                "reasoning": str
+                "signal": str  # CONTRARIAN_BUY/CONTRARIAN_SELL/NEUTRAL
             }
+            (해석 문자열은 _fear_greed_reasoning(index)로 필요할 때 생성)
         """
-        if index < 25:
-            level = "EXTREME_FEAR"
-            signal = "CONTRARIAN_BUY"
-            reasoning = f"극도의 공포 ({index}) - 역투자 매수 기회"
-        elif index < 45:
-            level = "FEAR"
-            signal = "NEUTRAL"
-            reasoning = f"공포 ({index}) - 주의 필요"
-        elif index < 56:
-            level = "NEUTRAL"
-            signal = "NEUTRAL"
-            reasoning = f"중립 ({index}) - 정상 범위"
-        elif index < 76:
-            level = "GREED"
-            signal = "NEUTRAL"
-            reasoning = f"탐욕 ({index}) - 과열 주의"
-        else:  # >= 76
-            level = "EXTREME_GREED"
-            signal = "CONTRARIAN_SELL"
-            reasoning = f"극도의 탐욕 ({index}) - 과열 조정 경고"
-
-        return {
-            "level": level,
-            "signal": signal,
-            "reasoning": reasoning
-        }
-
-    def _detect_social_trends(self, social_data: Dict) -> Dict[str, Any]:
+        return _FG_TABLE[bisect_right(_FG_THRESHOLDS, index)]
+
+    def _detect_social_trends(
+        self,
+        twitter_volume: int,
+        reddit_mentions: int,
+        sentiment_change_24h: float,
+        bullish_ratio: float
+    ) -> Dict[str, Any]:
         """
         소셜 트렌드 감지
 
@@ -324,7 +685,10 @@ class SentimentAgent:
         - Retail frenzy (개인 투자자 열풍)
 
         Args:
-            social_data: 소셜 데이터
+            twitter_volume: Tweet count (24h)
+            reddit_mentions: Reddit mention count (24h)
+            sentiment_change_24h: Sentiment 24h change
+            bullish_ratio: % of bullish posts
 
         Returns:
             {
@@ -334,11 +698,6 @@ class SentimentAgent:
                 "coordination_detected": bool
             }
         """
-        twitter_volume = social_data.get("twitter_volume", 0)
-        reddit_mentions = social_data.get("reddit_mentions", 0)
-        sentiment_change_24h = social_data.get("sentiment_change_24h", 0)
-        bullish_ratio = social_data.get("bullish_ratio", 0.5)
-
         # WallStreetBets mentions (Reddit 기준)
         wsb_mentions = reddit_mentions  # 실제로는 특정 서브레딧 필터링 필요
 
@@ -9,13 +9,329 @@ Date: 2025-12-21
 Updated: 2025-12-27 - Added Support/Resistance detection, Multi-Timeframe analysis
 """
 
+import asyncio
+import hashlib
+import heapq
 import logging
-from typing import Dict, Any, Optional, List
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import deque
+from typing import Dict, Any, ClassVar, Final, Optional, List, Tuple
 from datetime import datetime, timedelta
+from itertools import product
+from types import MappingProxyType
 import random  # Temporary for mock implementation
 
+try:
+    import numpy as np
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:  # numpy is optional; pure-Python fallbacks are kept
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; the pivot scan then runs as plain Python
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# S/R, 볼린저밴드, 추세 계산 결과 캐시 최대 크기 (초과 시 비움)
+_CACHE_MAX = 256
+
+# 신호 보정 분기에서 쓰는 action 집합
+_BUY_HOLD: Final = frozenset({"BUY", "HOLD"})
+_SELL_HOLD: Final = frozenset({"SELL", "HOLD"})
+_BUY_SELL: Final = frozenset({"BUY", "SELL"})
+
+# RSI / 거래량 버킷 경계
+_OVERSOLD_RSI: Final = 30
+_NEUTRAL_RSI: Final = 50
+_RSI_UPPER_BOUNDS: Final = (70, 75)  # 과매수 / 강한 과매수
+_VOL_DECLINE_THRESH: Final = 0.8
+_VOL_UPPER_BOUNDS: Final = (1.2, 1.3)  # 거래량 증가 / 급증
+
+# 타임프레임 정렬 점수 경계
+_ALIGN_STRONG: Final = 0.8
+_ALIGN_MODERATE: Final = 0.6
+_ALIGN_WEAK: Final = 0.4
+_ALIGN_CONFLICT: Final = 0.3
+
+# 지지/저항선 근접 기준 (%)
+_SR_PROXIMITY_PCT: Final = 2.0
+
+# 볼린저밴드 폭 기준 (%)
+_BB_SQUEEZE_PCT: Final = 5.0
+_BB_EXPANSION_PCT: Final = 15.0
+
+# 최종 신뢰도 상한
+_CONFIDENCE_CAP: Final = 0.95
+
+
+# 볼린저밴드 가격 위치 구간 (경계: lower, 하단 1/3, 상단 1/3, upper)
+_BB_POSITIONS = ("BELOW_LOWER", "LOWER_THIRD", "MIDDLE", "UPPER_THIRD", "ABOVE_UPPER")
+_BB_SIGNALS = ("OVERSOLD", "NEUTRAL", "NEUTRAL", "NEUTRAL", "OVERBOUGHT")
+_BB_PRICE_POSITIONS = (
+    "하단 밴드 하회 (${lower:.2f})",
+    "하단 1/3 구간",
+    "중간 구간",
+    "상단 1/3 구간",
+    "상단 밴드 상회 (${upper:.2f})",
+)
+
+# 기본 매매 신호 결정 테이블: (rsi_bucket, ma_state, vol_bucket) -> (action, confidence, reasoning 템플릿)
+# rsi_bucket: 0: <30 / 1: 30-50 / 2: 50-70 / 3: 70-75 / 4: >75
+# ma_state:   0: MA20 > MA50 (골든크로스) / 1: MA20 < MA50 (데드크로스) / 2: 같음
+# vol_bucket: 0: <0.8 / 1: 0.8-1.2 / 2: 1.2-1.3 / 3: >1.3
+# confidence None → 거래량 증가율 비례 (_golden_cross_confidence)
+_MA_GOLDEN, _MA_DEAD, _MA_FLAT = 0, 1, 2
+_HOLD_TRENDS = ("상승", "하락", "횡보")
+
+
+def _build_decision_table() -> Dict[tuple, tuple]:
+    """기존 if/elif 규칙 (우선순위 순)을 5 × 3 × 4 버킷 조합마다 한 번 평가해 테이블 생성"""
+    table = {}
+    for rsi_bucket in range(5):
+        for ma_state in range(3):
+            for vol_bucket in range(4):
+                if ma_state == _MA_GOLDEN and rsi_bucket <= 1 and vol_bucket == 3:
+                    # Golden cross + RSI not overbought + volume increase
+                    rule = ("BUY", None, "골든크로스 발생 (MA20 > MA50), 거래량 증가 (+{volpct:.0f}%), RSI {rsi:.0f} (중립)")
+                elif rsi_bucket == 0 and vol_bucket >= 2:
+                    # Oversold + volume confirmation
+                    rule = ("BUY", 0.85, "과매도 구간 진입 (RSI {rsi:.0f}), 거래량 증가로 반등 가능성")
+                elif ma_state == _MA_DEAD and rsi_bucket >= 3:
+                    # Death cross + overbought
+                    rule = ("SELL", 0.80, "데드크로스 발생 (MA20 < MA50), 과매수 구간 (RSI {rsi:.0f})")
+                elif rsi_bucket == 4 and vol_bucket == 0:
+                    # Overbought + declining volume
+                    rule = ("SELL", 0.75, "과매수 + 거래량 감소 (RSI {rsi:.0f}, 거래량 {volpct:+.0f}%)")
+                else:
+                    # HOLD (neutral signals)
+                    rule = ("HOLD", 0.6, "관망 추천 (추세: " + _HOLD_TRENDS[ma_state] + ", RSI {rsi:.0f}, 거래량 변화 {volpct:+.0f}%)")
+                table[(rsi_bucket, ma_state, vol_bucket)] = rule
+    return table
+
+
+_DECISION_TABLE = _build_decision_table()
+
+
+def _bucket_rsi(rsi: float) -> int:
+    if rsi < _NEUTRAL_RSI:
+        return 0 if rsi < _OVERSOLD_RSI else 1
+    return 2 + bisect_left(_RSI_UPPER_BOUNDS, rsi)  # 70 < rsi → 3, 75 < rsi → 4
+
+
+def _bucket_ma(ma20: float, ma50: float) -> int:
+    return _MA_GOLDEN if ma20 > ma50 else _MA_DEAD if ma20 < ma50 else _MA_FLAT
+
+
+def _bucket_vol(volume_change: float) -> int:
+    if volume_change < _VOL_DECLINE_THRESH:
+        return 0
+    return 1 + bisect_left(_VOL_UPPER_BOUNDS, volume_change)  # 1.2 < v → 2, 1.3 < v → 3
+
+
+def _golden_cross_confidence(volume_change: float) -> float:
+    return min(0.90, 0.7 + (volume_change - 1.0) * 0.2)
+
+
+def _alignment_rule(daily_trend: str, weekly_trend: str, monthly_trend: str) -> float:
+    """타임프레임 정렬 점수 규칙 (TraderAgent._calculate_alignment_score 참고)"""
+    trends = [daily_trend, weekly_trend, monthly_trend]
+
+    # SIDEWAYS 제거 후 실제 추세만 확인
+    non_sideways_trends = [t for t in trends if t != "SIDEWAYS"]
+
+    # 모두 SIDEWAYS인 경우
+    if len(non_sideways_trends) == 0:
+        return 0.5  # 중립
+
+    # 실제 추세 일치도 확인
+    uptrend_count = trends.count("UPTREND")
+    downtrend_count = trends.count("DOWNTREND")
+    sideways_count = trends.count("SIDEWAYS")
+
+    # 모두 같은 방향
+    if uptrend_count == 3:
+        return 1.0  # 완벽한 상승 정렬
+    elif downtrend_count == 3:
+        return 1.0  # 완벽한 하락 정렬
+
+    # 2개 같은 방향
+    elif uptrend_count == 2:
+        return 0.75 if sideways_count == 1 else 0.66
+    elif downtrend_count == 2:
+        return 0.75 if sideways_count == 1 else 0.66
+
+    # 1개만 같은 방향 (충돌)
+    elif uptrend_count == 1 and downtrend_count == 1:
+        return 0.33  # 타임프레임 충돌
+
+    # SIDEWAYS 2개 + 추세 1개
+    elif sideways_count == 2:
+        return 0.5
+
+    # 모두 다른 방향 (최악)
+    else:
+        return 0.0
+
+
+# 타임프레임 정렬 점수 테이블: (daily, weekly, monthly) 추세 3^3 = 27개 조합을 모듈 로드 시 1회 평가
+_TRENDS = ("UPTREND", "DOWNTREND", "SIDEWAYS")
+_ALIGNMENT_TABLE = {key: _alignment_rule(*key) for key in product(_TRENDS, repeat=3)}
+
+
+# Mock 시나리오 (모듈 로드 시 1회 생성, 읽기 전용 - _analyze_mock은 복사본 반환)
+_MOCK_SCENARIOS = tuple(
+    MappingProxyType({
+        "agent": "trader",
+        **scenario,
+        "technical_factors": MappingProxyType(scenario["technical_factors"])
+    })
+    for scenario in (
+        {
+            "action": "BUY",
+            "confidence": 0.85,
+            "reasoning": "골든크로스 발생, 거래량 급증 (전일 대비 +150%), RSI 45 (중립 구간)",
+            "technical_factors": {
+                "trend": "UPTREND",
+                "rsi": 45,
+                "macd": "BULLISH_CROSS",
+                "volume_change": "+150%"
+            }
+        },
+        {
+            "action": "SELL",
+            "confidence": 0.75,
+            "reasoning": "과매수 구간 진입 (RSI 78), 데드크로스 발생, 거래량 감소 -20%",
+            "technical_factors": {
+                "trend": "DOWNTREND",
+                "rsi": 78,
+                "macd": "BEARISH_CROSS",
+                "volume_change": "-20%"
+            }
+        },
+        {
+            "action": "HOLD",
+            "confidence": 0.60,
+            "reasoning": "횡보 추세, RSI 중립 (52), 거래량 평균 수준, 방향성 불명확",
+            "technical_factors": {
+                "trend": "SIDEWAYS",
+                "rsi": 52,
+                "macd": "NEUTRAL",
+                "volume_change": "+5%"
+            }
+        },
+        {
+            "action": "BUY",
+            "confidence": 0.90,
+            "reasoning": "강한 지지선 반등, 돌파성 거래량 (+200%), MACD 골든크로스",
+            "technical_factors": {
+                "trend": "STRONG_UPTREND",
+                "rsi": 48,
+                "macd": "BULLISH_CROSS",
+                "volume_change": "+200%"
+            }
+        }
+    )
+)
+
+# _to_arrays가 변환하는 OHLCV 컬럼 (일봉: 지지/저항에 high/low 필요)
+_OHLCV_FIELDS = ("high", "low", "close")
+# 주봉/월봉은 추세 계산에 종가만 사용 (close만 있는 입력도 허용)
+_CLOSE_ONLY_FIELDS = ("close",)
+
+
+def _to_arrays(ohlcv_data: List[Dict], fields: Tuple[str, ...] = _OHLCV_FIELDS) -> Dict[str, Any]:
+    """
+    OHLCV 봉 목록 (AoS, list of dict) → 컬럼별 배열 (SoA) 변환
+
+    타임프레임당 한 번만 변환해 추세/지지저항/볼린저밴드 계산에 공유한다.
+    numpy가 있으면 float64 ndarray, 없으면 list.
+
+    Args:
+        ohlcv_data: OHLCV 봉 목록
+        fields: 추출할 컬럼 (기본: high/low/close)
+
+    Returns:
+        {"high": [...], "low": [...], "close": [...]}
+    """
+    if np is not None:
+        count = len(ohlcv_data)
+        return {
+            field: np.fromiter((bar[field] for bar in ohlcv_data), dtype=np.float64, count=count)
+            for field in fields
+        }
+    return {field: [bar[field] for bar in ohlcv_data] for field in fields}
+
+
+def _columns_digest(*columns) -> bytes:
+    """컬럼 배열 내용 기반 캐시 키 (float64 bytes → blake2b 16바이트)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for column in columns:
+        if np is not None and isinstance(column, np.ndarray):
+            digest.update(column.tobytes())
+        else:
+            digest.update(array('d', column).tobytes())
+    return digest.digest()
+
+
+def _pivot_scan(highs, lows):
+    """
+    Pivot High/Low 탐지 (좌우 5개 봉 비교, 첫 위반 시 즉시 중단)
+
+    Returns:
+        (resistance_levels, support_levels)  # 발견 순서의 pivot 가격 목록
+    """
+    resistance_levels = []
+    support_levels = []
+
+    for i in range(5, len(highs) - 5):
+        # Pivot High (저항선)
+        high = highs[i]
+        is_pivot = True
+        for k in range(1, 6):
+            if not (high > highs[i - k] and high > highs[i + k]):
+                is_pivot = False
+                break
+        if is_pivot:
+            resistance_levels.append(high)
+
+        # Pivot Low (지지선)
+        low = lows[i]
+        is_pivot = True
+        for k in range(1, 6):
+            if not (low < lows[i - k] and low < lows[i + k]):
+                is_pivot = False
+                break
+        if is_pivot:
+            support_levels.append(low)
+
+    return resistance_levels, support_levels
+
+
+# numba 설치 시 컴파일된 pivot scan (float64 ndarray 입력, analyze_batch 스레드에서 GIL 없이 실행)
+_pivot_scan_kernel = njit(cache=True, nogil=True)(_pivot_scan) if njit is not None else None
+
+
+def _pivot_scan_windows(highs, lows):
+    """
+    _pivot_scan의 NumPy 버전 (numba 없이 numpy만 있을 때)
+
+    길이 11 (좌5 + 중1 + 우5) sliding window view에서 중심값과 좌/우 5개 봉의
+    max/min을 한 번에 비교해 전체 pivot mask를 구한다 (Python 루프 없음).
+    """
+    win_h = sliding_window_view(highs, 11)
+    center_h = win_h[:, 5]
+    high_mask = (center_h > win_h[:, :5].max(axis=1)) & (center_h > win_h[:, 6:].max(axis=1))
+
+    win_l = sliding_window_view(lows, 11)
+    center_l = win_l[:, 5]
+    low_mask = (center_l < win_l[:, :5].min(axis=1)) & (center_l < win_l[:, 6:].min(axis=1))
+
+    return center_h[high_mask].tolist(), center_l[low_mask].tolist()
+
 
 class TraderAgent:
     """
@@ -26,10 +342,22 @@ class TraderAgent:
     - Entry/Exit Signals
     - Risk/Reward Calculation
     """
+
+    agent_name: ClassVar[str] = "trader"
+    vote_weight: ClassVar[float] = 0.15  # 15% voting weight
+
+    # 인스턴스 상태는 아래 캐시뿐 (__dict__ 없음)
+    __slots__ = ("_sr_cache", "_bb_cache", "_trend_cache", "_bb_state", "_bb_lock")
     
     def __init__(self):
-        self.agent_name = "trader"
-        self.vote_weight = 0.15  # 15% voting weight
+        # OHLCV 내용 digest 기반 결과 캐시 (같은 봉 데이터 재토론 시 재계산 생략, 결과는 읽기 전용)
+        self._sr_cache: Dict[bytes, Dict] = {}
+        self._bb_cache: Dict[tuple, Dict] = {}
+        self._trend_cache: Dict[bytes, str] = {}
+        # ticker -> 볼린저밴드 rolling 상태 {"window": deque, "mean", "m2", "last_len"} (봉 1개씩 추가될 때 O(1) 갱신)
+        self._bb_state: Dict[str, Dict[str, Any]] = {}
+        # analyze_batch 스레드 간 _bb_state 갱신 보호 (결과 캐시는 dict 단일 연산이라 별도 락 없음)
+        self._bb_lock = threading.RLock()
     
     async def analyze(self, ticker: str, context: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -48,22 +376,40 @@ class TraderAgent:
                 "technical_factors": {...}
             }
         """
+        return self._analyze_sync(ticker, context)
+
+    async def analyze_batch(self, items: List[Tuple[str, Optional[Dict]]]) -> List[Dict[str, Any]]:
+        """
+        여러 (ticker, context)를 워커 스레드에서 동시에 분석
+
+        계산은 모두 동기 CPU 작업이므로 asyncio.to_thread로 나눠 실행한다.
+        numba pivot kernel은 nogil로 컴파일되어 스레드 간 병렬 실행된다.
+
+        Returns:
+            items 순서대로 analyze()와 같은 형식의 결과 목록
+        """
+        return await asyncio.gather(
+            *(asyncio.to_thread(self._analyze_sync, ticker, context) for ticker, context in items)
+        )
+
+    def _analyze_sync(self, ticker: str, context: Optional[Dict] = None) -> Dict[str, Any]:
+        """analyze() 본문 (동기) - analyze / analyze_batch 공용"""
         try:
-            logger.info(f"[Trader Agent] Analyzing {ticker}")
+            logger.info("[Trader Agent] Analyzing %s", ticker)
             
             # TODO: Replace with real technical analysis
             # For now, use simplified logic based on context or randomization
             
             if context and "technical_data" in context:
-                return await self._analyze_with_real_data(ticker, context["technical_data"])
+                return self._analyze_with_real_data(ticker, context["technical_data"])
             else:
-                return await self._analyze_mock(ticker)
+                return self._analyze_mock(ticker)
         
         except Exception as e:
-            logger.error(f"[Trader Agent] Error analyzing {ticker}: {e}")
+            logger.error("[Trader Agent] Error analyzing %s: %s", ticker, e)
             return self._fallback_response(ticker)
     
-    async def _analyze_with_real_data(self, ticker: str, technical_data: Dict) -> Dict:
+    def _analyze_with_real_data(self, ticker: str, technical_data: Dict) -> Dict:
         """
         Analyze using real technical indicators.
 
@@ -105,11 +451,14 @@ class TraderAgent:
         ohlcv_weekly = technical_data.get("ohlcv_weekly", [])
         ohlcv_monthly = technical_data.get("ohlcv_monthly", [])
 
+        # 일봉 OHLCV → 컬럼 배열 한 번 변환 (추세/지지저항/볼린저밴드 공유)
+        daily_arrays = _to_arrays(ohlcv_data) if ohlcv_data else None
+
         if ohlcv_data and ohlcv_weekly and ohlcv_monthly:
             mtf_analysis = self._analyze_multi_timeframe(
-                daily_data=ohlcv_data,
-                weekly_data=ohlcv_weekly,
-                monthly_data=ohlcv_monthly
+                daily_data=daily_arrays,
+                weekly_data=_to_arrays(ohlcv_weekly, _CLOSE_ONLY_FIELDS),
+                monthly_data=_to_arrays(ohlcv_monthly, _CLOSE_ONLY_FIELDS)
             )
             technical_factors["multi_timeframe"] = {
                 "daily_trend": mtf_analysis["daily_trend"],
@@ -122,7 +471,7 @@ class TraderAgent:
         # Support/Resistance Analysis (if OHLCV data available)
         sr_analysis = None
         if ohlcv_data and len(ohlcv_data) >= 11:
-            sr_analysis = self._find_support_resistance(ohlcv_data)
+            sr_analysis = self._find_support_resistance(daily_arrays)
             technical_factors["support_resistance"] = {
                 "nearest_support": sr_analysis["nearest_support"],
                 "nearest_resistance": sr_analysis["nearest_resistance"],
@@ -137,7 +486,7 @@ class TraderAgent:
             bb_analysis = self._analyze_bollinger_bands(price, bollinger_bands)
         elif ohlcv_data and len(ohlcv_data) >= 20:
             # Calculate Bollinger Bands from OHLCV data
-            bb = self._calculate_bollinger_bands(ohlcv_data)
+            bb = self._bollinger_for_ticker(ticker, daily_arrays)
             bb_analysis = self._analyze_bollinger_bands(price, bb)
 
         if bb_analysis:
@@ -148,55 +497,30 @@ class TraderAgent:
                 "signal": bb_analysis["signal"]
             }
 
-        # BUY Signals
-        if ma20 > ma50 and rsi < 50 and volume_change > 1.3:
-            # Golden cross + RSI not overbought + volume increase
-            action = "BUY"
-            confidence = min(0.90, 0.7 + (volume_change - 1.0) * 0.2)
-            reasoning = f"골든크로스 발생 (MA20 > MA50), 거래량 증가 (+{(volume_change-1)*100:.0f}%), RSI {rsi:.0f} (중립)"
-
-        elif rsi < 30 and volume_change > 1.2:
-            # Oversold + volume confirmation
-            action = "BUY"
-            confidence = 0.85
-            reasoning = f"과매도 구간 진입 (RSI {rsi:.0f}), 거래량 증가로 반등 가능성"
-
-        # SELL Signals
-        elif ma20 < ma50 and rsi > 70:
-            # Death cross + overbought
-            action = "SELL"
-            confidence = 0.80
-            reasoning = f"데드크로스 발생 (MA20 < MA50), 과매수 구간 (RSI {rsi:.0f})"
-
-        elif rsi > 75 and volume_change < 0.8:
-            # Overbought + declining volume
-            action = "SELL"
-            confidence = 0.75
-            reasoning = f"과매수 + 거래량 감소 (RSI {rsi:.0f}, 거래량 {(volume_change-1)*100:+.0f}%)"
-
-        # HOLD (neutral signals)
-        else:
-            trend = "상승" if ma20 > ma50 else "하락" if ma20 < ma50 else "횡보"
-            reasoning = f"관망 추천 (추세: {trend}, RSI {rsi:.0f}, 거래량 변화 {(volume_change-1)*100:+.0f}%)"
-            confidence = 0.6
+        # BUY/SELL/HOLD 기본 신호 (결정 테이블 조회)
+        key = (_bucket_rsi(rsi), _bucket_ma(ma20, ma50), _bucket_vol(volume_change))
+        action, confidence, template = _DECISION_TABLE[key]
+        if confidence is None:
+            confidence = _golden_cross_confidence(volume_change)
+        reasoning_parts = [template.format(rsi=rsi, volpct=(volume_change - 1) * 100)]
 
         # Multi-Timeframe Alignment Boost/Penalty
         if mtf_analysis:
             alignment_score = mtf_analysis["alignment_score"]
             alignment_status = mtf_analysis["alignment_status"]
 
-            if alignment_score >= 0.8:
+            if alignment_score >= _ALIGN_STRONG:
                 # Strong alignment across all timeframes
                 confidence_boost += 0.2
-                reasoning += f" | 타임프레임 정렬 ({alignment_status}, {alignment_score:.2f})"
-            elif alignment_score >= 0.6:
+                reasoning_parts.append(f"타임프레임 정렬 ({alignment_status}, {alignment_score:.2f})")
+            elif alignment_score >= _ALIGN_MODERATE:
                 # Moderate alignment
                 confidence_boost += 0.1
-                reasoning += f" | 타임프레임 정렬 ({alignment_status}, {alignment_score:.2f})"
-            elif alignment_score <= 0.3:
+                reasoning_parts.append(f"타임프레임 정렬 ({alignment_status}, {alignment_score:.2f})")
+            elif alignment_score <= _ALIGN_CONFLICT:
                 # Conflicting timeframes - reduce confidence significantly
                 confidence_boost -= 0.3
-                reasoning += f" | 타임프레임 충돌 경고 ({alignment_status}, {alignment_score:.2f})"
+                reasoning_parts.append(f"타임프레임 충돌 경고 ({alignment_status}, {alignment_score:.2f})")
 
             # Cross-timeframe trend confirmation
             daily_trend = mtf_analysis["daily_trend"]
@@ -207,13 +531,13 @@ class TraderAgent:
             if action == "HOLD" and daily_trend == "UPTREND" and weekly_trend == "UPTREND" and monthly_trend == "UPTREND":
                 action = "BUY"
                 confidence = 0.75
-                reasoning = f"모든 타임프레임 상승세 (월봉/주봉/일봉 정렬) - 매수 기회"
+                reasoning_parts = [f"모든 타임프레임 상승세 (월봉/주봉/일봉 정렬) - 매수 기회"]
 
             # Override HOLD to SELL if all timeframes bearish
             elif action == "HOLD" and daily_trend == "DOWNTREND" and weekly_trend == "DOWNTREND" and monthly_trend == "DOWNTREND":
                 action = "SELL"
                 confidence = 0.75
-                reasoning = f"모든 타임프레임 하락세 (월봉/주봉/일봉 정렬) - 매도 신호"
+                reasoning_parts = [f"모든 타임프레임 하락세 (월봉/주봉/일봉 정렬) - 매도 신호"]
 
         # Support/Resistance Boost
         if sr_analysis:
@@ -223,23 +547,23 @@ class TraderAgent:
             nearest_resistance = sr_analysis['nearest_resistance']
 
             # 지지선 근처 (2% 이내) = 매수 기회
-            if action in ["BUY", "HOLD"] and support_dist and support_dist < 2.0:
+            if action in _BUY_HOLD and support_dist and support_dist < _SR_PROXIMITY_PCT:
                 confidence_boost += 0.15
-                reasoning += f" | 지지선 근처 매수 기회 (${nearest_support:.2f}, -{support_dist:.1f}%)"
+                reasoning_parts.append(f"지지선 근처 매수 기회 (${nearest_support:.2f}, -{support_dist:.1f}%)")
 
             # 저항선 돌파 = 강한 매수
             if action == "BUY" and nearest_resistance and price > nearest_resistance:
                 confidence_boost += 0.2
-                reasoning += f" | 저항선 돌파 (${nearest_resistance:.2f})"
+                reasoning_parts.append(f"저항선 돌파 (${nearest_resistance:.2f})")
 
             # 저항선 근처 (2% 이내) = 매도 압력
-            if action in ["SELL", "HOLD"] and resistance_dist and resistance_dist < 2.0:
+            if action in _SELL_HOLD and resistance_dist and resistance_dist < _SR_PROXIMITY_PCT:
                 if action == "HOLD":
                     action = "SELL"
                     confidence = 0.65
                 else:
                     confidence_boost += 0.1
-                reasoning += f" | 저항선 근처 매도 압력 (${nearest_resistance:.2f}, +{resistance_dist:.1f}%)"
+                reasoning_parts.append(f"저항선 근처 매도 압력 (${nearest_resistance:.2f}, +{resistance_dist:.1f}%)")
 
         # Bollinger Bands Signal Integration
         if bb_analysis:
@@ -248,43 +572,44 @@ class TraderAgent:
             band_width_pct = bb_analysis["band_width_pct"]
 
             # 과매도 구간 (하단 밴드 돌파)
-            if bb_signal == "OVERSOLD" and action in ["BUY", "HOLD"]:
+            if bb_signal == "OVERSOLD" and action in _BUY_HOLD:
                 if action == "HOLD":
                     action = "BUY"
                     confidence = 0.75
-                    reasoning = f"볼린저밴드 하단 돌파 (과매도) - 반등 매수 기회"
+                    reasoning_parts = [f"볼린저밴드 하단 돌파 (과매도) - 반등 매수 기회"]
                 else:
                     confidence_boost += 0.15
-                    reasoning += f" | 볼린저밴드 하단 ({bb_position})"
+                    reasoning_parts.append(f"볼린저밴드 하단 ({bb_position})")
 
             # 과매수 구간 (상단 밴드 돌파)
-            elif bb_signal == "OVERBOUGHT" and action in ["SELL", "HOLD"]:
+            elif bb_signal == "OVERBOUGHT" and action in _SELL_HOLD:
                 if action == "HOLD":
                     action = "SELL"
                     confidence = 0.70
-                    reasoning = f"볼린저밴드 상단 돌파 (과매수) - 조정 매도 신호"
+                    reasoning_parts = [f"볼린저밴드 상단 돌파 (과매수) - 조정 매도 신호"]
                 else:
                     confidence_boost += 0.1
-                    reasoning += f" | 볼린저밴드 상단 ({bb_position})"
+                    reasoning_parts.append(f"볼린저밴드 상단 ({bb_position})")
 
             # 밴드폭 축소 (Squeeze) - 변동성 축소 후 돌파 대기
             elif bb_signal == "SQUEEZE":
-                if band_width_pct < 5.0:  # 밴드폭 5% 미만
+                if band_width_pct < _BB_SQUEEZE_PCT:  # 밴드폭 5% 미만
                     # 변동성 축소 구간 - 관망
-                    if action == "BUY" or action == "SELL":
+                    if action in _BUY_SELL:
                         confidence_boost -= 0.1  # 신뢰도 감소
-                    reasoning += f" | 볼린저밴드 축소 (변동성 감소, 돌파 대기)"
+                    reasoning_parts.append(f"볼린저밴드 축소 (변동성 감소, 돌파 대기)")
 
             # 밴드폭 확장 (Expansion) - 강한 추세
             elif bb_signal == "EXPANSION":
-                if band_width_pct > 15.0:  # 밴드폭 15% 이상
+                if band_width_pct > _BB_EXPANSION_PCT:  # 밴드폭 15% 이상
                     # 강한 추세 진행 중
-                    if action == "BUY" or action == "SELL":
+                    if action in _BUY_SELL:
                         confidence_boost += 0.1
-                        reasoning += f" | 볼린저밴드 확장 (강한 추세)"
+                        reasoning_parts.append(f"볼린저밴드 확장 (강한 추세)")
 
         # Final confidence adjustment
-        confidence = min(0.95, confidence + confidence_boost)
+        confidence = min(_CONFIDENCE_CAP, confidence + confidence_boost)
+        reasoning = " | ".join(reasoning_parts)
 
         technical_factors.update({
             "trend": "UPTREND" if ma20 > ma50 else "DOWNTREND" if ma20 < ma50 else "SIDEWAYS",
@@ -303,65 +628,13 @@ class TraderAgent:
             "technical_factors": technical_factors
         }
     
-    async def _analyze_mock(self, ticker: str) -> Dict:
+    def _analyze_mock(self, ticker: str) -> Dict:
         """
         Mock analysis when real data is unavailable.
         Uses randomized but realistic patterns.
         """
-        # Simulate technical analysis with randomized but logical combinations
-        scenarios = [
-            {
-                "action": "BUY",
-                "confidence": 0.85,
-                "reasoning": "골든크로스 발생, 거래량 급증 (전일 대비 +150%), RSI 45 (중립 구간)",
-                "technical_factors": {
-                    "trend": "UPTREND",
-                    "rsi": 45,
-                    "macd": "BULLISH_CROSS",
-                    "volume_change": "+150%"
-                }
-            },
-            {
-                "action": "SELL",
-                "confidence": 0.75,
-                "reasoning": "과매수 구간 진입 (RSI 78), 데드크로스 발생, 거래량 감소 -20%",
-                "technical_factors": {
-                    "trend": "DOWNTREND",
-                    "rsi": 78,
-                    "macd": "BEARISH_CROSS",
-                    "volume_change": "-20%"
-                }
-            },
-            {
-                "action": "HOLD",
-                "confidence": 0.60,
-                "reasoning": "횡보 추세, RSI 중립 (52), 거래량 평균 수준, 방향성 불명확",
-                "technical_factors": {
-                    "trend": "SIDEWAYS",
-                    "rsi": 52,
-                    "macd": "NEUTRAL",
-                    "volume_change": "+5%"
-                }
-            },
-            {
-                "action": "BUY",
-                "confidence": 0.90,
-                "reasoning": "강한 지지선 반등, 돌파성 거래량 (+200%), MACD 골든크로스",
-                "technical_factors": {
-                    "trend": "STRONG_UPTREND",
-                    "rsi": 48,
-                    "macd": "BULLISH_CROSS",
-                    "volume_change": "+200%"
-                }
-            }
-        ]
-        
-        scenario = random.choice(scenarios)
-        
-        return {
-            "agent": "trader",
-            **scenario
-        }
+        scenario = _MOCK_SCENARIOS[random.randrange(len(_MOCK_SCENARIOS))]
+        return {**scenario, "technical_factors": dict(scenario["technical_factors"])}
     
     def _fallback_response(self, ticker: str) -> Dict:
         """Fallback conservative response on error"""
@@ -375,12 +648,12 @@ class TraderAgent:
             }
         }
 
-    def _find_support_resistance(self, ohlcv_data: List[Dict]) -> Dict:
+    def _find_support_resistance(self, arrays: Dict[str, Any]) -> Dict:
         """
         최근 고점/저점 기반 지지선/저항선 탐지 (Pivot Point 방식)
 
         Args:
-            ohlcv_data: List of OHLCV bars with keys: 'high', 'low', 'close'
+            arrays: OHLCV 컬럼 배열 (_to_arrays 결과) with keys: 'high', 'low', 'close'
 
         Returns:
             {
@@ -396,7 +669,11 @@ class TraderAgent:
         - Pivot High: 좌우 5개 봉보다 높은 고점 → 저항선
         - Pivot Low: 좌우 5개 봉보다 낮은 저점 → 지지선
         """
-        if len(ohlcv_data) < 11:  # 최소 11개 봉 필요 (좌5 + 중1 + 우5)
+        highs = arrays['high']
+        lows = arrays['low']
+        closes = arrays['close']
+
+        if len(closes) < 11:  # 최소 11개 봉 필요 (좌5 + 중1 + 우5)
             return {
                 "support_levels": [],
                 "resistance_levels": [],
@@ -406,43 +683,42 @@ class TraderAgent:
                 "resistance_distance_pct": None
             }
 
-        highs = [bar['high'] for bar in ohlcv_data]
-        lows = [bar['low'] for bar in ohlcv_data]
-
-        resistance_levels = []
-        support_levels = []
+        key = _columns_digest(highs, lows, closes)
+        cached = self._sr_cache.get(key)
+        if cached is not None:
+            return cached
 
         # Pivot Point 탐지 (좌우 5개 봉 확인)
-        for i in range(5, len(ohlcv_data) - 5):
-            # Pivot High (저항선)
-            left_highs = highs[i-5:i]
-            right_highs = highs[i+1:i+6]
-            if all(highs[i] > h for h in left_highs) and all(highs[i] > h for h in right_highs):
-                resistance_levels.append(highs[i])
-
-            # Pivot Low (지지선)
-            left_lows = lows[i-5:i]
-            right_lows = lows[i+1:i+6]
-            if all(lows[i] < l for l in left_lows) and all(lows[i] < l for l in right_lows):
-                support_levels.append(lows[i])
+        if _pivot_scan_kernel is not None:
+            resistance_levels, support_levels = _pivot_scan_kernel(highs, lows)
+        elif np is not None:
+            resistance_levels, support_levels = _pivot_scan_windows(highs, lows)
+        else:
+            resistance_levels, support_levels = _pivot_scan(highs, lows)
 
-        # 최근 3개 저항선/지지선만 사용 (내림차순 정렬)
-        resistance_levels = sorted(set(resistance_levels), reverse=True)[:3]
-        support_levels = sorted(set(support_levels), reverse=True)[:3]
+        # 상위 3개 저항선/지지선만 사용 (내림차순, 전체 정렬 없이 top-3 선택)
+        resistance_levels = heapq.nlargest(3, set(resistance_levels))
+        support_levels = heapq.nlargest(3, set(support_levels))
 
-        current_price = ohlcv_data[-1]['close']
+        current_price = float(closes[-1])
 
         # 현재가와 지지/저항 거리 계산
-        support_below = [s for s in support_levels if s < current_price]
-        resistance_above = [r for r in resistance_levels if r > current_price]
-
-        nearest_support = max(support_below) if support_below else None
-        nearest_resistance = min(resistance_above) if resistance_above else None
+        if np is not None:
+            # 마스크 필터 + max/min을 float64 배열에서 처리
+            support_arr = np.asarray(support_levels, dtype=np.float64)
+            resistance_arr = np.asarray(resistance_levels, dtype=np.float64)
+            support_below = support_arr[support_arr < current_price]
+            resistance_above = resistance_arr[resistance_arr > current_price]
+            nearest_support = float(support_below.max()) if support_below.size else None
+            nearest_resistance = float(resistance_above.min()) if resistance_above.size else None
+        else:
+            nearest_support = max((s for s in support_levels if s < current_price), default=None)
+            nearest_resistance = min((r for r in resistance_levels if r > current_price), default=None)
 
         support_distance_pct = ((current_price - nearest_support) / current_price * 100) if nearest_support else None
         resistance_distance_pct = ((nearest_resistance - current_price) / current_price * 100) if nearest_resistance else None
 
-        return {
+        result = {
             "support_levels": support_levels,
             "resistance_levels": resistance_levels,
             "nearest_support": nearest_support,
@@ -450,8 +726,12 @@ class TraderAgent:
             "support_distance_pct": support_distance_pct,
             "resistance_distance_pct": resistance_distance_pct
         }
+        if len(self._sr_cache) >= _CACHE_MAX:
+            self._sr_cache.clear()
+        self._sr_cache[key] = result
+        return result
 
-    def _analyze_multi_timeframe(self, daily_data: List[Dict], weekly_data: List[Dict], monthly_data: List[Dict]) -> Dict:
+    def _analyze_multi_timeframe(self, daily_data: Dict[str, Any], weekly_data: Dict[str, Any], monthly_data: Dict[str, Any]) -> Dict:
         """
         멀티 타임프레임 분석 (일봉, 주봉, 월봉)
 
@@ -460,9 +740,9 @@ class TraderAgent:
         - 상위 타임프레임 추세와 일치할 때만 강한 신호
 
         Args:
-            daily_data: 최근 100일 OHLCV 데이터
-            weekly_data: 최근 52주 OHLCV 데이터
-            monthly_data: 최근 20개월 OHLCV 데이터
+            daily_data: 최근 100일 OHLCV 컬럼 배열 (_to_arrays 결과)
+            weekly_data: 최근 52주 종가 컬럼 배열
+            monthly_data: 최근 20개월 종가 컬럼 배열
 
         Returns:
             {
@@ -482,11 +762,11 @@ class TraderAgent:
         alignment_score = self._calculate_alignment_score(daily_trend, weekly_trend, monthly_trend)
 
         # 3. 정렬 상태 분류
-        if alignment_score >= 0.8:
+        if alignment_score >= _ALIGN_STRONG:
             alignment_status = "STRONG"  # 강한 정렬
-        elif alignment_score >= 0.6:
+        elif alignment_score >= _ALIGN_MODERATE:
             alignment_status = "MODERATE"  # 보통 정렬
-        elif alignment_score >= 0.4:
+        elif alignment_score >= _ALIGN_WEAK:
             alignment_status = "WEAK"  # 약한 정렬
         else:
             alignment_status = "CONFLICTING"  # 충돌 (타임프레임 간 불일치)
@@ -499,7 +779,7 @@ class TraderAgent:
             "alignment_status": alignment_status
         }
 
-    def _calculate_trend(self, ohlcv_data: List[Dict], timeframe: str = "daily") -> str:
+    def _calculate_trend(self, arrays: Dict[str, Any], timeframe: str = "daily") -> str:
         """
         OHLCV 데이터로부터 추세 계산
 
@@ -509,28 +789,42 @@ class TraderAgent:
         - 그 외: 횡보
 
         Args:
-            ohlcv_data: OHLCV 봉 데이터
+            arrays: OHLCV 컬럼 배열 (_to_arrays 결과)
             timeframe: "daily"|"weekly"|"monthly"
 
         Returns:
             "UPTREND"|"DOWNTREND"|"SIDEWAYS"
         """
-        if len(ohlcv_data) < 50:
+        closes = arrays['close']
+        if len(closes) < 50:
             return "SIDEWAYS"  # 데이터 부족
 
-        closes = [bar['close'] for bar in ohlcv_data]
+        # 추세는 최근 50개 종가로만 결정 → 그 구간 digest로 캐시 (타임프레임별로 재사용)
+        key = _columns_digest(closes[-50:])
+        trend = self._trend_cache.get(key)
+        if trend is not None:
+            return trend
 
         # 이동평균 계산
-        ma20 = sum(closes[-20:]) / 20
-        ma50 = sum(closes[-50:]) / 50
+        if np is not None:
+            ma20 = closes[-20:].mean()
+            ma50 = closes[-50:].mean()
+        else:
+            ma20 = sum(closes[-20:]) / 20
+            ma50 = sum(closes[-50:]) / 50
 
         # 추세 판단
         if ma20 > ma50 * 1.02:  # 2% 이상 차이
-            return "UPTREND"
+            trend = "UPTREND"
         elif ma20 < ma50 * 0.98:  # 2% 이상 차이
-            return "DOWNTREND"
+            trend = "DOWNTREND"
         else:
-            return "SIDEWAYS"
+            trend = "SIDEWAYS"
+
+        if len(self._trend_cache) >= _CACHE_MAX:
+            self._trend_cache.clear()
+        self._trend_cache[key] = trend
+        return trend
 
     def _calculate_alignment_score(self, daily_trend: str, weekly_trend: str, monthly_trend: str) -> float:
         """
@@ -553,45 +847,11 @@ class TraderAgent:
         Returns:
             0.0-1.0 점수
         """
-        trends = [daily_trend, weekly_trend, monthly_trend]
-
-        # SIDEWAYS 제거 후 실제 추세만 확인
-        non_sideways_trends = [t for t in trends if t != "SIDEWAYS"]
-
-        # 모두 SIDEWAYS인 경우
-        if len(non_sideways_trends) == 0:
-            return 0.5  # 중립
-
-        # 실제 추세 일치도 확인
-        uptrend_count = trends.count("UPTREND")
-        downtrend_count = trends.count("DOWNTREND")
-        sideways_count = trends.count("SIDEWAYS")
-
-        # 모두 같은 방향
-        if uptrend_count == 3:
-            return 1.0  # 완벽한 상승 정렬
-        elif downtrend_count == 3:
-            return 1.0  # 완벽한 하락 정렬
-
-        # 2개 같은 방향
-        elif uptrend_count == 2:
-            return 0.75 if sideways_count == 1 else 0.66
-        elif downtrend_count == 2:
-            return 0.75 if sideways_count == 1 else 0.66
+        key = (daily_trend, weekly_trend, monthly_trend)
+        score = _ALIGNMENT_TABLE.get(key)
+        return score if score is not None else _alignment_rule(*key)
 
-        # 1개만 같은 방향 (충돌)
-        elif uptrend_count == 1 and downtrend_count == 1:
-            return 0.33  # 타임프레임 충돌
-
-        # SIDEWAYS 2개 + 추세 1개
-        elif sideways_count == 2:
-            return 0.5
-
-        # 모두 다른 방향 (최악)
-        else:
-            return 0.0
-
-    def _calculate_bollinger_bands(self, ohlcv_data: List[Dict], period: int = 20, std_dev: float = 2.0) -> Dict:
+    def _calculate_bollinger_bands(self, arrays: Dict[str, Any], period: int = 20, std_dev: float = 2.0) -> Dict:
         """
         볼린저밴드 계산
 
@@ -601,7 +861,7 @@ class TraderAgent:
         - Lower Band: Middle - (2 × 표준편차)
 
         Args:
-            ohlcv_data: OHLCV 데이터
+            arrays: OHLCV 컬럼 배열 (_to_arrays 결과)
             period: 이동평균 기간 (기본 20)
             std_dev: 표준편차 배수 (기본 2.0)
 
@@ -612,33 +872,135 @@ class TraderAgent:
                 "lower": float  # 하단 밴드
             }
         """
-        if len(ohlcv_data) < period:
+        all_closes = arrays['close']
+        if len(all_closes) < period:
             # 데이터 부족 - 현재가 기준 임시값
-            current_price = ohlcv_data[-1]['close'] if ohlcv_data else 0
+            current_price = float(all_closes[-1]) if len(all_closes) else 0
             return {
                 "upper": current_price * 1.1,
                 "middle": current_price,
                 "lower": current_price * 0.9
             }
 
-        closes = [bar['close'] for bar in ohlcv_data[-period:]]
+        closes = all_closes[-period:]
+        key = (_columns_digest(closes), period, std_dev)
+        cached = self._bb_cache.get(key)
+        if cached is not None:
+            return cached
 
-        # Middle Band (SMA)
-        middle = sum(closes) / period
-
-        # 표준편차 계산
-        variance = sum((c - middle) ** 2 for c in closes) / period
-        std = variance ** 0.5
+        if np is not None:
+            # NumPy: 평균/표준편차를 C 루프에서 계산 (모표준편차, ddof=0)
+            middle = float(closes.mean())
+            std = float(closes.std())
+        else:
+            # Welford 단일 패스: 평균(Middle Band, SMA)과 편차제곱합을 한 번에 누적
+            middle = m2 = 0.0
+            for count, c in enumerate(closes, 1):
+                delta = c - middle
+                middle += delta / count
+                m2 += delta * (c - middle)
+            std = (m2 / period) ** 0.5
 
         # Upper/Lower Bands
         upper = middle + (std_dev * std)
         lower = middle - (std_dev * std)
 
-        return {
+        bands = {
             "upper": upper,
             "middle": middle,
             "lower": lower
         }
+        if len(self._bb_cache) >= _CACHE_MAX:
+            self._bb_cache.clear()
+        self._bb_cache[key] = bands
+        return bands
+
+    def _bollinger_for_ticker(self, ticker: str, arrays: Dict[str, Any], period: int = 20, std_dev: float = 2.0) -> Dict:
+        """
+        ticker별 rolling 상태를 활용한 볼린저밴드 계산
+
+        직전 호출 이후 봉이 정확히 1개 추가된 경우 (길이 +1, 새 봉 직전 period개 종가가
+        저장된 window와 일치) _update_bollinger_incremental로 갱신하고, 그 외에는 (과거 봉 수정 포함)
+        전체 계산 후 상태를 다시 초기화한다.
+        """
+        with self._bb_lock:
+            closes = arrays['close']
+            state = self._bb_state.get(ticker)
+            if (state is not None
+                    and state["window"].maxlen == period
+                    and len(state["window"]) == period
+                    and state["last_len"] == len(closes) - 1
+                    and list(state["window"]) == [float(c) for c in closes[-period - 1:-1]]):
+                return self._update_bollinger_incremental(ticker, float(closes[-1]), period, std_dev)
+
+            bands = self._calculate_bollinger_bands(arrays, period, std_dev)
+            if len(closes) >= period:
+                self._seed_bollinger_state(ticker, closes, period)
+            return bands
+
+    def _seed_bollinger_state(self, ticker: str, closes, period: int = 20) -> None:
+        """최근 period개 종가로 ticker의 rolling 상태 초기화 (평균/편차제곱합은 two-pass로 정확히 계산)"""
+        window = deque((float(c) for c in closes[-period:]), maxlen=period)
+        mean = sum(window) / len(window)
+        m2 = sum((c - mean) ** 2 for c in window)
+
+        if ticker not in self._bb_state and len(self._bb_state) >= _CACHE_MAX:
+            self._bb_state.clear()
+        self._bb_state[ticker] = {"window": window, "mean": mean, "m2": m2, "last_len": len(closes)}
+
+    def _update_bollinger_incremental(
+        self,
+        ticker: str,
+        new_close: float,
+        period: int = 20,
+        std_dev: float = 2.0
+    ) -> Optional[Dict]:
+        """
+        새 종가 1개로 ticker의 볼린저밴드 상태를 O(1) 갱신 (실시간 봉 추가용)
+
+        window가 가득 차면 가장 오래된 종가를 빼고 새 종가를 더하는 sliding 갱신,
+        아직 period개 미만이면 Welford 누적. 평균/분산은 (mean, m2)로 유지해
+        sum/sum_sq 방식의 상쇄 오차를 피한다.
+
+        Returns:
+            {"upper", "middle", "lower"} 또는 None (종가가 period개 미만)
+        """
+        with self._bb_lock:
+            state = self._bb_state.get(ticker)
+            if state is None or state["window"].maxlen != period:
+                if ticker not in self._bb_state and len(self._bb_state) >= _CACHE_MAX:
+                    self._bb_state.clear()
+                state = self._bb_state[ticker] = {"window": deque(maxlen=period), "mean": 0.0, "m2": 0.0, "last_len": 0}
+
+            window = state["window"]
+            mean = state["mean"]
+            m2 = state["m2"]
+
+            if len(window) == period:
+                old_close = window[0]
+                delta = new_close - old_close
+                new_mean = mean + delta / period
+                m2 += delta * (new_close - new_mean + old_close - mean)
+                mean = new_mean
+            else:
+                delta = new_close - mean
+                mean += delta / (len(window) + 1)
+                m2 += delta * (new_close - mean)
+
+            window.append(new_close)
+            state["mean"] = mean
+            state["m2"] = max(m2, 0.0)
+            state["last_len"] += 1
+
+            if len(window) < period:
+                return None
+
+            std = (state["m2"] / period) ** 0.5
+            return {
+                "upper": mean + (std_dev * std),
+                "middle": mean,
+                "lower": mean - (std_dev * std)
+            }
 
     def _analyze_bollinger_bands(self, current_price: float, bands: Dict) -> Dict:
         """
@@ -669,33 +1031,23 @@ class TraderAgent:
         # 밴드폭 계산 (%)
         band_width_pct = ((upper - lower) / middle) * 100 if middle > 0 else 0
 
-        # 가격 위치 판단
-        if current_price < lower:
-            position = "BELOW_LOWER"
-            signal = "OVERSOLD"
-            price_position = f"하단 밴드 하회 (${lower:.2f})"
-        elif current_price < lower + (middle - lower) * 0.33:
-            position = "LOWER_THIRD"
-            signal = "NEUTRAL"
-            price_position = "하단 1/3 구간"
-        elif current_price < middle + (upper - middle) * 0.33:
-            position = "MIDDLE"
-            signal = "NEUTRAL"
-            price_position = "중간 구간"
-        elif current_price < upper:
-            position = "UPPER_THIRD"
-            signal = "NEUTRAL"
-            price_position = "상단 1/3 구간"
-        else:  # current_price >= upper
-            position = "ABOVE_UPPER"
-            signal = "OVERBOUGHT"
-            price_position = f"상단 밴드 상회 (${upper:.2f})"
+        # 가격 위치 판단: 경계값 이하 개수 = 구간 번호 (경계와 같으면 위 구간, current_price >= upper → ABOVE_UPPER)
+        boundaries = (
+            lower,
+            lower + (middle - lower) * 0.33,
+            middle + (upper - middle) * 0.33,
+            upper
+        )
+        zone = bisect_right(boundaries, current_price)
+        position = _BB_POSITIONS[zone]
+        signal = _BB_SIGNALS[zone]
+        price_position = _BB_PRICE_POSITIONS[zone].format(lower=lower, upper=upper)
 
         # 밴드폭 기반 추가 신호
         if signal == "NEUTRAL":
-            if band_width_pct < 5.0:
+            if band_width_pct < _BB_SQUEEZE_PCT:
                 signal = "SQUEEZE"  # 변동성 축소
-            elif band_width_pct > 15.0:
+            elif band_width_pct > _BB_EXPANSION_PCT:
                 signal = "EXPANSION"  # 변동성 확대
 
         return {
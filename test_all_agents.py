@@ -29,393 +29,332 @@ os.chdir(backend_path)
 os.environ["TESTING"] = "true"
 
 import asyncio
+import io
 from decimal import Decimal
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
+
+try:
+    import uvloop
+except ImportError:  # uvloop is optional; the default asyncio loop is used instead
+    uvloop = None
 
 # Import all agents
 from ai.debate.risk_agent import RiskAgent
-from ai.debate.trader_agent import TraderAgent
+from ai.debate.trader_agent import TraderAgent, _to_arrays
 from ai.debate.analyst_agent import AnalystAgent
 from ai.debate.chip_war_agent import ChipWarAgent
 from ai.debate.news_agent import NewsAgent
 from ai.debate.macro_agent import MacroAgent
 from ai.debate.institutional_agent import InstitutionalAgent
 from ai.debate.sentiment_agent import SentimentAgent
+from ai.debate._vote_kernel import ACTIONS, ACTION_CODES, tally
+
+
+# ========== Report Buffer ==========
+
+# 테스트 결과 출력은 버퍼에 모았다가 phase 단위로 한 번에 출력 (줄마다 write() 호출 방지)
+_report = io.StringIO()
+
+
+def log(line=""):
+    """리포트 버퍼에 한 줄 추가"""
+    _report.write(line + "\n")
+
+
+def flush_report():
+    """버퍼 내용을 stdout에 한 번에 출력하고 비움"""
+    sys.stdout.write(_report.getvalue())
+    sys.stdout.flush()
+    _report.seek(0)
+    _report.truncate()
+
+
+# ========== Shared Agents ==========
+
+@lru_cache(maxsize=None)
+def get_agent(agent_cls):
+    """에이전트 클래스별 인스턴스 1개를 생성해 모든 테스트에서 공유"""
+    return agent_cls()
 
 
 # ========== Mock Data ==========
 
+# Mock 데이터는 모듈 로드 시 1회 생성 (읽기 전용, 모든 테스트가 같은 객체 공유)
+_NOW = datetime.now()
+
+_MARKET_DATA = MappingProxyType({
+    "current_price": 175.50,
+    "volume": 65000000,
+    "high": 177.20,
+    "low": 174.80,
+    "open": 175.00,
+    "prev_close": 174.50,
+    "market_cap": 2800000000000,
+    "pe_ratio": 28.5,
+    "dividend_yield": 0.52,
+    "beta": 1.25,
+    "avg_volume_30d": 55000000,
+    "high_52w": 198.50,
+    "low_52w": 142.30,
+    "revenue_growth": 0.085,
+    "profit_margin": 0.255,
+    "rsi": 58.5,
+    "sma_20": 173.20,
+    "sma_50": 170.80,
+    "sma_200": 165.50,
+    "returns": (0.01, -0.015, 0.02, -0.01, 0.005, -0.008, 0.012, -0.018)
+})
+
+_MACRO_DATA = MappingProxyType({
+    "fed_rate": 5.25,
+    "fed_direction": "HOLDING",
+    "cpi_yoy": 3.2,
+    "gdp_growth": 2.5,
+    "unemployment": 3.7,
+    "yield_curve": -0.15,
+    "wti_crude": 75.50,
+    "wti_change_30d": 5.2,
+    "dxy": 102.5,
+    "dxy_change_30d": 2.8
+})
+
+_INSTITUTIONAL_DATA = MappingProxyType({
+    "institutional_ownership": 0.645,
+    "institutional_change_qoq": 0.028,
+    "top_holders_count": 15,
+    "insider_ownership": 0.058,
+    "insider_transactions_3m": 8,
+    "insider_buy_sell_ratio": 0.75
+})
+
+_SENTIMENT_DATA = MappingProxyType({
+    "twitter_sentiment": 0.55,
+    "twitter_volume": 12000,
+    "reddit_sentiment": 0.48,
+    "reddit_mentions": 850,
+    "fear_greed_index": 52,
+    "trending_rank": 15,
+    "sentiment_change_24h": 0.08,
+    "bullish_ratio": 0.62
+})
+
+_NEWS_DATA = (
+    MappingProxyType({
+        "title": "Apple announces new AI chip partnership",
+        "content": "Apple announced a major partnership with TSMC for next-generation AI chips...",
+        "source": "Reuters",
+        "published_at": _NOW - timedelta(hours=2),
+        "sentiment": 0.75
+    }),
+    MappingProxyType({
+        "title": "iPhone sales beat expectations in Q4",
+        "content": "Strong iPhone 15 sales drove Apple's revenue growth in the fourth quarter...",
+        "source": "Bloomberg",
+        "published_at": _NOW - timedelta(hours=5),
+        "sentiment": 0.65
+    }),
+    MappingProxyType({
+        "title": "Concerns over Apple's China market exposure",
+        "content": "Analysts express caution about Apple's heavy reliance on Chinese manufacturing...",
+        "source": "CNBC",
+        "published_at": _NOW - timedelta(hours=8),
+        "sentiment": -0.45
+    })
+)
+
+_CHIPWAR_DATA = MappingProxyType({
+    "us_export_controls": True,
+    "china_restrictions": "MEDIUM",
+    "taiwan_tensions": "LOW",
+    "semiconductor_demand": "HIGH",
+    "supply_chain_risk": "MEDIUM",
+    "government_subsidies": "US_CHIPS_ACT",
+    "competitor_moves": ("TSMC expanding US fabs", "Samsung investing in Texas"),
+    "geopolitical_events": ("US-China tech dialogue scheduled",)
+})
+
+
 def get_mock_market_data():
     """Mock market data for testing"""
-    return {
-        "current_price": 175.50,
-        "volume": 65000000,
-        "high": 177.20,
-        "low": 174.80,
-        "open": 175.00,
-        "prev_close": 174.50,
-        "market_cap": 2800000000000,
-        "pe_ratio": 28.5,
-        "dividend_yield": 0.52,
-        "beta": 1.25,
-        "avg_volume_30d": 55000000,
-        "high_52w": 198.50,
-        "low_52w": 142.30,
-        "revenue_growth": 0.085,
-        "profit_margin": 0.255,
-        "rsi": 58.5,
-        "sma_20": 173.20,
-        "sma_50": 170.80,
-        "sma_200": 165.50,
-        "returns": [0.01, -0.015, 0.02, -0.01, 0.005, -0.008, 0.012, -0.018]
-    }
+    return _MARKET_DATA
 
 
 def get_mock_macro_data():
     """Mock macro data for testing"""
-    return {
-        "fed_rate": 5.25,
-        "fed_direction": "HOLDING",
-        "cpi_yoy": 3.2,
-        "gdp_growth": 2.5,
-        "unemployment": 3.7,
-        "yield_curve": -0.15,
-        "wti_crude": 75.50,
-        "wti_change_30d": 5.2,
-        "dxy": 102.5,
-        "dxy_change_30d": 2.8
-    }
+    return _MACRO_DATA
 
 
 def get_mock_institutional_data():
     """Mock institutional data for testing"""
-    return {
-        "institutional_ownership": 0.645,
-        "institutional_change_qoq": 0.028,
-        "top_holders_count": 15,
-        "insider_ownership": 0.058,
-        "insider_transactions_3m": 8,
-        "insider_buy_sell_ratio": 0.75
-    }
+    return _INSTITUTIONAL_DATA
 
 
 def get_mock_sentiment_data():
     """Mock sentiment data for testing"""
-    return {
-        "twitter_sentiment": 0.55,
-        "twitter_volume": 12000,
-        "reddit_sentiment": 0.48,
-        "reddit_mentions": 850,
-        "fear_greed_index": 52,
-        "trending_rank": 15,
-        "sentiment_change_24h": 0.08,
-        "bullish_ratio": 0.62
-    }
+    return _SENTIMENT_DATA
 
 
 def get_mock_news_data():
     """Mock news data for testing"""
-    return [
-        {
-            "title": "Apple announces new AI chip partnership",
-            "content": "Apple announced a major partnership with TSMC for next-generation AI chips...",
-            "source": "Reuters",
-            "published_at": datetime.now() - timedelta(hours=2),
-            "sentiment": 0.75
-        },
-        {
-            "title": "iPhone sales beat expectations in Q4",
-            "content": "Strong iPhone 15 sales drove Apple's revenue growth in the fourth quarter...",
-            "source": "Bloomberg",
-            "published_at": datetime.now() - timedelta(hours=5),
-            "sentiment": 0.65
-        },
-        {
-            "title": "Concerns over Apple's China market exposure",
-            "content": "Analysts express caution about Apple's heavy reliance on Chinese manufacturing...",
-            "source": "CNBC",
-            "published_at": datetime.now() - timedelta(hours=8),
-            "sentiment": -0.45
-        }
-    ]
+    return _NEWS_DATA
 
 
 def get_mock_chipwar_data():
     """Mock ChipWar data for testing"""
-    return {
-        "us_export_controls": True,
-        "china_restrictions": "MEDIUM",
-        "taiwan_tensions": "LOW",
-        "semiconductor_demand": "HIGH",
-        "supply_chain_risk": "MEDIUM",
-        "government_subsidies": "US_CHIPS_ACT",
-        "competitor_moves": ["TSMC expanding US fabs", "Samsung investing in Texas"],
-        "geopolitical_events": ["US-China tech dialogue scheduled"]
-    }
-
-
-# ========== Individual Agent Tests ==========
-
-async def test_risk_agent():
-    """Test Risk Agent (20% voting weight)"""
-    print("\n" + "="*80)
-    print("TEST: Risk Agent (20%)")
-    print("="*80)
-
-    agent = RiskAgent()
-    market_data = get_mock_market_data()
-
-    result = await agent.analyze("AAPL", market_data)
-
-    assert "action" in result, "Missing 'action' field"
-    assert "confidence" in result, "Missing 'confidence' field"
-    assert "reasoning" in result, "Missing 'reasoning' field"
-    assert result["action"] in ["BUY", "SELL", "HOLD"], f"Invalid action: {result['action']}"
-    assert 0.0 <= result["confidence"] <= 1.0, f"Invalid confidence: {result['confidence']}"
-
-    print(f"✓ Action: {result['action']}")
-    print(f"✓ Confidence: {result['confidence']:.2f}")
-    print(f"✓ Reasoning: {result['reasoning'][:100]}...")
-
-    return result
-
-
-async def test_trader_agent():
-    """Test Trader Agent (15% voting weight)"""
-    print("\n" + "="*80)
-    print("TEST: Trader Agent (15%)")
-    print("="*80)
-
-    agent = TraderAgent()
-    market_data = get_mock_market_data()
-
-    result = await agent.analyze("AAPL", market_data)
-
-    assert "action" in result
-    assert "confidence" in result
-    assert "reasoning" in result
-    assert result["action"] in ["BUY", "SELL", "HOLD"]
-    assert 0.0 <= result["confidence"] <= 1.0
-
-    print(f"✓ Action: {result['action']}")
-    print(f"✓ Confidence: {result['confidence']:.2f}")
-    print(f"✓ Reasoning: {result['reasoning'][:100]}...")
-
-    return result
-
-
-async def test_analyst_agent():
-    """Test Analyst Agent (15% voting weight)"""
-    print("\n" + "="*80)
-    print("TEST: Analyst Agent (15%)")
-    print("="*80)
-
-    agent = AnalystAgent()
-    market_data = get_mock_market_data()
-
-    result = await agent.analyze("AAPL", market_data)
-
-    assert "action" in result
-    assert "confidence" in result
-    assert "reasoning" in result
-    assert result["action"] in ["BUY", "SELL", "HOLD"]
-    assert 0.0 <= result["confidence"] <= 1.0
-
-    print(f"✓ Action: {result['action']}")
-    print(f"✓ Confidence: {result['confidence']:.2f}")
-    print(f"✓ Reasoning: {result['reasoning'][:100]}...")
-
-    return result
-
-
-async def test_chipwar_agent():
-    """Test ChipWar Agent (12% voting weight)"""
-    print("\n" + "="*80)
-    print("TEST: ChipWar Agent (12%)")
-    print("="*80)
-
-    agent = ChipWarAgent()
-    chipwar_data = get_mock_chipwar_data()
-
-    result = await agent.analyze("AAPL", chipwar_data)
-
-    assert "action" in result
-    assert "confidence" in result
-    assert "reasoning" in result
-    assert result["action"] in ["BUY", "SELL", "HOLD"]
-    assert 0.0 <= result["confidence"] <= 1.0
-
-    print(f"✓ Action: {result['action']}")
-    print(f"✓ Confidence: {result['confidence']:.2f}")
-    print(f"✓ Reasoning: {result['reasoning'][:100]}...")
-
-    return result
-
+    return _CHIPWAR_DATA
 
-async def test_news_agent():
-    """Test News Agent (10% voting weight)"""
-    print("\n" + "="*80)
-    print("TEST: News Agent (10%)")
-    print("="*80)
-
-    agent = NewsAgent()
-    news_data = get_mock_news_data()
-
-    result = await agent.analyze("AAPL", news_data)
-
-    assert "action" in result
-    assert "confidence" in result
-    assert "reasoning" in result
-    assert result["action"] in ["BUY", "SELL", "HOLD"]
-    assert 0.0 <= result["confidence"] <= 1.0
-
-    print(f"✓ Action: {result['action']}")
-    print(f"✓ Confidence: {result['confidence']:.2f}")
-    print(f"✓ Reasoning: {result['reasoning'][:100]}...")
-
-    return result
-
-
-async def test_macro_agent():
-    """Test Macro Agent (10% voting weight)"""
-    print("\n" + "="*80)
-    print("TEST: Macro Agent (10%)")
-    print("="*80)
-
-    agent = MacroAgent()
-    macro_data = get_mock_macro_data()
-
-    result = await agent.analyze("AAPL", macro_data)
-
-    assert "action" in result
-    assert "confidence" in result
-    assert "reasoning" in result
-    assert result["action"] in ["BUY", "SELL", "HOLD"]
-    assert 0.0 <= result["confidence"] <= 1.0
-
-    print(f"✓ Action: {result['action']}")
-    print(f"✓ Confidence: {result['confidence']:.2f}")
-    print(f"✓ Reasoning: {result['reasoning'][:100]}...")
-
-    return result
 
+# ========== Agent Table ==========
 
-async def test_institutional_agent():
-    """Test Institutional Agent (10% voting weight)"""
-    print("\n" + "="*80)
-    print("TEST: Institutional Agent (10%)")
-    print("="*80)
+# War Room 투표 참여 에이전트: (이름, 에이전트 클래스, mock 데이터 생성 함수, 투표 가중치 %)
+# 에이전트 추가 시 이 테이블에 한 줄만 추가
+AGENTS = (
+    ("Risk", RiskAgent, get_mock_market_data, 20),
+    ("Trader", TraderAgent, get_mock_market_data, 15),
+    ("Analyst", AnalystAgent, get_mock_market_data, 15),
+    ("ChipWar", ChipWarAgent, get_mock_chipwar_data, 12),
+    ("News", NewsAgent, get_mock_news_data, 10),
+    ("Macro", MacroAgent, get_mock_macro_data, 10),
+    ("Institutional", InstitutionalAgent, get_mock_institutional_data, 10),
+    ("Sentiment", SentimentAgent, get_mock_sentiment_data, 8)
+)
 
-    agent = InstitutionalAgent()
-    inst_data = get_mock_institutional_data()
 
-    result = await agent.analyze("AAPL", inst_data)
+def _assert_shape(name, result):
+    """에이전트 결과 공통 검증 (필수 필드, action, confidence 범위)"""
+    assert "action" in result, f"{name}: missing 'action' field"
+    assert "confidence" in result, f"{name}: missing 'confidence' field"
+    assert "reasoning" in result, f"{name}: missing 'reasoning' field"
+    assert result["action"] in ["BUY", "SELL", "HOLD"], f"{name}: invalid action {result['action']}"
+    assert 0.0 <= result["confidence"] <= 1.0, f"{name}: invalid confidence {result['confidence']}"
 
-    assert "action" in result
-    assert "confidence" in result
-    assert "reasoning" in result
-    assert result["action"] in ["BUY", "SELL", "HOLD"]
-    assert 0.0 <= result["confidence"] <= 1.0
 
-    print(f"✓ Action: {result['action']}")
-    print(f"✓ Confidence: {result['confidence']:.2f}")
-    print(f"✓ Reasoning: {result['reasoning'][:100]}...")
-
-    return result
-
-
-async def test_sentiment_agent():
-    """Test Sentiment Agent (8% voting weight)"""
-    print("\n" + "="*80)
-    print("TEST: Sentiment Agent (8%)")
-    print("="*80)
-
-    agent = SentimentAgent()
-    sentiment_data = get_mock_sentiment_data()
+# ========== Individual Agent Tests ==========
 
-    result = await agent.analyze("AAPL", sentiment_data)
+async def run_agent_test(name, agent_cls, get_data, weight):
+    """Test a single agent (AGENTS 테이블 한 행)"""
+    log("\n" + "="*80)
+    log(f"TEST: {name} Agent ({weight}%)")
+    log("="*80)
 
-    assert "action" in result
-    assert "confidence" in result
-    assert "reasoning" in result
-    assert result["action"] in ["BUY", "SELL", "HOLD"]
-    assert 0.0 <= result["confidence"] <= 1.0
+    result = await get_agent(agent_cls).analyze("AAPL", get_data())
+    _assert_shape(name, result)
 
-    print(f"✓ Action: {result['action']}")
-    print(f"✓ Confidence: {result['confidence']:.2f}")
-    print(f"✓ Reasoning: {result['reasoning'][:100]}...")
+    log(f"✓ Action: {result['action']}")
+    log(f"✓ Confidence: {result['confidence']:.2f}")
+    log(f"✓ Reasoning: {result['reasoning'][:100]}...")
 
     return result
 
 
 # ========== War Room Integration Test ==========
 
-async def test_war_room_voting():
-    """Test War Room 8-agent voting system"""
-    print("\n" + "="*80)
-    print("TEST: War Room 8-Agent Voting System")
-    print("="*80)
+async def collect_agent_votes(early_stop=False):
+    """
+    8개 에이전트 analyze()를 동시에 실행해 {이름: 결과} 반환 (AGENTS 순서)
+
+    early_stop=True: 결과가 도착할 때마다 가중 점수를 누적하고, 남은 에이전트가 모두
+    신뢰도 1.0으로 투표해도 1위 action이 바뀔 수 없으면 남은 작업을 취소하고 바로 반환
+    """
+    weights = {name: weight / 100.0 for name, _, _, weight in AGENTS}
+    tasks = {
+        asyncio.ensure_future(get_agent(agent_cls).analyze("AAPL", get_data())): name
+        for name, agent_cls, get_data, _ in AGENTS
+    }
+    pending = set(tasks)
+    arrived = {}
+    scores = dict.fromkeys(ACTIONS, 0.0)
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = tasks[task]
+                result = task.result()
+                _assert_shape(name, result)
+                arrived[name] = result
+                scores[result["action"]] += weights[name] * result["confidence"]
+
+            if early_stop and pending:
+                leader, runner_up = sorted(scores.values(), reverse=True)[:2]
+                remaining = sum(weights[tasks[task]] for task in pending)
+                if leader - runner_up > remaining:
+                    break
+    finally:
+        # 조기 종료 또는 오류 시 남은 analyze() 작업 취소 후 정리될 때까지 대기
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    return {name: arrived[name] for name, _, _, _ in AGENTS if name in arrived}
+
+
+async def test_war_room_voting(results=None):
+    """
+    Test War Room 8-agent voting system
+
+    Args:
+        results: PHASE 1 개별 테스트 결과 {이름: 결과}. 없으면 collect_agent_votes()로 수집
+    """
+    log("\n" + "="*80)
+    log("TEST: War Room 8-Agent Voting System")
+    log("="*80)
 
     # Voting weights (should total 100%)
-    weights = {
-        "Risk": 20,
-        "Trader": 15,
-        "Analyst": 15,
-        "ChipWar": 12,
-        "News": 10,
-        "Macro": 10,
-        "Institutional": 10,
-        "Sentiment": 8
-    }
+    weights = {name: weight for name, _, _, weight in AGENTS}
 
     # Verify weights sum to 100
     total_weight = sum(weights.values())
     assert total_weight == 100, f"Weights must sum to 100%, got {total_weight}%"
-    print(f"✓ Voting weights sum to {total_weight}%")
-
-    # Collect all agent votes
-    print("\nCollecting agent votes...")
-
-    results = {
-        "Risk": await test_risk_agent(),
-        "Trader": await test_trader_agent(),
-        "Analyst": await test_analyst_agent(),
-        "ChipWar": await test_chipwar_agent(),
-        "News": await test_news_agent(),
-        "Macro": await test_macro_agent(),
-        "Institutional": await test_institutional_agent(),
-        "Sentiment": await test_sentiment_agent()
-    }
-
-    # Calculate weighted votes
-    print("\n" + "="*80)
-    print("Weighted Voting Results")
-    print("="*80)
+    log(f"✓ Voting weights sum to {total_weight}%")
 
-    vote_scores = {"BUY": 0.0, "SELL": 0.0, "HOLD": 0.0}
+    # Collect all agent votes (개별 테스트 결과가 있으면 재사용)
+    if results is None:
+        log("\nCollecting agent votes...")
+        results = await collect_agent_votes(early_stop=True)
+        skipped = [name for name in weights if name not in results]
+        if skipped:
+            log(f"✓ Decision settled early, skipped: {', '.join(skipped)}")
 
-    for agent_name, result in results.items():
-        action = result["action"]
-        confidence = result["confidence"]
-        weight = weights[agent_name]
-
-        weighted_score = (weight / 100.0) * confidence
-        vote_scores[action] += weighted_score
-
-        print(f"{agent_name:15} | {action:4} | Conf: {confidence:.2f} | Weight: {weight:2}% | Score: {weighted_score:.4f}")
+    # Calculate weighted votes
+    log("\n" + "="*80)
+    log("Weighted Voting Results")
+    log("="*80)
+
+    # action → 정수 코드로 한 번 변환 후 숫자 배열로 집계 (_vote_kernel.tally)
+    # 결과 dict를 한 번만 순회 (조회 메서드는 로컬에 미리 바인딩, 티커 루프용 템플릿)
+    names, vote_weights, confidences, action_codes = [], [], [], []
+    add_name, add_weight = names.append, vote_weights.append
+    add_confidence, add_code = confidences.append, action_codes.append
+    weight_of, code_of = weights.__getitem__, ACTION_CODES.__getitem__
+    for name, result in results.items():
+        add_name(name)
+        add_weight(weight_of(name) / 100.0)
+        add_confidence(result["confidence"])
+        add_code(code_of(result["action"]))
+    scores = tally(vote_weights, confidences, action_codes)
+    vote_scores = dict(zip(ACTIONS, map(float, scores)))
+
+    for name, weight, confidence, code in zip(names, vote_weights, confidences, action_codes):
+        log(f"{name:15} | {ACTIONS[code]:4} | Conf: {confidence:.2f} | Weight: {weights[name]:2}% | Score: {weight * confidence:.4f}")
 
     # Determine final decision
-    print("\n" + "="*80)
-    print("Final War Room Decision")
-    print("="*80)
+    log("\n" + "="*80)
+    log("Final War Room Decision")
+    log("="*80)
 
-    final_action = max(vote_scores, key=vote_scores.get)
+    # 최고 점수 action (동점이면 BUY → SELL → HOLD 순으로 앞선 것, max()와 동일)
+    final_index = int(scores.argmax()) if hasattr(scores, "argmax") else scores.index(max(scores))
+    final_action = ACTIONS[final_index]
     final_confidence = vote_scores[final_action]
 
-    print(f"BUY Score:  {vote_scores['BUY']:.4f}")
-    print(f"SELL Score: {vote_scores['SELL']:.4f}")
-    print(f"HOLD Score: {vote_scores['HOLD']:.4f}")
-    print(f"\n✓ Final Decision: {final_action} (Confidence: {final_confidence:.4f})")
+    log(f"BUY Score:  {vote_scores['BUY']:.4f}")
+    log(f"SELL Score: {vote_scores['SELL']:.4f}")
+    log(f"HOLD Score: {vote_scores['HOLD']:.4f}")
+    log(f"\n✓ Final Decision: {final_action} (Confidence: {final_confidence:.4f})")
+    flush_report()
 
     return {
         "final_action": final_action,
@@ -425,6 +364,42 @@ async def test_war_room_voting():
     }
 
 
+# ========== Regression Tests ==========
+
+def test_risk_rolling_stats_interior_revision():
+    """같은 티커·같은 길이·같은 양 끝값이라도 중간 수익률이 바뀌면 Sharpe를 새로 계산"""
+    agent = RiskAgent()
+    r1 = [0] + [-0.08] * 28 + [0]
+    r2 = [0] + [0.01] * 28 + [0]
+    agent._rolling_stats("AAPL", r1)
+    sharpe = agent._rolling_stats("AAPL", r2).sharpe_ratio()
+    fresh = RiskAgent()._rolling_stats("AAPL", r2).sharpe_ratio()
+    assert sharpe == fresh, f"risk: stale rolling Sharpe {sharpe:.2f} (fresh {fresh:.2f})"
+    log(f"✓ Risk rolling stats: interior revision recomputed (Sharpe {sharpe:.2f})")
+
+
+def test_trader_bollinger_mid_bar_revision():
+    """window 안쪽 봉이 수정된 뒤 봉이 1개 추가되면 증분 갱신 대신 전체 재계산과 같은 밴드"""
+    agent = TraderAgent()
+    bars = [{"high": 101.0, "low": 99.0, "close": 100.0 + (i % 5)} for i in range(40)]
+    agent._bollinger_for_ticker("AAPL", _to_arrays(bars))
+    bars[30] = {"high": 301.0, "low": 299.0, "close": 300.0}
+    bars.append({"high": 106.0, "low": 104.0, "close": 105.0})
+    bands = agent._bollinger_for_ticker("AAPL", _to_arrays(bars))
+    fresh = TraderAgent()._calculate_bollinger_bands(_to_arrays(bars))
+    for key in ("upper", "middle", "lower"):
+        assert abs(bands[key] - fresh[key]) < 1e-9, (
+            f"trader: stale Bollinger {key} {bands[key]:.2f} (fresh {fresh[key]:.2f})"
+        )
+    log(f"✓ Trader Bollinger: mid-bar revision recomputed (upper {bands['upper']:.2f})")
+
+
+REGRESSION_TESTS = (
+    test_risk_rolling_stats_interior_revision,
+    test_trader_bollinger_mid_bar_revision,
+)
+
+
 # ========== Main Test Runner ==========
 
 async def run_all_tests():
@@ -439,39 +414,31 @@ async def run_all_tests():
     try:
         # Test individual agents
         print("\n### PHASE 1: Individual Agent Tests ###")
-        await test_risk_agent()
-        tests_passed += 1
+        results = {}
 
-        await test_trader_agent()
-        tests_passed += 1
+        for name, agent_cls, get_data, weight in AGENTS:
+            results[name] = await run_agent_test(name, agent_cls, get_data, weight)
+            tests_passed += 1
+        flush_report()
 
-        await test_analyst_agent()
-        tests_passed += 1
-
-        await test_chipwar_agent()
-        tests_passed += 1
-
-        await test_news_agent()
-        tests_passed += 1
-
-        await test_macro_agent()
-        tests_passed += 1
-
-        await test_institutional_agent()
-        tests_passed += 1
-
-        await test_sentiment_agent()
-        tests_passed += 1
-
-        # Test War Room integration
+        # Test War Room integration (PHASE 1 결과 재사용 - 에이전트 재실행 없음)
         print("\n### PHASE 2: War Room Integration Test ###")
-        await test_war_room_voting()
+        await test_war_room_voting(results)
         tests_passed += 1
 
+        # Regression tests (캐시/증분 경로가 전체 재계산과 같은 결과를 내는지)
+        print("\n### PHASE 3: Regression Tests ###")
+        for test in REGRESSION_TESTS:
+            test()
+            tests_passed += 1
+        flush_report()
+
     except AssertionError as e:
+        flush_report()
         print(f"\n✗ Test failed: {e}")
         tests_failed += 1
     except Exception as e:
+        flush_report()
         print(f"\n✗ Test error: {e}")
         import traceback
         traceback.print_exc()
@@ -491,8 +458,10 @@ async def run_all_tests():
 
 
 def main():
-    """Main entry point"""
-    return asyncio.run(run_all_tests())
+    """Main entry point (단일 event loop에서 전체 테스트 실행, uvloop 설치 시 uvloop 사용)"""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(run_all_tests())
 
 
 if __name__ == "__main__":
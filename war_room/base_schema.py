@@ -8,10 +8,30 @@ GPT 권장사항: 모듈 간 데이터 구조 통일 선행 필수
 참조: MASTER_INTEGRATION_ROADMAP_v5.md
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Dict, Optional, Any
+import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, TypeAdapter, model_validator
+from dataclasses import dataclass, field
+from typing import Annotated, List, Dict, Optional, Any, Tuple
 from datetime import datetime
-from enum import Enum
+from enum import Enum, IntEnum
+
+try:
+    import numpy as np
+except ImportError:  # numpy는 선택 사항 - peri_batch는 순수 Python으로 계산
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba는 선택 사항 - peri_batch는 numpy 열 단위 누적으로 계산
+    njit = None
+    prange = range
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick은 선택 사항 - KeywordMatcher는 키워드별 부분 문자열 검사
+    ahocorasick = None
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -36,8 +56,8 @@ class ChipInfo(BaseModel):
     tokens_per_sec: Optional[float] = Field(None, description="초당 토큰 생성량")
     segment: Optional[str] = Field(None, description="시장 세그먼트 (training/inference/both)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "model": "NVIDIA H100",
                 "vendor": "NVIDIA",
@@ -51,6 +71,97 @@ class ChipInfo(BaseModel):
                 "segment": "training"
             }
         }
+    )
+
+
+# ChipInfo 숫자 필드 (ChipInfoTable 컬럼, 없는 값은 NaN)
+_CHIP_NUMERIC_FIELDS = ("perf_tflops", "mem_bw_gbps", "tdp_watts", "cost_usd", "efficiency_score", "tokens_per_sec")
+_CHIP_TEXT_FIELDS = ("model", "vendor", "process_node", "segment")
+
+
+@dataclass(slots=True)
+class ChipInfoRow:
+    """
+    ChipInfo 경량 행 (검증 없음, __slots__)
+
+    대량 칩 목록을 순회하는 분석 코드용. 검증된 ChipInfo가 필요하면 to_model()
+    """
+    model: Optional[str] = None
+    vendor: Optional[str] = None
+    process_node: Optional[str] = None
+    perf_tflops: Optional[float] = None
+    mem_bw_gbps: Optional[float] = None
+    tdp_watts: Optional[float] = None
+    cost_usd: Optional[float] = None
+    efficiency_score: Optional[float] = None
+    tokens_per_sec: Optional[float] = None
+    segment: Optional[str] = None
+
+    def to_model(self) -> ChipInfo:
+        return ChipInfo.model_construct(**{name: getattr(self, name) for name in ChipInfo.model_fields})
+
+
+@dataclass(slots=True)
+class ChipInfoTable:
+    """
+    ChipInfo 목록의 컬럼 저장 (SoA)
+
+    숫자 필드는 float64 ndarray (없는 값 NaN), 문자열 필드는 list.
+    효율/비용 계산을 칩 단위 루프 없이 배열 연산 한 번으로 처리한다 (numpy 필요).
+
+    Usage:
+        table = ChipInfoTable.from_models(context.chip_info)
+        table.cost_per_watt()  # (N,) $/W
+    """
+    perf_tflops: Any
+    mem_bw_gbps: Any
+    tdp_watts: Any
+    cost_usd: Any
+    efficiency_score: Any
+    tokens_per_sec: Any
+    model: List[Optional[str]] = field(default_factory=list)
+    vendor: List[Optional[str]] = field(default_factory=list)
+    process_node: List[Optional[str]] = field(default_factory=list)
+    segment: List[Optional[str]] = field(default_factory=list)
+
+    @classmethod
+    def from_models(cls, chips: List[ChipInfo]) -> "ChipInfoTable":
+        """ChipInfo (또는 ChipInfoRow) 목록 → 컬럼 테이블"""
+        if np is None:
+            raise ImportError("ChipInfoTable requires numpy")
+        columns = {
+            name: np.fromiter(
+                (np.nan if value is None else value for value in (getattr(chip, name) for chip in chips)),
+                dtype=np.float64,
+                count=len(chips)
+            )
+            for name in _CHIP_NUMERIC_FIELDS
+        }
+        for name in _CHIP_TEXT_FIELDS:
+            columns[name] = [getattr(chip, name) for chip in chips]
+        return cls(**columns)
+
+    def __len__(self) -> int:
+        return len(self.perf_tflops)
+
+    def to_models(self) -> List[ChipInfo]:
+        """컬럼 테이블 → ChipInfo 목록 (model_construct, NaN → None)"""
+        numeric = [[None if value != value else value for value in getattr(self, name).tolist()] for name in _CHIP_NUMERIC_FIELDS]
+        text = [getattr(self, name) for name in _CHIP_TEXT_FIELDS]
+        return [
+            ChipInfo.model_construct(**dict(zip(_CHIP_NUMERIC_FIELDS + _CHIP_TEXT_FIELDS, values)))
+            for values in zip(*numeric, *text)
+        ]
+
+    def compute_efficiency(self) -> Any:
+        """와트당 성능 (TFLOPS/W), 값이 없거나 TDP 0이면 NaN"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.tdp_watts > 0, self.perf_tflops / self.tdp_watts, np.nan)
+
+    def cost_per_watt(self) -> Any:
+        """와트당 하드웨어 비용 ($/W, UnitEconomics.cost_per_watt), TDP 0이면 NaN"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(self.tdp_watts > 0, self.cost_usd / self.tdp_watts, np.nan)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -67,6 +178,10 @@ class RelationType(str, Enum):
     MANUFACTURER = "manufacturer"      # 제조사 (TSM)
 
 
+# 티커 문자열 (검증 시 sys.intern - 대형 그래프에서 같은 티커 문자열 객체 공유)
+Ticker = Annotated[str, AfterValidator(sys.intern)]
+
+
 class SupplyChainEdge(BaseModel):
     """
     공급망 관계 엣지
@@ -74,14 +189,14 @@ class SupplyChainEdge(BaseModel):
     Usage:
         ai_value_chain_graph에서 사용
     """
-    source: str = Field(..., description="출발 노드 (Ticker)")
-    target: str = Field(..., description="도착 노드 (Ticker)")
+    source: Ticker = Field(..., description="출발 노드 (Ticker)")
+    target: Ticker = Field(..., description="도착 노드 (Ticker)")
     relation: RelationType = Field(..., description="관계 유형")
     confidence: float = Field(0.5, ge=0.0, le=1.0, description="신뢰도 (0~1)")
     context: Optional[str] = Field(None, description="관계 설명")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "source": "TSM",
                 "target": "NVDA",
@@ -90,6 +205,85 @@ class SupplyChainEdge(BaseModel):
                 "context": "TSMC manufactures NVIDIA GPUs using 4nm process"
             }
         }
+    )
+
+
+# relation 정수 코드 (SupplyChainGraph.rel) ↔ RelationType
+_RELATION_TYPES = tuple(RelationType)
+_RELATION_CODES = {relation: code for code, relation in enumerate(_RELATION_TYPES)}
+
+
+@dataclass(slots=True)
+class SupplyChainGraph:
+    """
+    공급망 그래프 배열 저장 (CSR, numpy 필요)
+
+    노드는 uint32 id, 엣지는 출발 노드 순으로 정렬해
+    indptr[i]:indptr[i + 1] 구간이 노드 i의 나가는 엣지 (O(차수) 조회).
+
+    Usage:
+        graph = SupplyChainGraph.from_edges(context.supply_chain)
+        graph.neighbors("TSM")  # [("NVDA", RelationType.SUPPLIER, 0.98), ...]
+    """
+    nodes: List[str]           # id → ticker
+    id_of: Dict[str, int]      # ticker → id
+    indptr: Any                # (N + 1,) int64
+    tgt: Any                   # (E,) uint32 도착 노드 id
+    rel: Any                   # (E,) int8 relation 코드
+    conf: Any                  # (E,) float64 신뢰도
+
+    @classmethod
+    def from_edges(cls, edges: List[SupplyChainEdge]) -> "SupplyChainGraph":
+        if np is None:
+            raise ImportError("SupplyChainGraph requires numpy")
+        id_of: Dict[str, int] = {}
+        for edge in edges:
+            id_of.setdefault(edge.source, len(id_of))
+            id_of.setdefault(edge.target, len(id_of))
+
+        count = len(edges)
+        src = np.fromiter((id_of[edge.source] for edge in edges), dtype=np.uint32, count=count)
+        tgt = np.fromiter((id_of[edge.target] for edge in edges), dtype=np.uint32, count=count)
+        rel = np.fromiter((_RELATION_CODES[edge.relation] for edge in edges), dtype=np.int8, count=count)
+        conf = np.fromiter((edge.confidence for edge in edges), dtype=np.float64, count=count)
+
+        order = np.argsort(src, kind="stable")  # 같은 출발 노드 안에서는 입력 순서 유지
+        indptr = np.zeros(len(id_of) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=len(id_of)), out=indptr[1:])
+        return cls(
+            nodes=list(id_of),
+            id_of=id_of,
+            indptr=indptr,
+            tgt=tgt[order],
+            rel=rel[order],
+            conf=conf[order]
+        )
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> "SupplyChainGraph":
+        """
+        원시 엣지 dict 목록 → 그래프
+
+        목록 전체를 SUPPLY_CHAIN_LIST_ADAPTER로 한 번에 검증 (relation enum 변환 포함,
+        엣지마다 SupplyChainEdge(...) 생성자를 호출하는 것보다 빠름)
+        """
+        return cls.from_edges(SUPPLY_CHAIN_LIST_ADAPTER.validate_python(records))
+
+    def __len__(self) -> int:
+        return len(self.tgt)
+
+    def neighbors(self, source: str) -> List[Tuple[str, RelationType, float]]:
+        """source에서 나가는 엣지 [(target, relation, confidence)] (없는 노드는 [])"""
+        node = self.id_of.get(source)
+        if node is None:
+            return []
+        start, stop = self.indptr[node], self.indptr[node + 1]
+        return [
+            (self.nodes[target], _RELATION_TYPES[code], confidence)
+            for target, code, confidence in zip(
+                self.tgt[start:stop].tolist(), self.rel[start:stop].tolist(), self.conf[start:stop].tolist()
+            )
+        ]
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -110,8 +304,8 @@ class UnitEconomics(BaseModel):
     lifetime_tokens: Optional[float] = Field(None, description="생애 전체 토큰 수")
     cost_per_watt: Optional[float] = Field(None, description="와트당 비용 ($/W)")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "token_cost": 1.2e-8,
                 "energy_cost": 0.12,
@@ -121,6 +315,7 @@ class UnitEconomics(BaseModel):
                 "cost_per_watt": 42.86
             }
         }
+    )
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -154,8 +349,8 @@ class NewsFeatures(BaseModel):
     confidence: Optional[float] = Field(None, ge=0.0, le=1.0, description="분류 신뢰도")
     published_at: Optional[datetime] = Field(None, description="뉴스 발행 시각")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "headline": "NVIDIA Blackwell B200 breaks training records",
                 "body": "NVIDIA announced new Blackwell B200 GPU...",
@@ -167,12 +362,114 @@ class NewsFeatures(BaseModel):
                 "published_at": "2025-12-03T00:00:00Z"
             }
         }
+    )
+
+
+class KeywordMatcher:
+    """
+    키워드 목록 일괄 매칭 (대소문자 무시, 부분 문자열 일치)
+
+    pyahocorasick이 있으면 생성 시 Aho-Corasick 오토마톤을 1회 빌드해
+    키워드 수와 무관하게 텍스트를 한 번만 훑는다.
+
+    Usage:
+        matcher = KeywordMatcher(["blackwell", "b200"])
+        matcher.find("NVIDIA Blackwell B200 ...")  # ["blackwell", "b200"]
+    """
+
+    __slots__ = ("keywords", "_automaton")
+
+    def __init__(self, keywords: List[str]):
+        self.keywords = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for index, keyword in enumerate(self.keywords):
+                automaton.add_word(keyword, index)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def find(self, text: str) -> List[str]:
+        """text에 포함된 키워드 (키워드 목록 순서, 중복 없음)"""
+        text = text.lower()
+        if self._automaton is None:
+            return [keyword for keyword in self.keywords if keyword in text]
+        indices = {index for _, index in self._automaton.iter(text)}
+        return [self.keywords[index] for index in sorted(indices)]
+
+
+# AI 칩 뉴스 키워드 (NewsFeatures.keywords 추출 기본 목록)
+AI_CHIP_KEYWORDS = (
+    "blackwell", "hopper", "h100", "h200", "b200", "gb200", "mi300", "tpu", "gpu", "asic",
+    "hbm", "cowos", "3nm", "4nm", "5nm", "training", "inference", "edge", "hyperscale", "datacenter"
+)
+_AI_CHIP_MATCHER = KeywordMatcher(AI_CHIP_KEYWORDS)
+
+
+def extract_keywords(text: str, matcher: Optional[KeywordMatcher] = None) -> List[str]:
+    """뉴스 텍스트 → 매칭 키워드 (NewsFeatures.keywords, 기본: AI_CHIP_KEYWORDS)"""
+    return (matcher or _AI_CHIP_MATCHER).find(text)
 
 
 # ═══════════════════════════════════════════════════════════════
 # [5] 정책 리스크 스키마 (PERI)
 # ═══════════════════════════════════════════════════════════════
 
+# PERI 가중치 (합계 1.0, 필드 선언 순서대로 합산)
+_PERI_WEIGHTS = (
+    ("fed_conflict_score", 0.25),
+    ("successor_signal_score", 0.20),
+    ("gov_fed_tension_score", 0.20),
+    ("election_risk_score", 0.15),
+    ("bond_volatility_score", 0.10),
+    ("policy_uncertainty_score", 0.10),
+)
+_PERI_FIELDS = tuple(name for name, _ in _PERI_WEIGHTS)
+_PERI_WEIGHTS_VEC = np.array([weight for _, weight in _PERI_WEIGHTS], dtype=np.float64) if np is not None else None
+
+
+def _peri_loop(scores, weights, out):
+    """
+    peri_batch kernel (numba 컴파일 대상)
+
+    행마다 가중합을 필드 순서대로 누적 - PolicyRisk.calculate_peri와 같은 합산 순서
+    """
+    for i in prange(scores.shape[0]):
+        total = 0.0
+        for j in range(weights.shape[0]):
+            total += scores[i, j] * weights[j]
+        out[i] = total * 100.0
+    return out
+
+
+# numba 설치 시 컴파일된 PERI kernel (행 단위 병렬)
+_peri_kernel = njit(parallel=True, cache=True)(_peri_loop) if njit is not None else None
+
+
+def peri_batch(scores) -> Any:
+    """
+    PERI 일괄 계산 (N개 종목/시점)
+
+    Args:
+        scores: (N, 6) 점수 행렬, 열 순서는 _PERI_WEIGHTS와 동일
+            (fed_conflict, successor_signal, gov_fed_tension, election_risk, bond_volatility, policy_uncertainty)
+
+    Returns:
+        (N,) PERI 점수 (0~100). numpy 없으면 list
+        모든 경로가 PolicyRisk.calculate_peri와 같은 순서로 합산 → 결과 동일
+    """
+    if np is not None:
+        scores = np.asarray(scores, dtype=np.float64)
+        if _peri_kernel is not None:
+            return _peri_kernel(scores, _PERI_WEIGHTS_VEC, np.empty(scores.shape[0]))
+        # 행렬곱(BLAS)은 합산 순서가 달라 ULP 차이 → 열 단위로 필드 순서대로 누적 (validator와 비트 단위 동일)
+        total = scores[:, 0] * _PERI_WEIGHTS_VEC[0]
+        for j in range(1, len(_PERI_WEIGHTS_VEC)):
+            total += scores[:, j] * _PERI_WEIGHTS_VEC[j]
+        return total * 100.0
+    return [sum(score * weight for score, (_, weight) in zip(row, _PERI_WEIGHTS)) * 100 for row in scores]
+
+
 class PolicyRisk(BaseModel):
     """
     정책 이벤트 리스크 지수 (PERI: Policy Event Risk Index)
@@ -193,23 +490,28 @@ class PolicyRisk(BaseModel):
     risk_level: Optional[str] = Field(None, description="리스크 레벨 (STABLE/CAUTION/WARNING/DANGER/CRITICAL)")
     adjustment_factor: Optional[float] = Field(None, ge=0.0, le=1.0, description="포지션 조정 계수 (0~1)")
 
-    @validator('peri', pre=False, always=True)
-    def calculate_peri(cls, v, values):
+    @model_validator(mode="after")
+    def calculate_peri(self) -> "PolicyRisk":
         """PERI 자동 계산"""
-        if v == 0.0:  # 명시적으로 설정되지 않은 경우만 계산
-            peri = (
-                values.get('fed_conflict_score', 0.0) * 0.25 +
-                values.get('successor_signal_score', 0.0) * 0.20 +
-                values.get('gov_fed_tension_score', 0.0) * 0.20 +
-                values.get('election_risk_score', 0.0) * 0.15 +
-                values.get('bond_volatility_score', 0.0) * 0.10 +
-                values.get('policy_uncertainty_score', 0.0) * 0.10
-            ) * 100
-            return peri
-        return v
-
-    class Config:
-        json_schema_extra = {
+        if self.peri == 0.0:  # 명시적으로 설정되지 않은 경우만 계산
+            self.peri = sum(getattr(self, name) * weight for name, weight in _PERI_WEIGHTS) * 100
+        return self
+
+    @classmethod
+    def from_score_matrix(cls, scores) -> List["PolicyRisk"]:
+        """
+        (N, 6) 점수 행렬 → PolicyRisk N개 (peri_batch로 한 번에 계산, 필드 재검증 생략)
+
+        점수는 호출자가 0~1 범위로 검증했다고 가정한다 (model_construct 사용).
+        """
+        peris = peri_batch(scores)
+        return [
+            cls.model_construct(**dict(zip(_PERI_FIELDS, map(float, row))), peri=float(peri))
+            for row, peri in zip(scores, peris)
+        ]
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "fed_conflict_score": 0.45,
                 "successor_signal_score": 0.30,
@@ -222,6 +524,18 @@ class PolicyRisk(BaseModel):
                 "adjustment_factor": 0.9
             }
         }
+    )
+
+
+# 리스트 단위 검증용 TypeAdapter (모듈 로드 시 1회 생성, 재사용)
+# Usage: CHIP_INFO_LIST_ADAPTER.validate_python([{...}, ...])
+CHIP_INFO_LIST_ADAPTER = TypeAdapter(List[ChipInfo])
+SUPPLY_CHAIN_LIST_ADAPTER = TypeAdapter(List[SupplyChainEdge])
+
+
+def dump_supply_chain_json(edges: List[SupplyChainEdge]) -> bytes:
+    """공급망 엣지 목록 일괄 JSON 직렬화 (모델별 model_dump_json 반복 없이 한 번에)"""
+    return SUPPLY_CHAIN_LIST_ADAPTER.dump_json(edges)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -238,6 +552,32 @@ class MarketRegime(str, Enum):
     UNKNOWN = "unknown"                # 불명
 
 
+# 수집 배치 기준 시각 - 설정돼 있으면 MarketContext.timestamp 기본값으로 같은 datetime 공유
+_BATCH_TIMESTAMP: ContextVar[Optional[datetime]] = ContextVar("market_context_timestamp", default=None)
+
+
+def _context_timestamp() -> datetime:
+    """MarketContext.timestamp 기본값 (배치 기준 시각, 없으면 datetime.now())"""
+    timestamp = _BATCH_TIMESTAMP.get()
+    return timestamp if timestamp is not None else datetime.now()
+
+
+@contextmanager
+def shared_timestamp(timestamp: Optional[datetime] = None):
+    """
+    블록 안에서 생성되는 MarketContext가 같은 timestamp를 공유 (수집 배치 진입 시 1회 설정)
+
+    Usage:
+        with shared_timestamp():
+            contexts = [MarketContext(ticker=t) for t in tickers]
+    """
+    token = _BATCH_TIMESTAMP.set(timestamp if timestamp is not None else datetime.now())
+    try:
+        yield _BATCH_TIMESTAMP.get()
+    finally:
+        _BATCH_TIMESTAMP.reset(token)
+
+
 class MarketContext(BaseModel):
     """
     모든 AI 모듈의 공통 입출력 구조
@@ -252,7 +592,7 @@ class MarketContext(BaseModel):
     # 기본 정보
     ticker: Optional[str] = Field(None, description="종목 티커")
     company_name: Optional[str] = Field(None, description="회사명")
-    timestamp: datetime = Field(default_factory=datetime.now, description="분석 시각")
+    timestamp: datetime = Field(default_factory=_context_timestamp, description="분석 시각")
 
     # AI 칩 정보
     chip_info: List[ChipInfo] = Field(default_factory=list, description="관련 칩 정보 리스트")
@@ -276,8 +616,12 @@ class MarketContext(BaseModel):
     # 추가 메타데이터
     metadata: Dict[str, Any] = Field(default_factory=dict, description="추가 메타데이터")
 
-    class Config:
-        json_schema_extra = {
+    def to_json(self) -> bytes:
+        """JSON 직렬화 (pydantic-core serializer, bytes 직접 반환)"""
+        return self.__pydantic_serializer__.to_json(self)
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "ticker": "NVDA",
                 "company_name": "NVIDIA Corporation",
@@ -313,12 +657,17 @@ class MarketContext(BaseModel):
                 "market_regime": "bull"
             }
         }
+    )
 
 
 # ═══════════════════════════════════════════════════════════════
 # [7] Multi-AI 입력 스키마
 # ═══════════════════════════════════════════════════════════════
 
+# MultimodelInput 컨텍스트 필드 순서 ({name}_context)
+_MODEL_NAMES = ("claude", "chatgpt", "gemini")
+
+
 class MultimodelInput(BaseModel):
     """
     3개 AI 모델의 동일 스키마 기반 입력
@@ -342,8 +691,72 @@ class MultimodelInput(BaseModel):
     )
     debate_mode: bool = Field(False, description="토론 모드 활성화 여부 (Phase C3)")
 
-    class Config:
-        json_schema_extra = {
+    @model_validator(mode="wrap")
+    @classmethod
+    def _share_timestamp(cls, data: Any, handler) -> "MultimodelInput":
+        """dict로 받은 claude/chatgpt/gemini 컨텍스트가 같은 timestamp를 공유하도록 검증 중 기준 시각 고정"""
+        if _BATCH_TIMESTAMP.get() is not None:
+            return handler(data)
+        with shared_timestamp():
+            return handler(data)
+
+    @classmethod
+    def from_shared(
+        cls,
+        context: MarketContext,
+        ensemble_weights: Optional[Dict[str, float]] = None,
+        debate_mode: bool = False,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> "MultimodelInput":
+        """
+        검증된 MarketContext 하나를 3개 모델이 공유하는 입력 (model_construct, 재검증 없음)
+
+        Args:
+            context: 공통 컨텍스트 (base)
+            overrides: 모델별 변경 필드 {"gemini": {"metadata": {...}}, ...}
+                해당 모델만 base의 얕은 복사본 (model_copy(update=...))을 받고,
+                chip_info / supply_chain 등 나머지 필드는 base와 같은 객체를 공유한다.
+
+        override가 없는 모델은 base 객체 자체를 참조하므로 context를 수정하면 모두에 반영된다.
+        """
+        overrides = overrides or {}
+        unknown = set(overrides) - set(_MODEL_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown model override: {sorted(unknown)}")
+        contexts = {
+            f"{name}_context": context.model_copy(update=overrides[name]) if name in overrides else context
+            for name in _MODEL_NAMES
+        }
+        return cls.model_construct(
+            **contexts,
+            ensemble_weights=ensemble_weights,
+            debate_mode=debate_mode
+        )
+
+    def for_model(self, name: str) -> MarketContext:
+        """모델명 (claude/chatgpt/gemini) → 해당 모델 컨텍스트"""
+        if name not in _MODEL_NAMES:
+            raise ValueError(f"Unknown model: {name}")
+        return getattr(self, f"{name}_context")
+
+    def context_payloads(self) -> Dict[str, bytes]:
+        """
+        모델별 컨텍스트 JSON (claude/chatgpt/gemini → bytes)
+
+        같은 MarketContext 객체를 공유하는 모델은 한 번만 직렬화한 bytes를 그대로 재사용
+        """
+        serialized: Dict[int, bytes] = {}
+        payloads = {}
+        for name in _MODEL_NAMES:
+            context = getattr(self, f"{name}_context")
+            payload = serialized.get(id(context))
+            if payload is None:
+                payload = serialized[id(context)] = context.to_json()
+            payloads[name] = payload
+        return payloads
+
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "claude_context": {
                     "ticker": "NVDA",
@@ -368,6 +781,7 @@ class MultimodelInput(BaseModel):
                 "debate_mode": False
             }
         }
+    )
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -395,6 +809,25 @@ class SignalAction(str, Enum):
     DCA = "DCA"                 # 물타기 (펀더멘털 기반)
 
 
+class SignalActionCode(IntEnum):
+    """
+    SignalAction 정수 코드 (투표 집계 배열 인덱싱 / np.bincount용)
+
+    API 경계에서는 SignalAction(str)을 쓰고, 집계 루프 안에서만 정수 코드를 사용
+    """
+    BUY = 0
+    SELL = 1
+    HOLD = 2
+    MAINTAIN = 3
+    REDUCE = 4
+    INCREASE = 5
+    DCA = 6
+
+
+# "BUY" / SignalAction.BUY → SignalActionCode.BUY (str Enum이라 문자열과 같은 키)
+SIGNAL_ACTION_CODES = {action.value: SignalActionCode[action.name] for action in SignalAction}
+
+
 class InvestmentSignal(BaseModel):
     """
     투자 시그널
@@ -411,8 +844,8 @@ class InvestmentSignal(BaseModel):
     risk_score: Optional[float] = Field(None, ge=0.0, le=1.0, description="리스크 점수 (0~1)")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="추가 메타데이터")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "ticker": "NVDA",
                 "action": "BUY",
@@ -428,3 +861,4 @@ class InvestmentSignal(BaseModel):
                 }
             }
         }
+    )
@@ -13,12 +13,37 @@ Date: 2025-12-23
 Phase: 25.0 (실거래 테스트)
 """
 
+import asyncio
+import bisect
 import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
+# 시뮬레이션 현재가 (TODO: 나중에 실제 API로 대체)
+_SIMULATED_PRICES = MappingProxyType({
+    "AAPL": 195.50,
+    "NVDA": 495.75,
+    "GOOGL": 140.25,
+    "META": 355.80,
+    "MSFT": 375.20,
+    "TSLA": 245.60,
+    "AMZN": 155.30
+})
+_DEFAULT_SIMULATED_PRICE = 200.0
+
+# 신뢰도 구간별 자본 배분 비율: < 60% → 0.5%, 60-80% → 1%, >= 80% → 2%
+_CONFIDENCE_THRESHOLDS = (0.60, 0.80)
+_CAPITAL_RATIOS = (0.005, 0.01, 0.02)
+
+# 주문 없이 스킵하는 액션 (아무 행동도 하지 않음)
+_NO_ORDER_ACTIONS = frozenset({"HOLD", "MAINTAIN"})
+
+# 점진적 조정 액션 (기본 크기의 50%)
+_GRADUAL_ACTIONS = frozenset({"REDUCE", "INCREASE", "DCA"})
+
 
 class WarRoomExecutor:
     """War Room 결정을 실제 주문으로 실행"""
@@ -58,8 +83,8 @@ class WarRoomExecutor:
             f"({consensus_confidence:.0%} 확신)"
         )
 
-        # HOLD/MAINTAIN은 스킵 (아무 행동도 하지 않음)
-        if consensus_action in ["HOLD", "MAINTAIN"]:
+        # HOLD/MAINTAIN은 스킵 (포지션 계산/주문 생성 전에 반환)
+        if consensus_action in _NO_ORDER_ACTIONS:
             logger.info(f"⏸️  {ticker} {consensus_action} → 주문 없음")
             return {
                 "status": "skipped",
@@ -85,7 +110,7 @@ class WarRoomExecutor:
             }
 
         # Step 2: 현재 가격 조회 (시뮬레이션)
-        current_price = await self._get_current_price(ticker)
+        current_price = self._get_current_price(ticker)
 
         # Step 3: 주문 생성
         order = {
@@ -146,17 +171,12 @@ class WarRoomExecutor:
         # 시뮬레이션 자본 (모의투자 기본값)
         total_capital = 100000  # $100,000
 
-        # 신뢰도 기반 자본 배분
-        if confidence >= 0.80:
-            capital_ratio = 0.02  # 2%
-        elif confidence >= 0.60:
-            capital_ratio = 0.01  # 1%
-        else:
-            capital_ratio = 0.005  # 0.5%
+        # 신뢰도 기반 자본 배분 (bisect_right: 경계값은 상위 구간, >= 비교와 동일)
+        capital_ratio = _CAPITAL_RATIOS[bisect.bisect_right(_CONFIDENCE_THRESHOLDS, confidence)]
 
         # 액션별 크기 조정
         size_multiplier = 1.0
-        if action in ["REDUCE", "INCREASE", "DCA"]:
+        if action in _GRADUAL_ACTIONS:
             size_multiplier = 0.5  # 50% 크기로 점진적 조정
             logger.info(f"📐 {action} 액션: 크기 50% 조정")
 
@@ -174,20 +194,9 @@ class WarRoomExecutor:
 
         return position_size
 
-    async def _get_current_price(self, ticker: str) -> float:
-        """현재 가격 조회 (시뮬레이션)"""
-        # TODO: 나중에 실제 API로 대체
-        simulated_prices = {
-            "AAPL": 195.50,
-            "NVDA": 495.75,
-            "GOOGL": 140.25,
-            "META": 355.80,
-            "MSFT": 375.20,
-            "TSLA": 245.60,
-            "AMZN": 155.30
-        }
-
-        price = simulated_prices.get(ticker, 200.0)
+    def _get_current_price(self, ticker: str) -> float:
+        """현재 가격 조회 (시뮬레이션, 동기 조회라 코루틴 불필요)"""
+        price = _SIMULATED_PRICES.get(ticker, _DEFAULT_SIMULATED_PRICE)
         logger.info(f"💵 {ticker} 현재가: ${price:.2f}")
         return price
 
@@ -197,16 +206,17 @@ class WarRoomExecutor:
             if self.broker is None:
                 raise ValueError("KIS Broker not initialized")
 
+            # blocking 브로커 호출은 스레드에서 실행 (여러 티커 주문이 서로 기다리지 않음)
             if order["action"] == "BUY":
-                result = self.broker.buy_market_order(
-                    ticker=order["ticker"],
-                    quantity=order["quantity"]
-                )
+                send = self.broker.buy_market_order
             else:  # SELL
-                result = self.broker.sell_market_order(
-                    ticker=order["ticker"],
-                    quantity=order["quantity"]
-                )
+                send = self.broker.sell_market_order
+
+            result = await asyncio.to_thread(
+                send,
+                ticker=order["ticker"],
+                quantity=order["quantity"]
+            )
 
             logger.info(f"📤 KIS 주문 전송 성공: {result}")
             return result
@@ -13,20 +13,27 @@ War Room API Router
 
 API Endpoints:
 - POST /api/war-room/debate - War Room 토론 실행
+- POST /api/war-room/debate/stream - War Room 토론 실행 (SSE, 투표 완료 순 스트리밍)
 - GET /api/war-room/sessions - 세션 히스토리 조회
 
 Author: AI Trading System
 Date: 20 25-12-25 (Phase 24+: ChipWarAgent weight increased to 14%)
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import func, select, text
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+import asyncio
 import json
 import logging
+import os
+import time
+from types import MappingProxyType
 
-from backend.database.models import AIDebateSession, TradingSignal
+from backend.database.models import AIDebateSession, Order, TradingSignal
 from backend.database.repository import get_sync_session
 
 # Import all 8 agents
@@ -38,6 +45,7 @@ from backend.ai.debate.macro_agent import MacroAgent
 from backend.ai.debate.institutional_agent import InstitutionalAgent
 from backend.ai.debate.chip_war_agent import ChipWarAgent
 from backend.intelligence.dividend_risk_agent import DividendRiskAgent
+from backend.ai.debate._vote_kernel import ACTION_CODES, ACTIONS, tally
 
 # Constitutional Validator
 from backend.constitution.constitution import Constitution
@@ -57,6 +65,10 @@ agent_logger = AgentLogger("war-room-debate", "war-room")
 
 router = APIRouter(prefix="/api/war-room", tags=["war-room"])
 
+# KIS 설정 (import 시 1회 파싱)
+_KIS_ACCOUNT_NO = os.environ.get("KIS_ACCOUNT_NUMBER", "")
+_KIS_IS_VIRTUAL = os.environ.get("KIS_IS_VIRTUAL", "true").lower() == "true"
+
 
 # ============================================================================
 # Request/Response Models
@@ -90,39 +102,119 @@ class DebateResponse(BaseModel):
 # War Room Debate Engine
 # ============================================================================
 
+# Agent별 투표 가중치
+_VOTE_WEIGHTS = MappingProxyType({
+    "trader": 0.15,       # 16% → 15% (technical analysis)
+    "risk": 0.15,         # 16% → 15% (risk management)
+    "analyst": 0.12,      # 12% → 12% (fundamental analysis)
+    "macro": 0.14,        # 14% → 14% (macro economics)
+    "institutional": 0.14, # 14% → 14% (smart money tracking)
+    "news": 0.14,         # 14% → 14% (news sentiment)
+    "chip_war": 0.14,     # 14% → 14% (semiconductor competition)
+    "dividend_risk": 0.02, # ✨ NEW: 2% (dividend sustainability)
+    "pm": 0.00            # PM uses weighted voting, no direct weight
+})
+_DEFAULT_VOTE_WEIGHT = 0.1  # 가중치 미등록 agent
+
+# 액션 매핑 (다양한 액션을 표준 BUY/SELL/HOLD로 변환, 미등록 액션 → HOLD)
+_ACTION_MAPPING = MappingProxyType({
+    "BUY": "BUY",
+    "SELL": "SELL",
+    "HOLD": "HOLD",
+    "MAINTAIN": "HOLD",  # 포지션 유지 = HOLD
+    "REDUCE": "SELL",    # 포지션 축소 = SELL (일부 매도)
+    "INCREASE": "BUY",   # 포지션 확대 = BUY (일부 매수)
+    "TRIM": "SELL",      # 정리 = SELL
+    "ADD": "BUY",        # 추가 = BUY
+    "DCA": "BUY"         # 물타기 = BUY (펀더멘털 유지 시)
+})
+
+# 원본 액션 → 집계 코드 (_vote_kernel.ACTION_CODES: BUY=0, SELL=1, HOLD=2)
+_ACTION_CODE_MAPPING = MappingProxyType({
+    raw_action: ACTION_CODES[action] for raw_action, action in _ACTION_MAPPING.items()
+})
+_HOLD_CODE = ACTION_CODES["HOLD"]
+
+# 에이전트별 투표 제한 시간 (초과 시 해당 투표만 제외, 나머지로 PM 중재)
+_AGENT_TIMEOUT_SECONDS = 8.0
+
+# 프로세스 전체 동시 호출 상한 (여러 토론/티커가 겹쳐도 LLM rate limit 보호)
+_AGENT_CALL_LIMIT = asyncio.Semaphore(int(os.environ.get("WAR_ROOM_MAX_PARALLEL_AGENTS", "16")))
+# 공유 KISBroker는 한 번에 한 호출만 (토큰 갱신/HTTP 세션의 스레드 안전성이 보장되지 않음)
+_KIS_BROKER_LOCK = asyncio.Lock()
+
+
+async def _bounded_vote(vote, ticker: str, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """동시 호출 상한 내에서 투표 (제한 시간은 슬롯을 얻은 뒤부터 적용)"""
+    async with _AGENT_CALL_LIMIT:
+        return await asyncio.wait_for(vote(ticker, context), _AGENT_TIMEOUT_SECONDS)
+
+
+async def _kis_call(fn, *args):
+    """KIS 브로커 호출 - 공유 브로커 호출을 직렬화해 스레드 실행 (blocking SDK)"""
+    async with _KIS_BROKER_LOCK:
+        return await asyncio.to_thread(fn, *args)
+
+# War Room 투표 에이전트 (순서: 중요도 순 = votes 순서)
+# (key, 로그 아이콘, 로그 이름, 클래스, 투표 메서드)
+_AGENT_SPECS = (
+    ("risk", "🛡️", "Risk Agent", RiskAgent, "analyze"),
+    ("macro", "🌏", "Macro Agent", MacroAgent, "analyze"),
+    ("institutional", "🏦", "Institutional Agent", InstitutionalAgent, "analyze"),
+    ("trader", "📈", "Trader Agent", TraderAgent, "analyze"),
+    ("news", "📰", "News Agent", NewsAgent, "analyze"),
+    ("analyst", "📊", "Analyst Agent", AnalystAgent, "analyze"),
+    ("chip_war", "🎮", "Chip War Agent", ChipWarAgent, "analyze"),  # Phase 24
+    ("dividend_risk", "💰", "Dividend Risk Agent", DividendRiskAgent, "vote_for_war_room"),  # Phase 21 ✨
+)
+_AGENT_NAMES = tuple(key for key, *_ in _AGENT_SPECS)
+
+
 class WarRoomEngine:
     """8-Agent War Room Debate Engine"""
 
+    # 에이전트 인스턴스 레지스트리 {key: agent} - 프로세스당 1회 생성, 모든 엔진이 공유
+    _agents = None
+
+    # 투표 에이전트 key (votes 순서, PM 제외)
+    agent_names = _AGENT_NAMES
+
     def __init__(self):
-        """Initialize all 8 agents"""
-        # Initialize real agents
-        self.trader_agent = TraderAgent()
-        self.risk_agent = RiskAgent()
-        self.analyst_agent = AnalystAgent()
-        self.macro_agent = MacroAgent()
-        self.institutional_agent = InstitutionalAgent()
-        self.news_agent = NewsAgent()
-        self.chip_war_agent = ChipWarAgent()  # Phase 24
-        self.dividend_risk_agent = DividendRiskAgent()  # Phase 21 ✨ NEW
+        """Initialize all 8 agents (최초 1회만 생성, 이후 레지스트리 재사용)"""
+        if WarRoomEngine._agents is None:
+            WarRoomEngine._agents = MappingProxyType({
+                key: agent_cls() for key, _, _, agent_cls, _ in _AGENT_SPECS
+            })
+        self.agents = WarRoomEngine._agents
+
+        self.trader_agent = self.agents["trader"]
+        self.risk_agent = self.agents["risk"]
+        self.analyst_agent = self.agents["analyst"]
+        self.macro_agent = self.agents["macro"]
+        self.institutional_agent = self.agents["institutional"]
+        self.news_agent = self.agents["news"]
+        self.chip_war_agent = self.agents["chip_war"]  # Phase 24
+        self.dividend_risk_agent = self.agents["dividend_risk"]  # Phase 21 ✨ NEW
         # PM agent is internal (weighted voting logic)
 
-        self.vote_weights = {
-            "trader": 0.15,       # 16% → 15% (technical analysis)
-            "risk": 0.15,         # 16% → 15% (risk management)
-           "analyst": 0.12,      # 12% → 12% (fundamental analysis)
-            "macro": 0.14,        # 14% → 14% (macro economics)
-            "institutional": 0.14, # 14% → 14% (smart money tracking)
-            "news": 0.14,         # 14% → 14% (news sentiment)
-            "chip_war": 0.14,     # 14% → 14% (semiconductor competition)
-            "dividend_risk": 0.02, # ✨ NEW: 2% (dividend sustainability)
-            "pm": 0.00            # PM uses weighted voting, no direct weight
-        }
+        # (key, 아이콘, 로그 이름, 바운드 투표 메서드) - run_debate마다 getattr 반복 방지
+        self._vote_calls = tuple(
+            (key, icon, label, getattr(self.agents[key], method))
+            for key, icon, label, _, method in _AGENT_SPECS
+        )
+
+        self.vote_weights = _VOTE_WEIGHTS
 
         logger.info("WarRoomEngine initialized with 9 agents (including ChipWar + DividendRisk)")
     
     async def run_debate(self, ticker: str, context: Dict[str, Any] = None) -> tuple[List[Dict], Dict]:
         """
         War Room 토론 실행
+
+        단일 라운드: 각 에이전트는 같은 context만 보고 독립적으로 투표하며
+        (서로의 의견은 프롬프트에 들어가지 않음), PM만 전체 투표를 받아 중재한다.
+        다중 라운드를 추가할 경우 에이전트별로 필요한 동료 투표만 전달하거나, 라운드마다
+        투표를 요약 1개로 압축해 다음 라운드에 넣을 것 (전체 공유는 O(N²) 토큰, 요약은 라운드당 일정).
         
         Args:
             ticker: 분석할 티커
@@ -133,79 +225,79 @@ class WarRoomEngine:
         """
         logger.info(f"🏛️ War Room debate starting for {ticker}")
         
-        votes = []
-
-        # Collect votes from all 7 agents (順서: 중요도 순)
-        # 1. Risk Agent (18%)
-        try:
-            risk_vote = await self.risk_agent.analyze(ticker, context)
-            votes.append(risk_vote)
-            logger.info(f"🛡️ Risk Agent: {risk_vote['action']} ({risk_vote['confidence']:.0%})")
-        except Exception as e:
-            logger.error(f"❌ Risk Agent failed: {e}")
-
-        # 2. Macro Agent (16%)
-        try:
-            macro_vote = await self.macro_agent.analyze(ticker, context)
-            votes.append(macro_vote)
-            logger.info(f"🌏 Macro Agent: {macro_vote['action']} ({macro_vote['confidence']:.0%})")
-        except Exception as e:
-            logger.error(f"❌ Macro Agent failed: {e}")
-
-        # 3. Institutional Agent (15%)
-        try:
-            institutional_vote = await self.institutional_agent.analyze(ticker, context)
-            votes.append(institutional_vote)
-            logger.info(f"🏦 Institutional Agent: {institutional_vote['action']} ({institutional_vote['confidence']:.0%})")
-        except Exception as e:
-            logger.error(f"❌ Institutional Agent failed: {e}")
+        # 8개 에이전트 동시 호출 (I/O 대기 중첩 → 지연 ≈ 가장 느린 에이전트)
+        # 순서: 중요도 순 (votes 순서 유지)
+        # return_exceptions=True: 한 에이전트 실패/타임아웃이 나머지 투표를 취소하지 않음
+        results = await asyncio.gather(
+            *(_bounded_vote(vote, ticker, context) for *_, vote in self._vote_calls),
+            return_exceptions=True
+        )
+        return self._conclude_debate(results)
 
-        # 4. Trader Agent (14%)
-        try:
-            trader_vote = await self.trader_agent.analyze(ticker, context)
-            votes.append(trader_vote)
-            logger.info(f"📈 Trader Agent: {trader_vote['action']} ({trader_vote['confidence']:.0%})")
-        except Exception as e:
-            logger.error(f"❌ Trader Agent failed: {e}")
+    async def stream_debate(self, ticker: str, context: Dict[str, Any] = None):
+        """
+        War Room 토론 실행 (스트리밍) - run_debate와 같은 토론, 투표를 끝나는 순서대로 내보냄
 
-        # 5. News Agent (14%)
-        try:
-            news_vote = await self.news_agent.analyze(ticker, context)
-            votes.append(news_vote)
-            logger.info(f"📰 News Agent: {news_vote['action']} ({news_vote['confidence']:.0%})")
-        except Exception as e:
-            logger.error(f"❌ News Agent failed: {e}")
+        PM 중재는 모든 투표가 모인 뒤 중요도 순으로 하므로 결과는 run_debate와 같다.
+        소비자가 중간에 닫으면 (클라이언트 연결 종료) 남은 에이전트 호출은 취소된다.
 
-        # 6. Analyst Agent (13%)
-        try:
-            analyst_vote = await self.analyst_agent.analyze(ticker, context)
-            votes.append(analyst_vote)
-            logger.info(f"📊 Analyst Agent: {analyst_vote['action']} ({analyst_vote['confidence']:.0%})")
-        except Exception as e:
-            logger.error(f"❌ Analyst Agent failed: {e}")
+        Yields:
+            ("vote", vote) - 성공한 에이전트 투표 (완료 순)
+            ("consensus", (votes, pm_decision)) - 마지막 1회
+        """
+        logger.info(f"🏛️ War Room debate streaming for {ticker}")
 
-        # 7. Chip War Agent (14%)
-        try:
-            chip_war_vote = await self.chip_war_agent.analyze(ticker, context)
-            votes.append(chip_war_vote)
-            logger.info(f"🎮 Chip War Agent: {chip_war_vote['action']} ({chip_war_vote['confidence']:.0%})")
-        except Exception as e:
-            logger.error(f"❌ Chip War Agent failed: {e}")
+        async def indexed_vote(index, vote):
+            # as_completed는 원래 태스크를 돌려주지 않으므로 결과에 순번을 붙임
+            try:
+                return index, await _bounded_vote(vote, ticker, context)
+            except Exception as e:
+                return index, e
 
-        # 8. Dividend Risk Agent (2%) - NEW: Phase 21 ✨
+        tasks = [
+            asyncio.ensure_future(indexed_vote(index, vote))
+            for index, (*_, vote) in enumerate(self._vote_calls)
+        ]
+        results = [None] * len(tasks)
         try:
-            dividend_risk_vote = await self.dividend_risk_agent.vote_for_war_room(ticker, context)
-            votes.append(dividend_risk_vote)
-            logger.info(f"💰 Dividend Risk Agent: {dividend_risk_vote['action']} ({dividend_risk_vote['confidence']:.0%})")
-        except Exception as e:
-            logger.error(f"❌ Dividend Risk Agent failed: {e}")
+            for next_vote in asyncio.as_completed(tasks):
+                index, result = await next_vote
+                results[index] = result
+                if not isinstance(result, Exception):
+                    yield "vote", result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        yield "consensus", self._conclude_debate(results)
+
+    def _conclude_debate(self, results: List[Any]) -> tuple[List[Dict], Dict]:
+        """
+        에이전트별 결과 (self._vote_calls 순서, 실패 시 예외 객체) → (votes, pm_decision)
+        """
+        votes = []
+        failed_agents = []
+        for (key, icon, label, _), result in zip(self._vote_calls, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result  # CancelledError 등은 그대로 전파
+                if isinstance(result, asyncio.TimeoutError):
+                    logger.error(f"❌ {label} timed out after {_AGENT_TIMEOUT_SECONDS:g}s")
+                else:
+                    logger.error(f"❌ {label} failed: {result}")
+                failed_agents.append(key)
+                continue
+            votes.append(result)
+            logger.info(f"{icon} {label}: {result['action']} ({result['confidence']:.0%})")
 
-        # 8. PM Agent 최종 결정 (18%)
+        # 8. PM Agent 최종 결정 (18%) - 실패/타임아웃 에이전트는 제외된 채로 중재
         pm_decision = self._pm_arbitrate(votes)
+        if failed_agents:
+            pm_decision["failed_agents"] = failed_agents  # 부분 합의 표시
         
         logger.info(f"👔 PM Decision: {pm_decision['consensus_action']} "
                    f"(confidence: {pm_decision['consensus_confidence']:.0%})")
-        
+
         return votes, pm_decision
     
 
@@ -224,35 +316,18 @@ class WarRoomEngine:
                 "summary": "투표 없음"
             }
         
-        # 가중 투표 집계
-        action_scores = {"BUY": 0.0, "SELL": 0.0, "HOLD": 0.0}
-
-        # 액션 매핑 (다양한 액션을 표준 BUY/SELL/HOLD로 변환)
-        action_mapping = {
-            "BUY": "BUY",
-            "SELL": "SELL",
-            "HOLD": "HOLD",
-            "MAINTAIN": "HOLD",  # 포지션 유지 = HOLD
-            "REDUCE": "SELL",    # 포지션 축소 = SELL (일부 매도)
-            "INCREASE": "BUY",   # 포지션 확대 = BUY (일부 매수)
-            "TRIM": "SELL",      # 정리 = SELL
-            "ADD": "BUY",        # 추가 = BUY
-            "DCA": "BUY"         # 물타기 = BUY (펀더멘털 유지 시)
-        }
-
-        for vote in votes:
-            agent = vote["agent"]
-            raw_action = vote["action"]
-            confidence = vote["confidence"]
-            weight = self.vote_weights.get(agent, 0.1)
-
-            # 액션 변환
-            action = action_mapping.get(raw_action, "HOLD")
-
-            action_scores[action] += weight * confidence
-        
-        # 최고 점수 액션 선택
-        consensus_action = max(action_scores, key=action_scores.get)
+        # 가중 투표 집계: 액션 → 정수 코드 변환 후 숫자 배열로 합산 (_vote_kernel.tally)
+        weight_of = self.vote_weights.get
+        code_of = _ACTION_CODE_MAPPING.get
+        weights = [weight_of(vote["agent"], _DEFAULT_VOTE_WEIGHT) for vote in votes]
+        confidences = [vote["confidence"] for vote in votes]
+        codes = [code_of(vote["action"], _HOLD_CODE) for vote in votes]
+        scores = tally(weights, confidences, codes)
+
+        # 최고 점수 액션 선택 (동점이면 BUY → SELL → HOLD 순으로 앞선 것, max()와 동일)
+        top = int(scores.argmax()) if hasattr(scores, "argmax") else scores.index(max(scores))
+        action_scores = dict(zip(ACTIONS, map(float, scores)))
+        consensus_action = ACTIONS[top]
         
         # 합의 신뢰도 계산 (최고 점수 / 전체 점수 합)
         total_score = sum(action_scores.values())
@@ -280,10 +355,185 @@ def get_war_room_engine() -> WarRoomEngine:
     return _war_room_engine
 
 
+# Shared KIS Broker (인증 토큰/HTTP 세션을 주문·가격 조회 간 재사용)
+_kis_broker = None
+
+def get_kis_broker():
+    """Get or create KIS Broker (KIS_ACCOUNT_NUMBER 미설정 시 None)"""
+    global _kis_broker
+    if _kis_broker is None:
+        if not _KIS_ACCOUNT_NO:
+            return None
+
+        from backend.brokers.kis_broker import KISBroker
+
+        _kis_broker = KISBroker(account_no=_KIS_ACCOUNT_NO, is_virtual=_KIS_IS_VIRTUAL)
+    return _kis_broker
+
+
+# Shared War Room Executor (/debate-and-execute, DRY RUN용 - broker 없음)
+_war_room_executor = None
+
+def get_war_room_executor():
+    """Get or create War Room Executor"""
+    global _war_room_executor
+    if _war_room_executor is None:
+        from backend.trading.war_room_executor import WarRoomExecutor
+
+        _war_room_executor = WarRoomExecutor(kis_broker=None)
+    return _war_room_executor
+
+
+# Shared Constitution (규칙 로딩은 1회, validate_proposal은 요청별 입력만 사용)
+_constitution = None
+
+def get_constitution() -> Constitution:
+    """Get or create Constitution"""
+    global _constitution
+    if _constitution is None:
+        _constitution = Constitution()
+    return _constitution
+
+
+@router.on_event("startup")
+async def warm_up_war_room() -> None:
+    """앱 시작 시 엔진/에이전트, Constitution, KIS Broker를 미리 생성 (첫 요청의 콜드 스타트 제거)"""
+    get_war_room_engine()
+    get_constitution()
+    try:
+        get_kis_broker()
+    except Exception as e:
+        logger.warning(f"KIS Broker warm-up failed: {e}")
+
+
+# ============================================================================
+# Price Cache (KIS → Yahoo Finance fallback, 60s TTL)
+# ============================================================================
+
+_PRICE_TTL_SECONDS = 60.0
+_PRICE_CACHE_MAX_ENTRIES = 1024
+_price_cache: Dict[tuple, tuple] = {}  # (source, ticker) → (price, expires_at)
+_price_inflight: Dict[tuple, asyncio.Task] = {}  # (source, ticker) → 진행 중 조회
+
+
+def _fetch_kis_price(ticker: str) -> Optional[float]:
+    """KIS 현재가 조회 (blocking, 계좌 미설정 시 None)"""
+    broker = get_kis_broker()
+    if broker is None:
+        return None
+
+    price_data = broker.get_price(ticker, exchange="NASDAQ")
+    return price_data["current_price"] if price_data else None
+
+
+def _fetch_yahoo_price(ticker: str) -> Optional[float]:
+    """Yahoo Finance 최근 종가 조회 (blocking)"""
+    import yfinance as yf
+
+    hist = yf.Ticker(ticker).history(period="1d")
+    if hist.empty:
+        logger.warning(f"Yahoo Finance returned empty data for {ticker}")
+        return None
+    return float(hist['Close'].iloc[-1])
+
+
+def _store_with_ttl(cache: Dict[Any, tuple], key: Any, value: Any, ttl: float, max_entries: int) -> None:
+    """
+    TTL 캐시 저장 ({key: (value, expires_at)})
+
+    가득 차면 만료 항목을 먼저 정리하고, 그래도 넘치면 가장 오래 저장된 항목부터 제거한다.
+    """
+    now = time.monotonic()
+    cache.pop(key, None)  # 재저장 시 삽입 순서 갱신
+    if len(cache) >= max_entries:
+        for stale_key in [k for k, (_, expires_at) in cache.items() if expires_at <= now]:
+            del cache[stale_key]
+        while len(cache) >= max_entries:
+            del cache[next(iter(cache))]
+    cache[key] = (value, now + ttl)
+
+
+_PRICE_SOURCES = {
+    "KIS": _fetch_kis_price,
+    "Yahoo Finance": _fetch_yahoo_price,
+}
+
+
+async def _fetch_price(source: str, ticker: str) -> Optional[float]:
+    """스레드에서 fetch (이벤트 루프 블로킹 방지) → 성공 시 캐시 저장"""
+    try:
+        fetch = _PRICE_SOURCES[source]
+        price = await (_kis_call(fetch, ticker) if source == "KIS" else asyncio.to_thread(fetch, ticker))
+    except Exception as e:
+        logger.warning(f"{source} price fetch failed: {e}")
+        return None
+
+    if price is not None:
+        _store_with_ttl(_price_cache, (source, ticker), price, _PRICE_TTL_SECONDS, _PRICE_CACHE_MAX_ENTRIES)
+        logger.info(f"📊 Price from {source}: {ticker} @ ${price:.2f}")
+    return price
+
+
+async def _cached_price(source: str, ticker: str) -> Optional[float]:
+    """소스별 TTL 캐시 조회 (miss 시 같은 키의 동시 요청은 fetch 1회를 공유)"""
+    key = (source, ticker)
+    cached = _price_cache.get(key)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+
+    task = _price_inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_price(source, ticker))
+        _price_inflight[key] = task
+        task.add_done_callback(lambda _: _price_inflight.pop(key, None))
+    # shield: 한 호출자가 취소돼도 공유 중인 fetch는 계속 진행
+    return await asyncio.shield(task)
+
+
+async def get_cached_price(ticker: str) -> Optional[float]:
+    """
+    현재가 조회 (KIS 우선, Yahoo Finance fallback) - 추적/표시용
+
+    같은 티커는 60초 동안 캐시된 가격을 재사용한다 (실패 결과는 캐시하지 않음).
+    주문 수량 계산은 캐시를 쓰지 않는다 (execute_kis_order 참고).
+
+    Args:
+        ticker: Stock symbol
+
+    Returns:
+        현재가 또는 None
+    """
+    price = await _cached_price("KIS", ticker)
+    if price is None:
+        price = await _cached_price("Yahoo Finance", ticker)
+    return price
+
+
 # ============================================================================
 # Price Tracking (Phase 25.1: 24h Performance Measurement)
 # ============================================================================
 
+_PRICE_TRACKING_INSERT_SQL = text("""
+    INSERT INTO price_tracking (
+        session_id, ticker, initial_price, initial_timestamp,
+        consensus_action, consensus_confidence, status, created_at
+    ) VALUES (
+        :session_id, :ticker, :initial_price, :initial_timestamp,
+        :consensus_action, :consensus_confidence, 'PENDING', NOW()
+    )
+""")
+
+_AGENT_VOTE_TRACKING_INSERT_SQL = text("""
+    INSERT INTO agent_vote_tracking (
+        session_id, agent_name, vote_action, vote_confidence, vote_reasoning,
+        ticker, initial_price, initial_timestamp, status, created_at
+    ) VALUES (
+        :session_id, :agent_name, :vote_action, :vote_confidence, :vote_reasoning,
+        :ticker, :initial_price, :initial_timestamp, 'PENDING', NOW()
+    )
+""")
+
+
 async def save_initial_price_tracking(
     session_id: int,
     ticker: str,
@@ -305,91 +555,71 @@ async def save_initial_price_tracking(
         debate_transcript: List of agent votes with reasoning
         db: Database session
     """
-    import os
-    from backend.brokers.kis_broker import KISBroker
-    import yfinance as yf
-
     try:
         # Get current price from KIS (Primary) or Yahoo Finance (Fallback)
-        account_no = os.environ.get("KIS_ACCOUNT_NUMBER", "")
-        is_virtual = os.environ.get("KIS_IS_VIRTUAL", "true").lower() == "true"
-        current_price = None
-
-        # Try KIS first
-        if account_no:
-            try:
-                broker = KISBroker(account_no=account_no, is_virtual=is_virtual)
-                price_data = broker.get_price(ticker, exchange="NASDAQ")
-                if price_data:
-                    current_price = price_data["current_price"]
-                    logger.info(f"📊 Price from KIS: {ticker} @ ${current_price:.2f}")
-            except Exception as e:
-                logger.warning(f"KIS price fetch failed: {e}")
-
-        # Fallback to Yahoo Finance
-        if current_price is None:
-            try:
-                stock = yf.Ticker(ticker)
-                hist = stock.history(period="1d")
-                if not hist.empty:
-                    current_price = float(hist['Close'].iloc[-1])
-                    logger.info(f"📊 Price from Yahoo Finance (fallback): {ticker} @ ${current_price:.2f}")
-                else:
-                    logger.warning(f"Yahoo Finance returned empty data for {ticker}")
-            except Exception as e:
-                logger.warning(f"Yahoo Finance price fetch failed: {e}")
+        current_price = await get_cached_price(ticker)
 
         # Skip if no price available
         if current_price is None:
             logger.warning(f"Failed to get price for {ticker} - skipping price tracking")
             return
 
-        # Save consensus to price_tracking table
-        from sqlalchemy import text
-
-        insert_sql = text("""
-            INSERT INTO price_tracking (
-                session_id, ticker, initial_price, initial_timestamp,
-                consensus_action, consensus_confidence, status, created_at
-            ) VALUES (
-                :session_id, :ticker, :initial_price, :initial_timestamp,
-                :consensus_action, :consensus_confidence, 'PENDING', NOW()
-            )
-        """)
+        # 합의 행과 에이전트 투표 행이 같은 기준 시각을 공유 (24h 평가 시 동일 시점)
+        initial_timestamp = datetime.now()
 
-        db.execute(insert_sql, {
+        # Save consensus to price_tracking table
+        # 동기 SQLAlchemy 호출은 스레드에서 실행 (이벤트 루프 블로킹 방지)
+        await asyncio.to_thread(db.execute, _PRICE_TRACKING_INSERT_SQL, {
             "session_id": session_id,
             "ticker": ticker,
             "initial_price": current_price,
-            "initial_timestamp": datetime.now(),
+            "initial_timestamp": initial_timestamp,
             "consensus_action": consensus_action,
             "consensus_confidence": consensus_confidence
         })
-        db.commit()
-
-        logger.info(f"💾 Price tracking saved: {ticker} @ ${current_price:.2f} (Session #{session_id})")
 
-        # 🆕 Phase 25.3: Save individual agent votes
+        # 🆕 Phase 25.3: Save individual agent votes (같은 트랜잭션 → 커밋 1회)
         await save_agent_votes_tracking(
             session_id=session_id,
             ticker=ticker,
             debate_transcript=debate_transcript,
             current_price=current_price,
-            db=db
+            db=db,
+            commit=False,
+            initial_timestamp=initial_timestamp
         )
+        await asyncio.to_thread(db.commit)
+
+        logger.info(f"💾 Price tracking saved: {ticker} @ ${current_price:.2f} (Session #{session_id})")
 
     except Exception as e:
+        await asyncio.to_thread(db.rollback)
         logger.error(f"Failed to save price tracking: {e}", exc_info=True)
         # Don't fail the whole debate if price tracking fails
         pass
 
 
+async def save_price_tracking_in_new_session(**kwargs) -> None:
+    """
+    save_initial_price_tracking을 전용 DB 세션으로 실행
+
+    동기 Session은 스레드 간 공유할 수 없으므로, 주문 실행과 동시에 돌릴 때 사용.
+    """
+    db = get_sync_session()
+    try:
+        await save_initial_price_tracking(db=db, **kwargs)
+    finally:
+        db.close()
+
+
 async def save_agent_votes_tracking(
     session_id: int,
     ticker: str,
     debate_transcript: List[Dict[str, Any]],
     current_price: float,
-    db: Any
+    db: Any,
+    commit: bool = True,
+    initial_timestamp: Optional[datetime] = None
 ) -> None:
     """
     Save individual agent votes for 24-hour tracking
@@ -402,47 +632,42 @@ async def save_agent_votes_tracking(
         debate_transcript: List of agent votes with reasoning
         current_price: Current stock price
         db: Database session
+        commit: False면 커밋/예외 처리를 호출자 트랜잭션에 맡김
+        initial_timestamp: 기준 시각 (None이면 지금, 모든 행 공통)
     """
-    from sqlalchemy import text
-
     try:
         logger.info(f"💾 Saving {len(debate_transcript)} agent votes for tracking...")
 
-        for vote in debate_transcript:
-            agent_name = vote.get("agent")
-            vote_action = vote.get("action")
-            vote_confidence = vote.get("confidence", 0.5)
-            vote_reasoning = vote.get("reasoning", "")
-
-            # Skip PM agent (consensus is tracked separately in price_tracking)
-            if agent_name == "pm":
-                continue
+        if initial_timestamp is None:
+            initial_timestamp = datetime.now()
 
-            insert_sql = text("""
-                INSERT INTO agent_vote_tracking (
-                    session_id, agent_name, vote_action, vote_confidence, vote_reasoning,
-                    ticker, initial_price, initial_timestamp, status, created_at
-                ) VALUES (
-                    :session_id, :agent_name, :vote_action, :vote_confidence, :vote_reasoning,
-                    :ticker, :initial_price, :initial_timestamp, 'PENDING', NOW()
-                )
-            """)
-
-            db.execute(insert_sql, {
+        # Skip PM agent (consensus is tracked separately in price_tracking)
+        params_list = [
+            {
                 "session_id": session_id,
-                "agent_name": agent_name,
-                "vote_action": vote_action,
-                "vote_confidence": vote_confidence,
-                "vote_reasoning": vote_reasoning,
+                "agent_name": vote.get("agent"),
+                "vote_action": vote.get("action"),
+                "vote_confidence": vote.get("confidence", 0.5),
+                "vote_reasoning": vote.get("reasoning", ""),
                 "ticker": ticker,
                 "initial_price": current_price,
-                "initial_timestamp": datetime.now()
-            })
+                "initial_timestamp": initial_timestamp
+            }
+            for vote in debate_transcript
+            if vote.get("agent") != "pm"
+        ]
+
+        if params_list:
+            # 파라미터 리스트 → executemany (투표당 왕복 대신 1회 실행)
+            await asyncio.to_thread(db.execute, _AGENT_VOTE_TRACKING_INSERT_SQL, params_list)
 
-        db.commit()
-        logger.info(f"✅ Saved {len(debate_transcript) - 1} agent votes (excluding PM)")
+        if commit:
+            await asyncio.to_thread(db.commit)
+        logger.info(f"✅ Saved {len(params_list)} agent votes (excluding PM)")
 
     except Exception as e:
+        if not commit:
+            raise
         logger.error(f"Failed to save agent votes tracking: {e}", exc_info=True)
         # Don't fail the whole debate if tracking fails
         pass
@@ -474,40 +699,27 @@ async def execute_kis_order(
     Returns:
         Order result dictionary or None
     """
-    import os
-    from backend.brokers.kis_broker import KISBroker
-    from backend.database.models import Order
-
     # HOLD는 주문 실행하지 않음
     if action == "HOLD":
         logger.info(f"⏸️ HOLD action - No order execution for {ticker}")
         return None
 
     try:
-        # 1. Initialize KIS Broker
-        account_no = os.environ.get("KIS_ACCOUNT_NUMBER", "")
-        is_virtual = os.environ.get("KIS_IS_VIRTUAL", "true").lower() == "true"
-
-        if not account_no:
+        # 1. Shared KIS Broker
+        broker = get_kis_broker()
+        if broker is None:
             logger.error("KIS_ACCOUNT_NUMBER not set in environment")
             return None
 
-        broker = KISBroker(
-            account_no=account_no,
-            is_virtual=is_virtual
-        )
-
-        # 2. Get current price
-        price_data = broker.get_price(ticker, exchange="NASDAQ")
-        if not price_data:
+        # 2. Get current price (KIS only, 항상 새로 조회 - 최대 60초 지난 캐시 가격으로 수량 계산 방지)
+        current_price = await _fetch_price("KIS", ticker)
+        if current_price is None:
             logger.error(f"Failed to get price for {ticker}")
             return None
 
-        current_price = price_data["current_price"]
-
         # 3. Calculate order quantity
         # Risk management: Max 5% of portfolio per position
-        balance = broker.get_account_balance()
+        balance = await _kis_call(broker.get_account_balance)
         if not balance:
             logger.error("Failed to get account balance")
             return None
@@ -523,12 +735,12 @@ async def execute_kis_order(
             logger.warning(f"Calculated quantity too small: {quantity}")
             return None
 
-        # 4. Execute order
+        # 4. Execute order (blocking 브로커 호출은 스레드에서 → 다른 티커 주문과 겹쳐 실행)
         logger.info(f"📋 Order: {action} {quantity} shares of {ticker} @ ${current_price:.2f}")
 
         order_result = None
         if action == "BUY":
-            order_result = broker.buy_market_order(ticker, quantity)
+            order_result = await _kis_call(broker.buy_market_order, ticker, quantity)
         elif action == "SELL":
             # Check if we have position
             positions = balance.get("positions", [])
@@ -538,7 +750,7 @@ async def execute_kis_order(
                 logger.warning(f"Insufficient {ticker} position for SELL")
                 return None
 
-            order_result = broker.sell_market_order(ticker, quantity)
+            order_result = await _kis_call(broker.sell_market_order, ticker, quantity)
 
         if not order_result:
             logger.error(f"Order execution failed for {ticker}")
@@ -557,14 +769,13 @@ async def execute_kis_order(
             broker="KIS",
             order_id=order_id,
             signal_id=signal_id,
-            created_at=datetime.now()
+            created_at=func.now()  # DB 서버 시각 (INSERT 시 NOW())
         )
 
         db.add(order)
-        db.commit()
-        db.refresh(order)
+        order_pk = await asyncio.to_thread(_insert_and_commit, db, order)
 
-        logger.info(f"✅ Order saved to DB: {order.id}")
+        logger.info(f"✅ Order saved to DB: {order_pk}")
 
         return {
             "order_id": order_id,
@@ -580,18 +791,92 @@ async def execute_kis_order(
         return None
 
 
+def _insert_and_commit(db: Any, row: Any) -> int:
+    """
+    ORM 행 INSERT + COMMIT (blocking, asyncio.to_thread로 호출)
+
+    flush 시점의 INSERT로 PK를 받아 두므로 commit 후 refresh(SELECT) 왕복이 필요 없다.
+    """
+    db.flush()
+    row_pk = row.id
+    db.commit()
+    return row_pk
+
+
+def _save_debate_records(db: Any, session: Any, signal: Optional[Any]) -> tuple:
+    """
+    AIDebateSession (+ TradingSignal) 저장 (blocking, asyncio.to_thread로 호출)
+
+    두 INSERT를 한 번의 flush로 보내 PK를 받고 커밋은 한 번만 한다.
+
+    Returns:
+        (session_id, signal_id 또는 None)
+    """
+    db.add(session)
+    if signal is not None:
+        db.add(signal)
+    db.flush()
+    ids = (session.id, signal.id if signal is not None else None)
+    db.commit()
+    return ids
+
+
+# ============================================================================
+# Debate Response Cache (데이터 축적 모드 전용)
+# ============================================================================
+
+_DEBATE_CACHE_TTL_SECONDS = 30.0
+_DEBATE_CACHE_MAX_ENTRIES = 512
+_debate_cache: Dict[str, tuple] = {}  # ticker → (DebateResponse, expires_at)
+_debate_locks: Dict[str, list] = {}  # ticker → [진행 중 토론 락, 사용 중인 요청 수] (0이 되면 제거)
+
+
+def _cached_debate(ticker: str) -> Optional[DebateResponse]:
+    """TTL 내 같은 티커 토론 결과 (없거나 만료 시 None)"""
+    cached = _debate_cache.get(ticker)
+    if cached is not None and cached[1] > time.monotonic():
+        return cached[0]
+    return None
+
+
+# 같은 (에러 타입, 티커)의 전체 스택은 창마다 1번만 로그 (장애 시 로그 폭주 방지)
+_ERROR_STACK_SAMPLE_SECONDS = 60.0
+_ERROR_STACK_SAMPLE_MAX_ENTRIES = 256
+_error_stack_seen: Dict[tuple, tuple] = {}  # (error type, ticker) → ([반복 횟수], expires_at)
+
+
+def _sample_error_stack(key: tuple) -> int:
+    """
+    에러 스택 로그 샘플링
+
+    Returns:
+        0이면 전체 스택 기록, 그 외에는 창 내 반복 횟수 (스택 생략)
+    """
+    seen = _error_stack_seen.get(key)
+    if seen is not None and seen[1] > time.monotonic():
+        seen[0][0] += 1
+        return seen[0][0]
+    _store_with_ttl(_error_stack_seen, key, [0], _ERROR_STACK_SAMPLE_SECONDS, _ERROR_STACK_SAMPLE_MAX_ENTRIES)
+    return 0
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
 
 @router.post("/debate", response_model=DebateResponse)
-async def run_war_room_debate(request: DebateRequest, execute_trade: bool = False):
+async def run_war_room_debate(
+    request: DebateRequest,
+    execute_trade: bool = False,
+    background_tasks: BackgroundTasks = None
+):
     """
     War Room 토론 실행 (7 agents)
 
     Args:
         request: DebateRequest with ticker
         execute_trade: If True, execute KIS order after constitutional validation
+        background_tasks: FastAPI 주입 (실행 로그를 응답 전송 후 기록, 직접 호출 시 None → 즉시 기록)
 
     Response:
         {
@@ -605,10 +890,48 @@ async def run_war_room_debate(request: DebateRequest, execute_trade: bool = Fals
             "signal_id": int or null,
             "order_id": str or null  # 🆕 REAL MODE
         }
+
+    execute_trade=False면 같은 티커의 30초 내 결과를 재사용하고,
+    동시에 들어온 같은 티커 요청은 진행 중인 토론 1회를 기다려 공유한다.
     """
+    # 실거래 요청은 항상 새 토론 + 주문 (캐시된 결과로 주문을 건너뛰지 않음)
+    if execute_trade:
+        return await _run_war_room_debate(request, execute_trade=True, background_tasks=background_tasks)
+
+    ticker = request.ticker.upper()
+    response = _cached_debate(ticker)
+    if response is not None:
+        logger.info(f"♻️ War Room debate cache hit for {ticker}")
+        return response
+
+    entry = _debate_locks.get(ticker)
+    if entry is None:
+        entry = _debate_locks[ticker] = [asyncio.Lock(), 0]
+    entry[1] += 1
+    try:
+        async with entry[0]:
+            # 락 대기 중 앞선 요청이 결과를 채웠을 수 있음
+            response = _cached_debate(ticker)
+            if response is None:
+                response = await _run_war_room_debate(request, execute_trade=False, background_tasks=background_tasks)
+                _store_with_ttl(_debate_cache, ticker, response, _DEBATE_CACHE_TTL_SECONDS, _DEBATE_CACHE_MAX_ENTRIES)
+            return response
+    finally:
+        # 기다리는 요청이 없으면 락 제거 (클라이언트가 보낸 티커마다 락이 쌓이지 않도록)
+        entry[1] -= 1
+        if entry[1] == 0:
+            del _debate_locks[ticker]
+
+
+async def _run_war_room_debate(
+    request: DebateRequest,
+    execute_trade: bool,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> DebateResponse:
+    """War Room 토론 실행 본체 (캐시 없음)"""
+    # 요청 시각 1회 캡처 → task_id/debate_id/duration 모두 같은 기준
     start_time = datetime.now()
     ticker = request.ticker.upper()
-    task_id = f"war-room-{ticker}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
 
     logger.info(f"🏛️ War Room debate requested for {ticker} (execute_trade={execute_trade})")
 
@@ -616,8 +939,23 @@ async def run_war_room_debate(request: DebateRequest, execute_trade: bool = Fals
     engine = get_war_room_engine()
     votes, pm_decision = await engine.run_debate(ticker)
 
+    return await _save_debate(ticker, votes, pm_decision, execute_trade, start_time, background_tasks)
+
+
+async def _save_debate(
+    ticker: str,
+    votes: List[Dict[str, Any]],
+    pm_decision: Dict[str, Any],
+    execute_trade: bool,
+    start_time: datetime,
+    background_tasks: Optional[BackgroundTasks] = None
+) -> DebateResponse:
+    """토론 결과 → Constitutional 검증, 세션/시그널/추적 저장, (execute_trade면) 주문 → DebateResponse"""
+    start_stamp = start_time.strftime('%Y%m%d-%H%M%S')
+    task_id = f"war-room-{ticker}-{start_stamp}"
+
     # 2. Constitutional 검증
-    constitution = Constitution()
+    constitution = get_constitution()
 
     # 제안서 생성
     proposal = {
@@ -652,9 +990,12 @@ async def run_war_room_debate(request: DebateRequest, execute_trade: bool = Fals
     db = get_sync_session()
 
     try:
+        # 에이전트 투표 검증을 저장/주문보다 먼저 → 잘못된 투표는 커밋·주문 없이 실패 처리
+        vote_models = [AgentVote(**v) for v in votes]
+
         # AIDebateSession에 저장
         # Generate unique debate_id
-        debate_id = f"debate-{ticker}-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        debate_id = f"debate-{ticker}-{start_stamp}"
         
         session = AIDebateSession(
             ticker=ticker,
@@ -663,28 +1004,13 @@ async def run_war_room_debate(request: DebateRequest, execute_trade: bool = Fals
             consensus_action=pm_decision["consensus_action"],  # PM output matches DB column
             consensus_confidence=pm_decision["consensus_confidence"],
             constitutional_valid=is_valid,  # Constitutional 검증 결과 저장
-            created_at=datetime.now(),
-            completed_at=datetime.now()
-        )
-
-        db.add(session)
-        db.commit()
-        db.refresh(session)
-
-        logger.info(f"💾 War Room session saved: ID {session.id}")
-
-        # 3. 🆕 Phase 25.1 + 25.3: Save initial price + agent votes for 24h tracking
-        await save_initial_price_tracking(
-            session_id=session.id,
-            ticker=ticker,
-            consensus_action=pm_decision["consensus_action"],
-            consensus_confidence=pm_decision["consensus_confidence"],
-            debate_transcript=votes,  # 🆕 Phase 25.3: Include agent votes
-            db=db
+            # 타임스탬프는 DB 서버 NOW() (세션/시그널이 같은 트랜잭션 → 같은 시각, 앱 서버 간 시계 차이 없음)
+            created_at=func.now(),
+            completed_at=func.now()
         )
 
         # 4. Signal 생성 (confidence >= 0.7)
-        signal_id = None
+        signal = None
         order_id = None
 
         if pm_decision["consensus_confidence"] >= 0.7:
@@ -696,38 +1022,61 @@ async def run_war_room_debate(request: DebateRequest, execute_trade: bool = Fals
                 confidence=pm_decision["consensus_confidence"],
                 reasoning=pm_decision.get("summary", "War Room 합의"),
                 source="war_room",  # 🆕 출처 표시
-                generated_at=datetime.now()
+                generated_at=func.now()
             )
-            db.add(signal)
-            db.commit()
-            db.refresh(signal)
 
-            signal_id = signal.id
+        # 세션 + 시그널을 한 트랜잭션으로 저장 (커밋 1회)
+        # 동기 Session I/O는 스레드에서 실행 (토론 저장 중에도 이벤트 루프는 다른 요청 처리)
+        session_id, signal_id = await asyncio.to_thread(_save_debate_records, db, session, signal)
+
+        logger.info(f"💾 War Room session saved: ID {session_id}")
+        if signal_id is not None:
             logger.info(f"📊 Trading signal created: ID {signal_id}")
 
-            # 4. 🆕 REAL MODE: Execute KIS Order
-            if execute_trade and is_valid:
-                logger.info(f"💼 Executing trade for {ticker}: {pm_decision['consensus_action']}")
-                order_result = await execute_kis_order(
-                    ticker=ticker,
-                    action=pm_decision["consensus_action"],
-                    confidence=pm_decision["consensus_confidence"],
-                    signal_id=signal_id,
-                    session_id=session.id,
-                    db=db
-                )
-
-                if order_result and "order_id" in order_result:
-                    order_id = order_result["order_id"]
-                    logger.info(f"✅ Order executed: {order_id}")
-                else:
-                    logger.warning(f"⚠️ Order execution failed or skipped")
+        # 3. 🆕 Phase 25.1 + 25.3: Save initial price + agent votes for 24h tracking
+        # 4. 🆕 REAL MODE: Execute KIS Order
+        # 서로 독립적인 I/O → 동시 실행 (가격 조회는 캐시로 공유, 추적은 별도 DB 세션)
+        io_tasks = [
+            save_price_tracking_in_new_session(
+                session_id=session_id,
+                ticker=ticker,
+                consensus_action=pm_decision["consensus_action"],
+                consensus_confidence=pm_decision["consensus_confidence"],
+                debate_transcript=votes  # 🆕 Phase 25.3: Include agent votes
+            )
+        ]
+
+        place_order = signal_id is not None and execute_trade and is_valid
+        if place_order:
+            logger.info(f"💼 Executing trade for {ticker}: {pm_decision['consensus_action']}")
+            io_tasks.append(execute_kis_order(
+                ticker=ticker,
+                action=pm_decision["consensus_action"],
+                confidence=pm_decision["consensus_confidence"],
+                signal_id=signal_id,
+                session_id=session_id,
+                db=db
+            ))
+
+        # return_exceptions=True: 추적 실패가 주문 결과를 버리지 않음 (역도 마찬가지)
+        tracking_result, *order_results = await asyncio.gather(*io_tasks, return_exceptions=True)
+
+        if isinstance(tracking_result, Exception):
+            logger.error(f"Failed to save price tracking: {tracking_result}")
+
+        if place_order:
+            order_result = order_results[0]
+            if isinstance(order_result, dict) and "order_id" in order_result:
+                order_id = order_result["order_id"]
+                logger.info(f"✅ Order executed: {order_id}")
+            else:
+                logger.warning(f"⚠️ Order execution failed or skipped")
 
         # 5. Response 생성
         response = DebateResponse(
-            session_id=session.id,
+            session_id=session_id,
             ticker=ticker,
-            votes=[AgentVote(**v) for v in votes],
+            votes=vote_models,
             consensus={
                 "action": pm_decision["consensus_action"],
                 "confidence": pm_decision["consensus_confidence"],
@@ -739,12 +1088,14 @@ async def run_war_room_debate(request: DebateRequest, execute_trade: bool = Fals
         )
 
         # Log successful execution
-        agent_logger.log_execution(ExecutionLog(
-            timestamp=datetime.now(),
+        # ExecutionLog는 지금 생성 (timestamp/duration 확정), 기록 I/O만 응답 전송 후로 미룸
+        end_time = datetime.now()
+        execution_log = ExecutionLog(
+            timestamp=end_time,
             agent="war-room/war-room-debate",
             task_id=task_id,
             status=ExecutionStatus.SUCCESS,
-            duration_ms=int((datetime.now() - start_time).total_seconds() * 1000),
+            duration_ms=int((end_time - start_time).total_seconds() * 1000),
             input={
                 "ticker": ticker,
                 "execute_trade": execute_trade
@@ -756,14 +1107,25 @@ async def run_war_room_debate(request: DebateRequest, execute_trade: bool = Fals
                 "agent_votes": len(votes),
                 "constitutional_valid": is_valid  # Use local variable
             }
-        ))
+        )
+        if background_tasks is not None:
+            background_tasks.add_task(agent_logger.log_execution, execution_log)
+        else:
+            agent_logger.log_execution(execution_log)
 
         return response
 
     except Exception as e:
-        logger.error(f"❌ War Room debate failed: {e}", exc_info=True)
+        # 스택은 한 번만 포맷 → 로그와 ErrorLog가 같은 문자열 사용
+        stack = traceback.format_exc()
+        repeats = _sample_error_stack((type(e).__name__, ticker))
+        if repeats:
+            logger.error(f"❌ War Room debate failed: {e} (same error x{repeats} in {_ERROR_STACK_SAMPLE_SECONDS:g}s, stack omitted)")
+        else:
+            logger.error(f"❌ War Room debate failed: {e}\n{stack}")
         
         # Log error
+        # 에러 로그는 즉시 기록: HTTPException 응답에는 background_tasks가 붙지 않아 미루면 유실됨
         agent_logger.log_error(ErrorLog(
             timestamp=datetime.now(),
             agent="war-room/war-room-debate",
@@ -771,16 +1133,97 @@ async def run_war_room_debate(request: DebateRequest, execute_trade: bool = Fals
             error={
                 "type": type(e).__name__,
                 "message": str(e),
-                "stack": traceback.format_exc(),
+                "stack": stack,
                 "context": {"ticker": ticker, "execute_trade": execute_trade}
             },
             impact=ErrorImpact.CRITICAL,
             recovery_attempted=False
         ))
         
-        db.rollback()
+        await asyncio.to_thread(db.rollback)
         raise HTTPException(status_code=500, detail=f"Debate failed: {str(e)}")
 
+    finally:
+        await asyncio.to_thread(db.close)
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Server-Sent Events 메시지 1개 (data는 한 줄 JSON)"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+async def _save_streamed_debate(
+    ticker: str,
+    votes: List[Dict[str, Any]],
+    pm_decision: Dict[str, Any],
+    start_time: datetime
+) -> None:
+    """스트림 종료 후 토론 저장 (BackgroundTasks) - 실패는 _save_debate가 이미 로그/ErrorLog 기록"""
+    try:
+        await _save_debate(ticker, votes, pm_decision, execute_trade=False, start_time=start_time)
+    except HTTPException:
+        pass
+
+
+@router.post("/debate/stream")
+async def stream_war_room_debate(request: DebateRequest, background_tasks: BackgroundTasks):
+    """
+    War Room 토론 실행 (Server-Sent Events, 데이터 축적 모드)
+
+    에이전트 투표가 끝나는 대로 `vote` 이벤트를, 마지막에 PM 결과를 `consensus` 이벤트로 보낸다.
+    세션 저장은 스트림이 끝난 뒤 백그라운드에서 수행 (주문 없음).
+
+    Events:
+        event: vote       data: {"agent": ..., "action": ..., "confidence": ..., "reasoning": ...}
+        event: consensus  data: {"consensus_action": ..., "consensus_confidence": ..., ...}
+    """
+    start_time = datetime.now()
+    ticker = request.ticker.upper()
+    logger.info(f"🏛️ War Room debate stream requested for {ticker}")
+
+    engine = get_war_room_engine()
+
+    async def events():
+        async for event, data in engine.stream_debate(ticker):
+            if event == "consensus":
+                votes, pm_decision = data
+                # 응답 전송 완료 후 실행 (FastAPI가 같은 BackgroundTasks를 응답에 연결)
+                background_tasks.add_task(_save_streamed_debate, ticker, votes, pm_decision, start_time)
+                data = pm_decision
+            yield _sse_event(event, data)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _fetch_debate_sessions(ticker: Optional[str], limit: int) -> List[Any]:
+    """
+    세션 히스토리 조회 (blocking, asyncio.to_thread로 호출)
+
+    응답에 필요한 컬럼만 SELECT → ORM 인스턴스 대신 가벼운 Row 튜플 (s.id 등 속성 접근 동일)
+    """
+    stmt = select(
+        AIDebateSession.id,
+        AIDebateSession.ticker,
+        AIDebateSession.consensus_action,
+        AIDebateSession.consensus_confidence,
+        AIDebateSession.votes,
+        AIDebateSession.debate_transcript,
+        AIDebateSession.created_at,
+        AIDebateSession.duration_seconds
+    )
+
+    if ticker:
+        stmt = stmt.where(AIDebateSession.ticker == ticker.upper())
+
+    stmt = stmt.order_by(AIDebateSession.created_at.desc()).limit(limit)
+
+    db = get_sync_session()
+    try:
+        return db.execute(stmt).all()
     finally:
         db.close()
 
@@ -791,29 +1234,22 @@ async def get_debate_sessions(
     limit: int = 20
 ):
     """War Room 세션 히스토리 조회"""
-    db = get_sync_session()
-    
     try:
-        query = db.query(AIDebateSession)
-        
-        if ticker:
-            query = query.filter(AIDebateSession.ticker == ticker.upper())
-        
-        sessions = query.order_by(AIDebateSession.created_at.desc())\
-            .limit(limit)\
-            .all()
+        sessions = await asyncio.to_thread(_fetch_debate_sessions, ticker, limit)
         
         result = []
         for s in sessions:
-            # Parse debate_transcript to get full vote details with reasoning
-            votes_detail = []
-            if s.debate_transcript:
+            # debate_transcript: full vote details with reasoning
+            # JSONB는 드라이버가 이미 Python 객체로 디코딩 → 문자열(legacy)일 때만 파싱
+            votes_detail = s.debate_transcript
+            if isinstance(votes_detail, str):
                 try:
-                    votes_detail = json.loads(s.debate_transcript)
-                except:
+                    votes_detail = json.loads(votes_detail) if votes_detail else []
+                except ValueError:
                     votes_detail = []
+            elif not isinstance(votes_detail, list):
+                votes_detail = []
 
-            # Parse votes from JSONB (Handle both Dict and List formats)
             # Parse votes from JSONB (Handle both Dict and List formats)
             votes_data = {}
             raw_votes = s.votes
@@ -852,14 +1288,12 @@ async def get_debate_sessions(
     except Exception as e:
         logger.error(f"❌ Failed to get sessions: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    
-    finally:
-        db.close()
 
 
 @router.post("/debate-and-execute")
 async def debate_and_execute_trade(
     request: DebateRequest,
+    background_tasks: BackgroundTasks,
     dry_run: bool = True  # 기본값: 시뮬레이션
 ):
     """
@@ -875,25 +1309,28 @@ async def debate_and_execute_trade(
     ticker = request.ticker.upper()
 
     # Step 1: War Room 토론
+    # 실제 주문(dry_run=False)은 다른 요청이 캐시한 토론 결과를 쓰지 않고 항상 새로 토론
     logger.info(f"🎭 War Room 토론 + 실거래 실행: {ticker}")
-    debate_result = await run_war_room_debate(request)
+    if dry_run:
+        debate_result = await run_war_room_debate(request, background_tasks=background_tasks)
+    else:
+        debate_result = await _run_war_room_debate(request, execute_trade=False, background_tasks=background_tasks)
 
-    # Step 2: 실거래 실행
-    from backend.trading.war_room_executor import WarRoomExecutor
-
-    executor = WarRoomExecutor(kis_broker=None)  # DRY RUN용
+    # 토론 결과는 한 번만 직렬화 → 실행기 입력과 응답에 같은 dict 사용
+    debate = debate_result.model_dump()
 
-    execution_result = await executor.execute_war_room_decision(
+    # Step 2: 실거래 실행
+    execution_result = await get_war_room_executor().execute_war_room_decision(
         ticker=ticker,
-        consensus_action=debate_result.consensus["action"],
-        consensus_confidence=debate_result.consensus["confidence"],
-        votes=[v.dict() for v in debate_result.votes],
+        consensus_action=debate["consensus"]["action"],
+        consensus_confidence=debate["consensus"]["confidence"],
+        votes=debate["votes"],
         dry_run=dry_run
     )
 
     # Step 3: 결과 통합
     result = {
-        "debate": debate_result.dict(),
+        "debate": debate,
         "execution": execution_result
     }
 
@@ -909,8 +1346,8 @@ async def war_room_health():
         engine = get_war_room_engine()
         return {
             "status": "healthy",
-            "agents_loaded": 8,  # Phase 24: ChipWarAgent added
-            "agents": ["trader", "risk", "analyst", "macro", "institutional", "news", "chip_war", "pm"],
+            "agents_loaded": len(engine.agent_names),
+            "agents": list(engine.agent_names),
             "timestamp": datetime.now().isoformat()
         }
     except Exception as e: